@@ -0,0 +1,253 @@
+"""
+Rebuild benchmark on synthetic drop tables
+
+Generates a page per scale (see benchmarks.droptable_generator) and times
+every rebuild step on it: parsing, validation, indexing, saving and loading
+the indexes. Each scale runs in a fresh interpreter, so peak memory and warm
+caches don't carry over from one scale to the next. Peak memory is the
+benchmark process's, parse worker processes (PARSE_WORKERS > 1) aren't in it.
+
+Usage:
+    python -m benchmarks.bench_rebuild --scales 1,10,100 --json results.json
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Scales run by default, 100x takes several minutes and a few GB of memory
+DEFAULT_SCALES = "1,10"
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident memory of this process so far"""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_steps(html_file: Path, work_dir: Path, workers: int | None) -> list[dict]:
+    """Time every rebuild step on one page, in this process"""
+    from orchestrator import SECTION_IDS, SECTION_PARSERS, DropOrchestrator
+    from parsers.drop_records import expand_drops
+    from search_engine import WarframeSearchEngine
+
+    results = []
+
+    def measure(step: str, func, rows: int | None = None, size=None):
+        start = time.perf_counter()
+        value = func()
+        seconds = time.perf_counter() - start
+
+        rows = rows(value) if callable(rows) else rows
+        size = size() if callable(size) else size
+
+        results.append(
+            {
+                "step": step,
+                "seconds": seconds,
+                "rows": rows,
+                "rows_per_second": rows / seconds if rows and seconds else None,
+                "mb": size / (1024 * 1024) if size else None,
+                "mb_per_second": (
+                    size / (1024 * 1024) / seconds if size and seconds else None
+                ),
+                "peak_rss_mb": peak_rss_mb(),
+            }
+        )
+        return value
+
+    index_file = work_dir / "search_indexes.json"
+    page_size = html_file.stat().st_size
+
+    orchestrator = DropOrchestrator(html_file=html_file, workers=workers)
+    measure(
+        "parse_all",
+        orchestrator.parse_all,
+        rows=lambda _: orchestrator.drop_counts["total_drops"],
+        size=page_size,
+    )
+    total_drops = orchestrator.drop_counts["total_drops"]
+
+    # Parsers validate their drops inside parse_all, timed again on its own.
+    # Relics are validated as table rows, before they are folded
+    table_rows = {
+        report_key: list(expand_drops(drops))
+        for report_key, drops in orchestrator.drops.items()
+    }
+
+    def verify_all():
+        for report_key, drops in table_rows.items():
+            parser_class = SECTION_PARSERS[SECTION_IDS[report_key]][2]
+            parser_class(None).verify_data(drops)
+
+    measure(
+        "verify_data", verify_all, rows=sum(len(rows) for rows in table_rows.values())
+    )
+
+    measure(
+        "get_validation_report", orchestrator.get_validation_report, rows=total_drops
+    )
+
+    search_engine = WarframeSearchEngine()
+    measure(
+        "create_indexes_from_drops",
+        lambda: search_engine.create_indexes_from_drops(
+            orchestrator.all_drops, orchestrator.source_hash
+        ),
+        rows=total_drops,
+    )
+
+    measure(
+        "save_indexes",
+        lambda: search_engine.save_indexes(index_file),
+        rows=total_drops,
+        size=lambda: index_file.stat().st_size,
+    )
+
+    measure(
+        "load_indexes",
+        lambda: WarframeSearchEngine().load_indexes(index_file),
+        rows=total_drops,
+        size=index_file.stat().st_size,
+    )
+
+    return results
+
+
+def run_scale(
+    scale: float, seed: int, workers: int | None, work_dir: Path
+) -> list[dict]:
+    """Generate the page for a scale and benchmark it in a child process"""
+    from benchmarks.droptable_generator import write_droptables
+
+    html_file = work_dir / f"droptables_{scale:g}x.html"
+    write_droptables(html_file, scale, seed)
+
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.bench_rebuild",
+        "--run",
+        str(html_file),
+        "--work-dir",
+        str(work_dir),
+    ]
+    if workers is not None:
+        command += ["--workers", str(workers)]
+
+    output = subprocess.run(
+        command,
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    # The parsers may print warnings, the results are the last line
+    results = json.loads(output.strip().splitlines()[-1])
+    for result in results:
+        result["scale"] = scale
+
+    return results
+
+
+def format_results(results: list[dict]) -> str:
+    lines = [
+        f"{'Scale':>6}  {'Step':<26} {'Time (s)':>9} {'Rows/s':>11} "
+        f"{'MB':>8} {'MB/s':>7} {'Peak RSS (MB)':>14}"
+    ]
+
+    def number(value, spec):
+        return format(value, spec) if value is not None else "-"
+
+    for result in results:
+        lines.append(
+            f"{result['scale']:>5g}x  {result['step']:<26} "
+            f"{result['seconds']:>9.3f} "
+            f"{number(result['rows_per_second'], ',.0f'):>11} "
+            f"{number(result['mb'], '.1f'):>8} "
+            f"{number(result['mb_per_second'], '.1f'):>7} "
+            f"{number(result['peak_rss_mb'], '.0f'):>14}"
+        )
+
+    return "\n".join(lines)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Warframe Buddy rebuild benchmark")
+    parser.add_argument(
+        "--scales",
+        default=DEFAULT_SCALES,
+        help=f"Page sizes relative to the live page (default: {DEFAULT_SCALES})",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Parse worker processes (default: PARSE_WORKERS)",
+    )
+    parser.add_argument("--json", help="Also write the results to this file")
+    parser.add_argument(
+        "--keep",
+        help="Keep the generated pages and indexes in this directory",
+    )
+    # Internal: benchmark one page in this process and print the results
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.run:
+        results = run_steps(Path(args.run), Path(args.work_dir), args.workers)
+        print(json.dumps(results))
+        return
+
+    try:
+        scales = [float(scale) for scale in args.scales.split(",") if scale.strip()]
+    except ValueError:
+        parser.error(f"invalid --scales {args.scales!r} (e.g. 1,10,100)")
+
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="warframe-bench-") as tmp_dir:
+        work_dir = Path(args.keep or tmp_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        for scale in scales:
+            print(f"Benchmarking {scale:g}x...", flush=True)
+
+            try:
+                results += run_scale(scale, args.seed, args.workers, work_dir)
+            except subprocess.CalledProcessError as e:
+                print(f"✗ Benchmark at {scale:g}x failed:\n{e.stderr}")
+                sys.exit(1)
+
+    print()
+    print(format_results(results))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {"seed": args.seed, "workers": args.workers, "results": results},
+                f,
+                indent=2,
+            )
+        print(f'\n✓ Saved results to "{args.json}"')
+
+
+if __name__ == "__main__":
+    main()
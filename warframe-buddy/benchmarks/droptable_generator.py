@@ -0,0 +1,468 @@
+"""
+Synthetic drop-table page for benchmarks
+
+Writes HTML with the same <h3> ids, headers and row shapes as the official
+page (FETCH_URL), scaled relative to the size of the live page. The chances
+of every reward table add up to 100%, so the page validates cleanly.
+
+Usage:
+    python -m benchmarks.droptable_generator --scale 10 -o data/bench.html
+"""
+
+import random
+from pathlib import Path
+from typing import Iterator
+
+# Tables at scale 1, roughly what the live page has
+MISSION_NODES = 700
+RELICS = 800
+KEYS = 40
+TRANSIENT_LOCATIONS = 60
+SORTIE_REWARDS = 30
+BOUNTY_TIERS = 7
+ENEMIES = 900
+MODS = 600
+
+PLANETS = [
+    "Mercury",
+    "Venus",
+    "Earth",
+    "Lua",
+    "Mars",
+    "Phobos",
+    "Deimos",
+    "Ceres",
+    "Jupiter",
+    "Europa",
+    "Saturn",
+    "Uranus",
+    "Neptune",
+    "Pluto",
+    "Sedna",
+    "Eris",
+    "Void",
+    "Kuva Fortress",
+    "Zariman",
+    "Höllvania",
+]
+
+MISSION_TYPES = [
+    "Survival",
+    "Defense",
+    "Exterminate",
+    "Capture",
+    "Spy",
+    "Rescue",
+    "Sabotage",
+    "Mobile Defense",
+    "Interception",
+    "Excavation",
+    "Disruption",
+    "Defection",
+    "Assassination",
+]
+
+SYLLABLES = ["ka", "lo", "ra", "mi", "to", "sa", "ne", "vu", "dor", "an", "is", "el"]
+
+WEAPONS = [
+    "Braton",
+    "Lex",
+    "Boltor",
+    "Paris",
+    "Soma",
+    "Nikana",
+    "Galatine",
+    "Akstiletto",
+    "Tigris",
+    "Orthos",
+    "Fang",
+    "Burston",
+    "Vectis",
+    "Kronen",
+    "Zhuge",
+    "Pangolin",
+]
+WEAPON_PARTS = ["Blueprint", "Barrel", "Receiver", "Stock", "Blade", "Handle"]
+
+WARFRAMES = [
+    "Ash",
+    "Banshee",
+    "Ember",
+    "Frost",
+    "Loki",
+    "Mag",
+    "Nova",
+    "Rhino",
+    "Saryn",
+    "Trinity",
+    "Vauban",
+    "Volt",
+    "Nekros",
+    "Oberon",
+]
+WARFRAME_PARTS = [
+    "Blueprint",
+    "Neuroptics Blueprint",
+    "Chassis Blueprint",
+    "Systems Blueprint",
+]
+
+MOD_NAMES = [
+    "Serration",
+    "Split Chamber",
+    "Vitality",
+    "Redirection",
+    "Streamline",
+    "Intensify",
+    "Point Strike",
+    "Hornet Strike",
+    "Pressure Point",
+    "Blind Rage",
+    "Overextended",
+    "Narrow Minded",
+]
+
+RESOURCES = [
+    "Forma Blueprint",
+    "Endo",
+    "Orokin Cell",
+    "Argon Crystal",
+    "Neural Sensors",
+    "Tellurium",
+    "Ayatan Anasa Sculpture",
+    "Riven Sliver",
+    "Exilus Weapon Adapter Blueprint",
+]
+
+RELIC_TIERS = ["Lith", "Meso", "Neo", "Axi"]
+
+# Chances of the 6 relic rewards per refinement, as on the live page
+RELIC_REFINEMENTS = {
+    "Intact": [
+        ("Common", 25.33),
+        ("Common", 25.33),
+        ("Common", 25.34),
+        ("Uncommon", 11.00),
+        ("Uncommon", 11.00),
+        ("Rare", 2.00),
+    ],
+    "Exceptional": [
+        ("Common", 23.33),
+        ("Common", 23.33),
+        ("Common", 23.34),
+        ("Uncommon", 13.00),
+        ("Uncommon", 13.00),
+        ("Rare", 4.00),
+    ],
+    "Flawless": [
+        ("Common", 20.00),
+        ("Common", 20.00),
+        ("Common", 20.00),
+        ("Uncommon", 17.00),
+        ("Uncommon", 17.00),
+        ("Rare", 6.00),
+    ],
+    "Radiant": [
+        ("Common", 16.67),
+        ("Common", 16.67),
+        ("Common", 16.66),
+        ("Uncommon", 20.00),
+        ("Uncommon", 20.00),
+        ("Rare", 10.00),
+    ],
+}
+
+BOUNTY_SECTIONS = [
+    ("cetusRewards", "Cetus Bounty Rewards", "Cetus Bounty", True),
+    ("solarisRewards", "Orb Vallis Bounty Rewards", "Orb Vallis Bounty", True),
+    ("deimosRewards", "Cambion Drift Bounty Rewards", "Cambion Drift Bounty", True),
+    ("zarimanRewards", "Zariman Bounty Rewards", "Zariman Bounty", False),
+    (
+        "entratiLabRewards",
+        "Albrecht's Laboratories Bounty Rewards",
+        "Albrecht's Laboratories Bounty",
+        True,
+    ),
+    ("hexRewards", "Hex Bounty Rewards", "Höllvania Bounty", False),
+]
+
+# Sections the parsers skip, they still make up most of the page
+BY_SOURCE_SECTIONS = [
+    ("modByAvatar", "Mod Drops by Source"),
+    ("blueprintByAvatar", "Blueprint/Part Drops by Source"),
+    ("resourceByAvatar", "Resource Drops by Source"),
+    ("sigilByAvatar", "Sigil Drops by Source"),
+    ("additionalItemByAvatar", "Additional Item Drops by Source"),
+]
+BY_ITEM_SECTIONS = [
+    ("modByDrop", "Mod Drops by Mod"),
+    ("blueprintByDrop", "Blueprint/Part Drops by Item"),
+]
+
+
+class DropTableGenerator:
+    """Generates the page section by section, from a fixed seed"""
+
+    def __init__(self, scale: float = 1, seed: int = 0):
+        self.scale = scale
+        self.random = random.Random(seed)
+
+        self.items = (
+            [f"{w} Prime {part}" for w in WEAPONS for part in WEAPON_PARTS]
+            + [f"{w} Prime {part}" for w in WARFRAMES for part in WARFRAME_PARTS]
+            + [f"{w} {part}" for w in WEAPONS for part in WEAPON_PARTS]
+            + MOD_NAMES
+            + RESOURCES
+            + [f"{amount:,} Credits Cache" for amount in (1000, 1500, 2000, 5000)]
+        )
+
+    def count(self, base: int) -> int:
+        return max(1, round(base * self.scale))
+
+    def generate(self) -> Iterator[str]:
+        yield (
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            "<title>Warframe PC Drops</title>\n</head>\n<body>\n"
+            "<h1>Warframe PC Drops</h1>\n"
+        )
+
+        yield from self.missions()
+        yield from self.relics()
+        yield from self.keys()
+        yield from self.transient()
+        yield from self.sorties()
+
+        for section_id, title, bounty, rotations in BOUNTY_SECTIONS:
+            yield from self.bounties(section_id, title, bounty, rotations)
+
+        for section_id, title in BY_SOURCE_SECTIONS:
+            yield from self.by_source(section_id, title)
+
+        for section_id, title in BY_ITEM_SECTIONS:
+            yield from self.by_item(section_id, title)
+
+        yield "</body>\n</html>\n"
+
+    # === Sections ===
+    def missions(self) -> Iterator[str]:
+        yield '<h3 id="missionRewards">Missions:</h3>\n<table>\n'
+
+        for n in range(self.count(MISSION_NODES)):
+            planet = self.random.choice(PLANETS)
+            node = self.name(n)
+            mission_type = self.random.choice(MISSION_TYPES)
+
+            kind = self.random.random()
+            if kind < 0.05:
+                header = f"Event: {planet}/{node} ({mission_type})"
+            elif kind < 0.08:
+                header = f"{planet}/{node} (Conclave)"
+            elif kind < 0.12:
+                header = f"{planet}/{node}: Caches ({mission_type})"
+            else:
+                header = f"{planet}/{node} ({mission_type})"
+            yield self.header_row(header)
+
+            rotations = ["A", "B", "C"] if self.random.random() < 0.6 else [None]
+            for rotation in rotations:
+                if rotation:
+                    yield self.header_row(f"Rotation {rotation}")
+                yield from self.drop_rows(self.random.randint(2, 10))
+
+            yield self.blank_row()
+
+        yield "</table>\n"
+
+    def relics(self) -> Iterator[str]:
+        yield '<h3 id="relicRewards">Relics:</h3>\n<table>\n'
+
+        for n in range(self.count(RELICS)):
+            tier = RELIC_TIERS[n % len(RELIC_TIERS)]
+            name = f"{chr(ord('A') + n // 4 % 26)}{n // 104 + 1}"
+            rewards = self.random.sample(self.items, 6)
+
+            for refinement, chances in RELIC_REFINEMENTS.items():
+                yield self.header_row(f"{tier} {name} Relic ({refinement})")
+                for item, (rarity, chance) in zip(rewards, chances):
+                    yield f"<tr><td>{item}</td><td>{rarity} ({chance:.2f}%)</td></tr>\n"
+                yield self.blank_row()
+
+        yield "</table>\n"
+
+    def keys(self) -> Iterator[str]:
+        yield '<h3 id="keyRewards">Keys:</h3>\n<table>\n'
+
+        for n in range(self.count(KEYS)):
+            yield self.header_row(f"{self.name(n)} Assassinate Key")
+            for rotation in ("A", "B", "C"):
+                yield self.header_row(f"Rotation {rotation}")
+                yield from self.drop_rows(self.random.randint(2, 5))
+            yield self.blank_row()
+
+        yield "</table>\n"
+
+    def transient(self) -> Iterator[str]:
+        yield ('<h3 id="transientRewards">Dynamic Location Rewards:</h3>\n<table>\n')
+
+        locations = self.count(TRANSIENT_LOCATIONS)
+        for n in range(locations):
+            yield self.header_row(f"{self.name(n)} Derelict Vault")
+
+            # The parser keeps the last rotation, so rotations only come last
+            if n < locations // 2:
+                yield from self.drop_rows(self.random.randint(2, 8))
+            else:
+                for rotation in ("A", "B", "C"):
+                    yield self.header_row(f"Rotation {rotation}")
+                    yield from self.drop_rows(self.random.randint(2, 8))
+
+            yield self.blank_row()
+
+        yield "</table>\n"
+
+    def sorties(self) -> Iterator[str]:
+        yield '<h3 id="sortieRewards">Sorties:</h3>\n<table>\n'
+        yield self.header_row("Sortie")
+        yield from self.drop_rows(self.count(SORTIE_REWARDS))
+        yield "</table>\n"
+
+    def bounties(
+        self, section_id: str, title: str, bounty: str, rotations: bool
+    ) -> Iterator[str]:
+        yield f'<h3 id="{section_id}">{title}:</h3>\n<table>\n'
+
+        for n in range(self.count(BOUNTY_TIERS)):
+            level = f"Level {5 + n * 10} - {15 + n * 10}"
+            yield self.header_row(f"{level} {bounty}", colspan=3)
+
+            for rotation in ("A", "B", "C") if rotations else (None,):
+                if rotation:
+                    yield self.header_row(f"Rotation {rotation}", colspan=3)
+
+                stages = self.random.randint(3, 5)
+                for stage in range(1, stages + 1):
+                    label = "Final Stage" if stage == stages else f"Stage {stage}"
+                    yield f'<tr><td></td><th colspan="2">{label}</th></tr>\n'
+                    yield from self.drop_rows(self.random.randint(3, 8), leading=1)
+
+            yield self.blank_row(colspan=3)
+
+        yield "</table>\n"
+
+    def by_source(self, section_id: str, title: str) -> Iterator[str]:
+        yield f'<h3 id="{section_id}">{title}:</h3>\n<table>\n'
+
+        for n in range(self.count(ENEMIES)):
+            drop_chance = self.random.uniform(1, 40)
+            yield (
+                f"<tr><th>{self.name(n)} Lancer</th>"
+                f'<th colspan="2">Item Drop Chance: {drop_chance:.2f}%</th></tr>\n'
+            )
+            yield from self.drop_rows(self.random.randint(1, 6), leading=1)
+            yield self.blank_row(colspan=3)
+
+        yield "</table>\n"
+
+    def by_item(self, section_id: str, title: str) -> Iterator[str]:
+        yield f'<h3 id="{section_id}">{title}:</h3>\n<table>\n'
+
+        for n in range(self.count(MODS)):
+            yield self.header_row(self.random.choice(self.items), colspan=3)
+            yield ("<tr><th>Source</th><th>Item Drop Chance</th><th>Chance</th></tr>\n")
+            for _ in range(self.random.randint(1, 8)):
+                yield (
+                    f"<tr><td>{self.name(self.random.randrange(ENEMIES))} Lancer</td>"
+                    f"<td>{self.random.uniform(1, 40):.2f}%</td>"
+                    f"<td>{self.chance_text(self.random.uniform(0.01, 20))}</td></tr>\n"
+                )
+            yield self.blank_row(colspan=3)
+
+        yield "</table>\n"
+
+    # === Rows ===
+    def drop_rows(self, rows: int, leading: int = 0) -> Iterator[str]:
+        """One reward table, its chances add up to exactly 100%"""
+        weights = [self.random.choice((1, 3, 10, 30)) for _ in range(rows)]
+        total = sum(weights)
+
+        # Hundredths of a percent, the remainder goes to the first row
+        chances = [weight * 10000 // total for weight in weights]
+        chances[0] += 10000 - sum(chances)
+
+        empty = "<td></td>" * leading
+        for chance in chances:
+            item = self.random.choice(self.items)
+            yield (
+                f"<tr>{empty}<td>{item}</td>"
+                f"<td>{self.chance_text(chance / 100)}</td></tr>\n"
+            )
+
+    def chance_text(self, chance: float) -> str:
+        if chance >= 20:
+            rarity = "Common"
+        elif chance >= 5:
+            rarity = "Uncommon"
+        elif chance >= 1:
+            rarity = "Rare"
+        else:
+            rarity = "Ultra Rare"
+
+        return f"{rarity} ({chance:.2f}%)"
+
+    def header_row(self, text: str, colspan: int = 2) -> str:
+        return f'<tr><th colspan="{colspan}">{text}</th></tr>\n'
+
+    def blank_row(self, colspan: int = 2) -> str:
+        return (
+            f'<tr class="blank-row"><td class="blank-row" colspan="{colspan}">'
+            "</td></tr>\n"
+        )
+
+    def name(self, n: int) -> str:
+        """Made-up place name, unique per n"""
+        syllables = []
+        while True:
+            n, syllable = divmod(n, len(SYLLABLES))
+            syllables.append(SYLLABLES[syllable])
+            if n == 0:
+                break
+
+        return "".join(syllables).capitalize()
+
+
+def write_droptables(file_path: str | Path, scale: float = 1, seed: int = 0) -> int:
+    """Write a synthetic drop-table page, returns its size in bytes"""
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    size = 0
+    with open(file_path, "wb") as f:
+        for chunk in DropTableGenerator(scale, seed).generate():
+            data = chunk.encode("utf-8")
+            f.write(data)
+            size += len(data)
+
+    return size
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Synthetic drop-table page")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1,
+        help="Size relative to the live page (default: 1)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("-o", "--output", required=True, help="HTML file to write")
+
+    args = parser.parse_args()
+
+    size = write_droptables(args.output, args.scale, args.seed)
+    print(f'✓ Wrote {size / (1024 * 1024):.1f} MB to "{args.output}"')
+
+
+if __name__ == "__main__":
+    main()
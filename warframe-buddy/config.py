@@ -9,12 +9,62 @@ load_dotenv()
 # Set to False for production (fetches new data from web)
 DEVELOPMENT_MODE = True
 
+# Set to True to ingest a local JSON drop dump (warframestat drops format,
+# saved as JSON_DROPS_FILE) instead of fetching and parsing the HTML page
+USE_JSON_DROPS = False
+
+# Worker processes used to parse drop-table sections in parallel
+# (1 parses everything in-process). Opt-in: the live page parses in well
+# under a second in-process, worker start-up and shipping every section's
+# drops back usually cost more than they save, and each worker is a full
+# interpreter in memory
+PARSE_WORKERS = 1
+
+# Set to True to rebuild without ever holding all drops in one list: drops
+# stream from the parsers into the search indexes and PARSED_NDJSON_FILE, one
+# section at a time. Bounds the parsed drops only, the search indexes are
+# still built in memory and stored whole in the pipeline's stage cache
+STREAMING_REBUILD = False
+
+# HTML parser used for the drop tables: "scanner" (reads rows without
+# building a tree, falls back to lxml or html.parser for any table it doesn't
+# recognise), "lxml" (C-backed, pip install lxml), "html.parser" (no extra
+# dependency) or "auto" (the scanner)
+HTML_BACKEND = "auto"
+
+# Set to True to record how long every rebuild stage and parser takes,
+# exported to TRACE_FILE (Chrome trace format) after each rebuild
+TRACING = False
+
+# Rows kept in validation reports per parser and error/warning reason, the
+# counts stay exact (None keeps every row)
+VALIDATION_SAMPLE_SIZE = 20
+
+# Distinct chance texts ("Uncommon (11.06%)") whose parsed rarity and chance
+# are cached, a page has a few hundred
+CHANCE_CACHE_SIZE = 4096
+
+# Compression levels of archived snapshot sections (see
+# services.snapshot_archive). Archiving runs after every fetch that changed
+# the page, higher levels take longer for slightly smaller files
+ARCHIVE_GZIP_LEVEL = 6  # 1-9
+ARCHIVE_ZSTD_LEVEL = 3  # 1-22, used when zstandard is installed
+
 # File paths
 FETCH_URL = "https://www.warframe.com/droptables"
+FETCH_TIMEOUT = 60  # seconds
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
 HTML_FILE = DATA_DIR / "warframe_drops.html"
+JSON_DROPS_FILE = DATA_DIR / "drops.json"
+ARCHIVE_DIR = DATA_DIR / "archive"
+FETCH_META_FILE = DATA_DIR / "fetch_meta.json"
 PARSED_DATA_FILE = DATA_DIR / "parsed_drops.json"
+PARSED_NDJSON_FILE = DATA_DIR / "parsed_drops.ndjson"
+SECTION_CACHE_FILE = DATA_DIR / "parsed_sections.json"
+PIPELINE_DIR = DATA_DIR / "pipeline"
+PIPELINE_STATE_FILE = PIPELINE_DIR / "state.json"
+TRACE_FILE = DATA_DIR / "trace.json"
 INDEXED_DATA_FILE = DATA_DIR / "search_indexes.json"
 COMMON_SEARCH_DATA_FILE = DATA_DIR / "most_common_searches.json"
 
@@ -1,11 +1,11 @@
 import sys
-from config import DEVELOPMENT_MODE
-from orchestrator import DropOrchestrator
+from config import DEVELOPMENT_MODE, USE_JSON_DROPS
 from search_engine import WarframeSearchEngine
+from services.rebuild_pipeline import RebuildPipeline
 from utils.helpers import clear_screen
 
 
-def cli():
+def cli(only: list[str] | None = None):
     clear_screen()
 
     print("=" * 60)
@@ -26,7 +26,6 @@ def cli():
 
     mode = input("\nSelect mode: ").strip()
 
-    error_trigger = False
     search_engine = None
 
     if mode == "1":
@@ -37,104 +36,36 @@ def cli():
         print("FRESH START MODE")
         print("=" * 60)
 
-        if not DEVELOPMENT_MODE:
-            # Production: Fetch new data
-            from services.fetch_data import fetch_data
-
-            print("\nFetching latest data...")
-            fetch_success, fetch_error = fetch_data()
-
-            if fetch_success:
-                print("✓ Data fetched successfully")
-            else:
-                print("✗ Error fetching latest data.")
-                if fetch_error:
-                    print(f"  ↳ {fetch_error}")
-                sys.exit(1)
-        else:
-            print("DEVELOPMENT MODE IS ACTIVE! Skipping fetching new data.")
-
-        # Parse everything
-        print("\nParsing data...")
-        orchestrator = DropOrchestrator()
-        all_drops, len_all_drops = orchestrator.parse_all()
-
-        # Print parse details
-        print(f"\nParsing completed:")
-        print(f"   Missions: {len_all_drops['mission_drops']} drops")
-        print(f"   Relics: {len_all_drops['relic_drops']} drops")
-        print(f"   Sorties: {len_all_drops['sortie_drops']} drops")
-        print(f"   Cetus bounties: {len_all_drops['cetus_bounty_drops']} drops")
-        print(f"   Orb Vallis bounties: {len_all_drops['solaris_bounty_drops']} drops")
-        print(
-            f"   Cambion Drift bounties: {len_all_drops['deimos_bounty_drops']} drops"
-        )
-        print(f"   Zariman bounties: {len_all_drops['zariman_bounty_drops']} drops")
-        print(
-            f"   Albrecht's Laboratories bounties: {len_all_drops['entrati_lab_bounty_drops']} drops"
+        def ask_save_parsed() -> bool:
+            # Asked once the data is fetched, parsed and validated
+            return input("\nSave parsed data to file? (y/n): ").lower() == "y"
+
+        # Fetch -> parse -> validate -> index -> save, stages whose inputs
+        # haven't changed since the last run are skipped
+        pipeline = RebuildPipeline(
+            fetch=not DEVELOPMENT_MODE,
+            use_json=USE_JSON_DROPS,
+            only=only,
+            save_parsed=ask_save_parsed,
+            on_message=lambda message: print(f"\n{message}"),
         )
-        print(f"   Hex bounties: {len_all_drops['hex_bounty_drops']} drops")
-        print(f"   Dynamic Location Rewards: {len_all_drops['transient_drops']} drops")
-        print(f"\n   Total drops: {len_all_drops['total_drops']} drops")
-
-        # Generate a validation report
-        report = orchestrator.get_validation_report()
-
-        # Show validation summary
-        overall = report["overall"]
-
-        print(f"\nVALIDATION SUMMARY:")
-        print(f"   Total drops: {overall['total_drops']}")
-        print(f"   Data integrity: {overall['data_integrity']:.1%}")
-        print(f"   Errors: {overall['error_count']}")
-        print(f"   Warnings: {overall['warning_count']}")
-
-        # Check if validation report contains any errors
-        if (
-            report["overall"]["error_count"] > 0
-            or report["overall"]["warning_count"] > 0
-        ):
-            error_trigger = True
-            print("   CRITICAL: Errors found in data!")
-
-        if error_trigger:
-            if not DEVELOPMENT_MODE:
-                print(
-                    "\n⚠  Data contains errors and is not safe to use! ⚠\n"
-                    "Run the program in DEVELOPMENT MODE to diagnose the problems.\n"
-                )
-                sys.exit(1)
-            else:
-                # If data has errors and dev mode is on, show detailed validation
-                orchestrator.print_validation_details()
-                sys.exit(1)
 
-        # Ask to save parsed data
-        save_parsed = input("\nSave parsed data to file? (y/n): ").lower()
-
-        if save_parsed == "y":
-            save_response = orchestrator.save_parsed_data()
-            print(save_response)
-        else:
-            print("\nSkipping saving parsed data to file.")
-
-        # Create search engine with fresh data
-        print("\nCreating search indexes...")
-        search_engine = WarframeSearchEngine()
-        create_indexes_reponse = search_engine.create_indexes_from_drops(all_drops)
-
-        print(f"✓ Indexed {len(all_drops)} drops")
-        print(create_indexes_reponse)
+        if not pipeline.run():
+            if pipeline.validation_failed:
+                if not DEVELOPMENT_MODE:
+                    print(
+                        "Run the program in DEVELOPMENT MODE to diagnose the problems.\n"
+                    )
+                else:
+                    # If data has errors and dev mode is on, show detailed validation
+                    pipeline.orchestrator.print_validation_details()
+            sys.exit(1)
 
-        # Always save indexes in Mode 1
-        save_indexes_response = search_engine.save_indexes()
-        print(save_indexes_response)
+        search_engine = pipeline.load_search_engine()
 
-        # Show index status
-        status = search_engine.get_index_status()
-        print(f"\nIndex Status:")
-        print(f"  - Items indexed: {status['total_items']}")
-        print(f"  - Rebuilt at: {status['last_rebuild'] or 'Just now'}")
+        if search_engine is None:
+            print(pipeline.error)
+            sys.exit(1)
 
         input("\nPress any key to continue...")
 
@@ -221,7 +152,7 @@ def interactive_search(search_engine) -> None:
             item_lower = item_name.lower()
 
             # Get all items from index
-            all_items = list(search_engine.search_indexes["item_sources"].keys())
+            all_items = search_engine.item_names()
 
             # Find matching items (case-insensitive, partial match)
             matching_items = [item for item in all_items if item_lower in item.lower()]
@@ -320,7 +251,7 @@ def interactive_search(search_engine) -> None:
             print("GET ITEM SUMMARY QUERY")
             print("=" * 60)
 
-            all_items = list(search_engine.search_indexes["item_sources"].keys())
+            all_items = search_engine.item_names()
             item_lower = item_name.lower()
 
             matching_items = [item for item in all_items if item_lower in item.lower()]
@@ -341,7 +272,8 @@ def interactive_search(search_engine) -> None:
                     if 0 <= idx < len(matching_items):
                         selected_item = matching_items[idx]
                         summary = search_engine.get_item_summary(selected_item)
-                        display_summary(summary)
+                        relics = search_engine.relic_rewards(selected_item)
+                        display_summary(summary, relics)
                     else:
                         print("\nInvalid selection!")
                         input("\nPress any key to continue...")
@@ -350,7 +282,8 @@ def interactive_search(search_engine) -> None:
                     input("\nPress any key to continue...")
             else:
                 summary = search_engine.get_item_summary(matching_items[0])
-                display_summary(summary)
+                relics = search_engine.relic_rewards(matching_items[0])
+                display_summary(summary, relics)
 
 
 def display_results(results: list, item_name: str | None, filter: str) -> None:
@@ -437,8 +370,8 @@ def display_results(results: list, item_name: str | None, filter: str) -> None:
     input("\nPress any key to continue...")
 
 
-def display_summary(summary: dict) -> None:
-    """Display item summary"""
+def display_summary(summary: dict, relics: list) -> None:
+    """Display item summary, relics are the item's RelicRewards"""
     clear_screen()
 
     print("=" * 60)
@@ -490,7 +423,9 @@ def display_summary(summary: dict) -> None:
     print(
         "  - Missions: Planet / Mission name / Mission type / Rotation -> Drop chance"
     )
-    print("  - Relics: Relic tier / Relic name / Relic refinement -> Drop chance")
+    print(
+        "  - Relics: Relic tier / Relic name -> Intact / Exceptional / Flawless / Radiant chance"
+    )
     print(
         "  - Bounties: Planet / Mission name / Bounty name / Bounty level / Rotation / Stage -> Drop chance"
     )
@@ -514,14 +449,15 @@ def display_summary(summary: dict) -> None:
         if len(summary["missions"]) > 10:
             print(f"  ... and {len(summary['missions']) - 10} more")
 
-    if summary["relics"]:
-        print(f"\nRelics ({len(summary['relics'])} sources):")
-        for relic in summary["relics"][:10]:
-            print(
-                f"  • {relic['tier']} {relic['name']} {relic['refinement']} -> {relic['chance']:.1%}"
+    if relics:
+        print(f"\nRelics ({len(relics)} sources):")
+        for relic in relics[:10]:
+            chances = " / ".join(
+                "-" if chance is None else f"{chance:.1%}" for chance in relic.chances
             )
-        if len(summary["relics"]) > 10:
-            print(f"  ... and {len(summary['relics']) - 10} more")
+            print(f"  • {relic.relic_tier} {relic.relic_name} -> {chances}")
+        if len(relics) > 10:
+            print(f"  ... and {len(relics) - 10} more")
 
     if summary["sorties"]:
         print(f"\nSorties ({len(summary['sorties'])} sources)")
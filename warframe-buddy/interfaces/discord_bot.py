@@ -28,6 +28,7 @@ class WarframeBuddyDiscordBot:
         )
 
         self.search_engine: Optional[WarframeSearchEngine] = None
+        self._rebuild_lock = asyncio.Lock()
 
         self.setup_error_handling()
         self.setup_commands()
@@ -306,98 +307,12 @@ class WarframeBuddyDiscordBot:
 
         @self.bot.command(name="rebuild")
         async def rebuild(ctx):
-            from services.fetch_data import fetch_data
-            from orchestrator import DropOrchestrator
-
-            await ctx.send("Fetching latest data...")
-            fetch_success, fetch_error = fetch_data()
-
-            if fetch_success:
-                await ctx.send("✓ Data fetched successfully")
-            else:
-                await ctx.send("✗ Error fetching latest data.")
-                if fetch_error:
-                    await ctx.send(f"  ↳ {fetch_error}")
-                return
-
-            orchestrator = DropOrchestrator()
-
-            # Parse everything
-            await ctx.send("Parsing data...")
-            orchestrator = DropOrchestrator()
-            all_drops, len_all_drops = orchestrator.parse_all()
-
-            # Print parse details
-            await ctx.send(
-                "Parsing completed:\n"
-                f"   Missions: {len_all_drops['mission_drops']} drops\n"
-                f"   Relics: {len_all_drops['relic_drops']} drops\n"
-                f"   Sorties: {len_all_drops['sortie_drops']} drops\n"
-                f"   Cetus bounties: {len_all_drops['cetus_bounty_drops']} drops\n"
-                f"   Orb Vallis bounties: {len_all_drops['solaris_bounty_drops']} drops\n"
-                f"   Cambion Drift bounties: {len_all_drops['deimos_bounty_drops']} drops\n"
-                f"   Zariman bounties: {len_all_drops['zariman_bounty_drops']} drops\n"
-                f"   Albrecht's Laboratories bounties: {len_all_drops['entrati_lab_bounty_drops']} drops\n"
-                f"   Hex bounties: {len_all_drops['hex_bounty_drops']} drops\n"
-                f"   Dynamic Location Rewards: {len_all_drops['transient_drops']} drops\n"
-                f"   Total drops: {len_all_drops['total_drops']} drops"
-            )
-
-            # Generate a validation report
-            report = orchestrator.get_validation_report()
-
-            # Show validation summary
-            overall = report["overall"]
-
-            await ctx.send(
-                f"VALIDATION SUMMARY:\n"
-                f"   Total drops: {overall['total_drops']}\n"
-                f"   Data integrity: {overall['data_integrity']:.1%}\n"
-                f"   Errors: {overall['error_count']}\n"
-                f"   Warnings: {overall['warning_count']}"
-            )
-
-            # Check if validation report contains any errors
-            if (
-                report["overall"]["error_count"] > 0
-                or report["overall"]["warning_count"] > 0
-            ):
-                error_trigger = True
-                await ctx.send("   CRITICAL: Errors found in data!")
-
-            if error_trigger:
-                await ctx.send(
-                    "⚠  Data contains errors and is not safe to use! ⚠\n"
-                    "Run the program in DEVELOPMENT MODE to diagnose the problems.\n"
-                )
+            if self._rebuild_lock.locked():
+                await ctx.send("⏳ A rebuild is already in progress")
                 return
 
-            # Save parsed data to file
-            await ctx.send("Saving parsed data to file...")
-            save_response = orchestrator.save_parsed_data()
-            await ctx.send(save_response)
-
-            # Create search engine with fresh data
-            await ctx.send("Creating search indexes...")
-            search_engine = WarframeSearchEngine()
-            create_indexes_reponse = search_engine.create_indexes_from_drops(all_drops)
-
-            await ctx.send(
-                f"✓ Indexed {len(all_drops)} drops\n" f"{create_indexes_reponse}"
-            )
-
-            # Always save indexes in Mode 1
-            save_indexes_response = search_engine.save_indexes()
-            await ctx.send(save_indexes_response)
-
-            # Show index status
-            status = search_engine.get_index_status()
-
-            await ctx.send(
-                f"Index Status:\n"
-                f"  - Items indexed: {status['total_items']}\n"
-                f"  - Rebuilt at: {status['last_rebuild'] or 'Just now'}"
-            )
+            async with self._rebuild_lock:
+                await self._rebuild(ctx)
 
         @self.bot.command(name="debug")
         async def debug(ctx):
@@ -428,6 +343,55 @@ class WarframeBuddyDiscordBot:
 
     # ==== SHARED FUNCTIONS ====
 
+    async def _rebuild(self, ctx) -> None:
+        """Fetch, parse, validate and index fresh drop data"""
+        from services.rebuild_pipeline import RebuildPipeline
+
+        status_message = None
+        next_report = 0
+
+        async def send_message(message: str) -> None:
+            nonlocal status_message
+            status_message = await ctx.send(message)
+
+        async def report_progress(received: int, total: int | None) -> None:
+            nonlocal next_report
+
+            # Editing on every chunk would hit Discord rate limits
+            if received < next_report or status_message is None:
+                return
+            next_report = received + (total // 4 if total else 1024 * 1024)
+
+            if total:
+                done = f"{received / total:.0%}"
+            else:
+                done = f"{received / (1024 * 1024):.1f} MB"
+            await status_message.edit(content=f"Fetching latest data... {done}")
+
+        # Stages whose inputs didn't change since the last rebuild are skipped,
+        # a failed rebuild resumes at the stage that failed
+        pipeline = RebuildPipeline(on_message=send_message, progress=report_progress)
+
+        if not await pipeline.run_async():
+            if pipeline.validation_failed:
+                # Reports only keep a few rows per problem, the summary stays short
+                summary = pipeline.orchestrator.validation_summary()
+                await ctx.send(f"```\n{summary[:1900]}\n```")
+                await ctx.send(
+                    "Run the program in DEVELOPMENT MODE to diagnose the problems.\n"
+                )
+            return
+
+        # Serve searches from the fresh indexes
+        if pipeline.search_engine is not None or self.search_engine is None:
+            search_engine = await asyncio.to_thread(pipeline.load_search_engine)
+
+            if search_engine is None:
+                await ctx.send(pipeline.error)
+                return
+
+            self.search_engine = search_engine
+
     async def fuzzy_select_item(self, ctx, search_query: str) -> str | None:
         """
         Handle fuzzy item selection with interactive menu
@@ -440,7 +404,7 @@ class WarframeBuddyDiscordBot:
             return None
 
         # Get all items from index
-        all_items = list(self.search_engine.search_indexes["item_sources"].keys())
+        all_items = self.search_engine.item_names()
         search_lower = search_query.lower()
 
         # Find partial matches
@@ -6,16 +6,48 @@ INTERFACE = "cli"
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Warframe Buddy")
+    parser.add_argument(
+        "--only",
+        help="Re-parse only these sections (e.g. relics,missions), "
+        "reuse cached results for the rest",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record rebuild timings to a Chrome trace file (see TRACE_FILE)",
+    )
+    args = parser.parse_args()
+
     from utils.dependencies import check_dependencies
 
     if not check_dependencies():
         sys.exit(1)
 
+    only = None
+    if args.only:
+        from orchestrator import SECTION_NAMES
+
+        only = [section.strip() for section in args.only.split(",") if section.strip()]
+        unknown = [section for section in only if section not in SECTION_NAMES]
+        if unknown:
+            parser.error(
+                f"unknown section(s) {', '.join(unknown)} "
+                f"(choose from {', '.join(SECTION_NAMES)})"
+            )
+
+    if args.trace:
+        from utils import tracing
+
+        tracing.enable()
+
     if INTERFACE == "cli":
         # Run cli
         from interfaces.cli import cli
 
-        cli()
+        cli(only=only)
 
     elif INTERFACE == "dbot":
         # Run Discord bot
@@ -1,129 +1,478 @@
-from bs4 import BeautifulSoup
+import hashlib
 import json
+import os
 from pathlib import Path
+from typing import Iterator
 from datetime import datetime
 from collections import Counter
-from config import HTML_FILE, PARSED_DATA_FILE
+from functools import partial
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from config import (
+    HTML_FILE,
+    JSON_DROPS_FILE,
+    PARSED_DATA_FILE,
+    PARSE_WORKERS,
+    SECTION_CACHE_FILE,
+)
+from parsers.base_parser import CHANCE_SUM_REASON
+from parsers.drop_records import as_drop_record, drop_to_json, row_count
+from parsers.html_backend import parse_html
+from parsers.mission_parser import MissionDropParser
+from parsers.relic_parser import RelicDropParser
+from parsers.sortie_parser import SortieDropParser
+from parsers.bounty_parser import BOUNTY_HUBS, BountyDropParser
+from parsers.transient_parser import TransientDropParser  # Dynamic Location Rewards
+from utils.helpers import repair_encoding
+from utils.html_sections import SectionIndex, SectionStream
+from utils.tracing import span
+
+# Parsed drop-table sections, in parse order:
+# section id -> (report key, drop count key, parser class, error label)
+# Bounty parsers are called with the section id of their hub
+SECTION_PARSERS = {
+    "missionRewards": ("missions", "mission_drops", MissionDropParser, "MISSION"),
+    "relicRewards": ("relics", "relic_drops", RelicDropParser, "RELIC"),
+    "sortieRewards": ("sorties", "sortie_drops", SortieDropParser, "SORTIE"),
+    **{
+        section_id: (
+            f"{name}_bounty",
+            f"{name}_bounty_drops",
+            partial(BountyDropParser, section_id=section_id),
+            f"{name.replace('_', ' ').upper()} BOUNTY",
+        )
+        for section_id, (name, *_) in BOUNTY_HUBS.items()
+    },
+    "transientRewards": (
+        "transient",
+        "transient_drops",
+        TransientDropParser,
+        "TRANSIENT",
+    ),
+}
+
+# Section names accepted by DropOrchestrator(only=...), e.g. --only relics,missions
+SECTION_NAMES = [keys[0] for keys in SECTION_PARSERS.values()]
+
+# Report key -> section id
+SECTION_IDS = {keys[0]: section_id for section_id, keys in SECTION_PARSERS.items()}
+
+# Bump when parser output changes, so cached sections are parsed again
+SECTION_CACHE_VERSION = 5
 
 
 class DropOrchestrator:
     """Orchestrator for parsing"""
 
-    def __init__(self):
-        self.soup = self.load_html(HTML_FILE)
-
-        from parsers.mission_parser import MissionDropParser
-        from parsers.relic_parser import RelicDropParser
-        from parsers.sortie_parser import SortieDropParser
-        from parsers.bounty_parser import (
-            CetusBountyDropParser,
-            SolarisBountyDropParser,  # Orb Vallis
-            DeimosBountyDropParser,  # Cambion Drift
-            ZarimanBountyDropParser,
-            EntratiLabDropParser,  # Albrecht's Laboratories
-            HexBountyDropParser,
-        )
-        from parsers.transient_parser import (
-            TransientDropParser,
-        )  # Dynamic Location Rewards
-
-        self.mission_parser = MissionDropParser(self.soup)
-        self.relic_parser = RelicDropParser(self.soup)
-        self.sortie_parser = SortieDropParser(self.soup)
-        self.cetus_bounty_parser = CetusBountyDropParser(self.soup)
-        self.solaris_bounty_parser = SolarisBountyDropParser(self.soup)
-        self.deimos_bounty_parser = DeimosBountyDropParser(self.soup)
-        self.zariman_bounty_parser = ZarimanBountyDropParser(self.soup)
-        self.entrati_lab_bounty_parser = EntratiLabDropParser(self.soup)
-        self.hex_bounty_parser = HexBountyDropParser(self.soup)
-        self.transient_parser = TransientDropParser(self.soup)
+    def __init__(
+        self,
+        source_hash: str | None = None,
+        html_file: str | Path | None = HTML_FILE,
+        markup: bytes | None = None,
+        pipelined: bool = False,
+        workers: int | None = None,
+        incremental: bool = False,
+        only: list[str] | None = None,
+    ):
+        """
+        Args:
+            source_hash: Content hash of the snapshot being parsed
+            html_file: Drop-table page to parse (None loads nothing)
+            markup: Raw page to parse instead of html_file
+            pipelined: Parse while downloading - nothing is loaded up front,
+                raw HTML is handed over with feed() and close() instead
+            workers: Processes parsing sections in parallel
+                (defaults to PARSE_WORKERS, 1 parses in-process)
+            incremental: Only parse sections whose content hash changed since
+                the last run, reuse cached drops and reports for the rest
+            only: Report keys (e.g. ["relics", "missions"]) to parse again,
+                every other section comes from the cache. Implies incremental
+        """
+        if only is not None:
+            unknown = sorted(set(only) - set(SECTION_NAMES))
+            if unknown:
+                raise ValueError(
+                    f"Unknown section(s): {', '.join(unknown)}. "
+                    f"Choose from: {', '.join(SECTION_NAMES)}"
+                )
+            incremental = True
+
+        self.workers = PARSE_WORKERS if workers is None else max(workers, 1)
+
+        # Byte ranges of the page's sections, every section is parsed from
+        # its own slice into its own tree (the page is never one big DOM)
+        self.sections: SectionIndex | None = None
+
+        if markup is not None:
+            self.sections = SectionIndex(markup)
+        elif html_file is not None and not pipelined:
+            self.sections = self.open_html(html_file)
+
+        # Content hash of the snapshot being parsed (see services.fetch_data)
+        self.source_hash = source_hash
 
         self.all_drops = []
         self.parsed_at = datetime.now()
 
-        # Store validation reports
-        self.mission_report = None
-        self.relic_report = None
-        self.sortie_report = None
-        self.cetus_bounty_report = None
-        self.solaris_bounty_report = None
-        self.deimos_bounty_report = None
-        self.zariman_bounty_report = None
-        self.entrati_lab_bounty_report = None
-        self.hex_bounty_report = None
-        self.transient_report = None
-
-    def load_html(self, file_path: str | Path) -> BeautifulSoup:
-        """Load HTML file"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return BeautifulSoup(f.read(), "html.parser")
+        # Store drops and validation reports per report key
+        self.drops = {}
+        self.reports = {}
+
+        # Drops per count key and "total_drops", as returned by parse_all().
+        # Counts table rows: a relic reward is one drop per refinement
+        self.drop_counts: dict[str, int] = {}
+
+        # Pipeline mode: sections are parsed in the background as they arrive
+        self.pipelined = pipelined
+        self._section_stream = SectionStream() if pipelined else None
+        self.bytes_fed = 0
+        self._executor = None
+        self._pending: dict[str, Future] = {}
+
+        # Sections parsed up front from another source (see from_json)
+        # or reused from the section cache
+        self._parsed: dict[str, tuple[list, dict | None]] = {}
+
+        # Incremental mode: content hash of every section, per report key
+        self.incremental = incremental
+        self.only = set(only) if only is not None else None
+        self.section_hashes: dict[str, str] = {}
+        self.reused_sections: list[str] = []
+        self._section_cache = None
+
+    @classmethod
+    def from_json(cls, json_file: str | Path = JSON_DROPS_FILE) -> "DropOrchestrator":
+        """Ingest a JSON drop dump instead of the HTML page (no DOM is built)"""
+        from parsers.json_parser import JsonDropParser
 
+        try:
+            with open(json_file, "rb") as f:
+                raw = f.read()
         except FileNotFoundError as e:
-            raise FileNotFoundError(
-                f'HTML file "{file_path}" not found. '
-                "Please fetch data first (run in Mode 1)."
-            ) from e
+            raise FileNotFoundError(f'JSON drop file "{json_file}" not found.') from e
+
+        with span("parse_json", bytes_read=len(raw)):
+            # Stray bytes become U+FFFD, like on the HTML page
+            text = repair_encoding(raw).decode("utf-8", errors="replace")
+            sections = JsonDropParser(json.loads(text)).parse()
+
+        return cls.from_sections(
+            {
+                SECTION_PARSERS[section_id][0]: result
+                for section_id, result in sections.items()
+            },
+            source_hash=hashlib.sha256(raw).hexdigest(),
+        )
 
-    def parse_all(self) -> tuple[list, dict]:
-        """Parse everything and store validation reports"""
-        # Parse Missions
-        mission_drops, self.mission_report = self.mission_parser.parse()
+    @classmethod
+    def from_sections(
+        cls,
+        sections: dict[str, tuple[list, dict | None]],
+        source_hash: str | None = None,
+    ) -> "DropOrchestrator":
+        """
+        Wrap sections that were already parsed
 
-        # Parse Relics
-        relic_drops, self.relic_report = self.relic_parser.parse()
+        Args:
+            sections: Report key -> (drops, validation report), e.g. the
+                drops / reports of an earlier parse_all()
+            source_hash: Content hash of the snapshot they were parsed from
+        """
+        orchestrator = cls(source_hash=source_hash, html_file=None)
+        orchestrator._parsed = {
+            report_key: ([as_drop_record(drop) for drop in drops], report)
+            for report_key, (drops, report) in sections.items()
+        }
 
-        # Parse Sorties
-        sortie_drops, self.sortie_report = self.sortie_parser.parse()
+        return orchestrator
 
-        # Parse Bounties
-        cetus_bounty_drops, self.cetus_bounty_report = self.cetus_bounty_parser.parse()
-        solaris_bounty_drops, self.solaris_bounty_report = (
-            self.solaris_bounty_parser.parse()
-        )
-        deimos_bounty_drops, self.deimos_bounty_report = (
-            self.deimos_bounty_parser.parse()
-        )
-        zariman_bounty_drops, self.zariman_bounty_report = (
-            self.zariman_bounty_parser.parse()
-        )
-        entrati_lab_bounty_drops, self.entrati_lab_bounty_report = (
-            self.entrati_lab_bounty_parser.parse()
+    def open_html(self, file_path: str | Path) -> SectionIndex:
+        """Memory-map HTML file and index its sections, nothing is parsed yet"""
+        with span("open_html") as open_span:
+            try:
+                sections = SectionIndex.open(file_path)
+
+            except FileNotFoundError as e:
+                raise FileNotFoundError(
+                    f'HTML file "{file_path}" not found. '
+                    "Please fetch data first (run in Mode 1)."
+                ) from e
+
+            open_span.set(size=sections.size, sections=len(sections))
+
+        return sections
+
+    # ==== PIPELINE MODE ====
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Pipeline mode: hand over the next chunk of the downloading page
+
+        Every section completed by the chunk is parsed on a background thread
+        while the download continues.
+        """
+        self.bytes_fed += len(chunk)
+
+        for section_id, data in self._section_stream.feed(chunk):
+            self._submit_section(section_id, data)
+
+    def close(self) -> None:
+        """Pipeline mode: the download finished, parse the last section"""
+        for section_id, data in self._section_stream.close():
+            self._submit_section(section_id, data)
+
+    def shutdown(self) -> None:
+        """
+        Pipeline mode: stop the background parser thread
+
+        parse_all() and iter_drops() call it once they collected every
+        section. Sections still waiting to be parsed are dropped.
+        """
+        self._pending.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _submit_section(self, section_id: str, data: bytes) -> None:
+        if section_id not in SECTION_PARSERS:
+            return
+
+        report_key = SECTION_PARSERS[section_id][0]
+
+        if self._reuse_section(report_key, data):
+            return
+
+        if self._executor is None:
+            # One worker is enough: the download thread is mostly waiting
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="drop-parser"
+            )
+
+        self._pending[report_key] = self._executor.submit(
+            self._parse_fragment, section_id, data
         )
-        hex_bounty_drops, self.hex_bounty_report = self.hex_bounty_parser.parse()
-
-        # Parse Dynamic Location Rewards
-        transient_drops, self.transient_report = self.transient_parser.parse()
-
-        self.all_drops = (
-            mission_drops
-            + relic_drops
-            + sortie_drops
-            + cetus_bounty_drops
-            + solaris_bounty_drops
-            + deimos_bounty_drops
-            + zariman_bounty_drops
-            + entrati_lab_bounty_drops
-            + hex_bounty_drops
-            + transient_drops
+
+    @staticmethod
+    def _parse_fragment(section_id: str, data: bytes) -> tuple[list, dict | None]:
+        """Parse one section (its <h3> header and table) on its own"""
+        parser_class = SECTION_PARSERS[section_id][2]
+
+        with span(f"load_section.{section_id}", bytes_read=len(data)):
+            document = parse_html(repair_encoding(data))
+
+        return parser_class(document).parse()
+
+    # ==== SECTION MODE ====
+
+    def parse_section(self, report_key: str) -> tuple[list, dict | None]:
+        """
+        Parse a single section on demand, e.g. parse_section("relics")
+
+        Only that section's bytes are read and parsed, the result is kept for
+        parse_all().
+        """
+        if report_key not in SECTION_IDS:
+            raise ValueError(
+                f"Unknown section: {report_key}. Choose from: {', '.join(SECTION_NAMES)}"
+            )
+
+        if report_key not in self._parsed:
+            section_id = SECTION_IDS[report_key]
+
+            if self.sections is None or section_id not in self.sections:
+                return [], None
+
+            data = self.sections.section(section_id)
+
+            if not self._reuse_section(report_key, data):
+                self._parsed[report_key] = self._parse_fragment(section_id, data)
+
+        return self._parsed[report_key]
+
+    def _parse_sections(self) -> None:
+        """
+        Parse every section of the page that hasn't been parsed yet
+
+        Each section is sliced out of the page (see utils.html_sections) and
+        parsed exactly like in pipeline mode. With more than one worker,
+        sections are parsed in separate processes.
+        """
+        fragments = {}
+
+        for section_id in self.sections:
+            if section_id not in SECTION_PARSERS:
+                continue
+
+            report_key = SECTION_PARSERS[section_id][0]
+            if report_key in self._parsed:
+                continue
+
+            data = self.sections.section(section_id)
+            if not self._reuse_section(report_key, data):
+                fragments[report_key] = (section_id, data)
+
+        if self.workers == 1 or len(fragments) < 2:
+            for report_key, (section_id, data) in fragments.items():
+                self._parsed[report_key] = self._parse_fragment(section_id, data)
+
+            return
+
+        # Spans of the worker processes aren't collected, only the total
+        with span(
+            "parse_parallel", sections=len(fragments), workers=self.workers
+        ), ProcessPoolExecutor(
+            max_workers=min(self.workers, len(fragments))
+        ) as executor:
+            futures = {
+                report_key: executor.submit(self._parse_fragment, section_id, data)
+                for report_key, (section_id, data) in fragments.items()
+            }
+
+            for report_key, future in futures.items():
+                self._parsed[report_key] = future.result()
+
+    # ==== SECTION CACHE ====
+
+    def _reuse_section(self, report_key: str, data: bytes) -> bool:
+        """
+        Incremental mode: record the section hash and reuse the cached
+        result if the section doesn't have to be parsed again
+        """
+        if not self.incremental:
+            return False
+
+        section_hash = hashlib.sha256(data).hexdigest()
+        self.section_hashes[report_key] = section_hash
+
+        if self._section_cache is None:
+            self._section_cache = self._load_section_cache()
+
+        cached = self._section_cache.get(report_key)
+        if cached is None:
+            return False
+
+        if self.only is not None:
+            if report_key in self.only:
+                return False
+            # Kept as is, the next normal run still sees it as changed
+            self.section_hashes[report_key] = cached["hash"]
+        elif cached["hash"] != section_hash:
+            return False
+
+        self._parsed[report_key] = (
+            [as_drop_record(drop) for drop in cached["drops"]],
+            cached["report"],
         )
+        self.reused_sections.append(report_key)
+
+        return True
 
-        len_all_drops = {
-            "mission_drops": len(mission_drops),
-            "relic_drops": len(relic_drops),
-            "sortie_drops": len(sortie_drops),
-            "cetus_bounty_drops": len(cetus_bounty_drops),
-            "solaris_bounty_drops": len(solaris_bounty_drops),
-            "deimos_bounty_drops": len(deimos_bounty_drops),
-            "zariman_bounty_drops": len(zariman_bounty_drops),
-            "entrati_lab_bounty_drops": len(entrati_lab_bounty_drops),
-            "hex_bounty_drops": len(hex_bounty_drops),
-            "transient_drops": len(transient_drops),
-            "total_drops": len(self.all_drops),
+    def _load_section_cache(self) -> dict:
+        try:
+            with open(SECTION_CACHE_FILE, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if cache.get("version") != SECTION_CACHE_VERSION:
+            return {}
+
+        return cache.get("sections", {})
+
+    def _save_section_cache(self) -> None:
+        sections = {
+            report_key: {
+                "hash": section_hash,
+                "drops": self.drops[report_key],
+                "report": self.reports[report_key],
+            }
+            for report_key, section_hash in self.section_hashes.items()
         }
 
+        cache = {"version": SECTION_CACHE_VERSION, "sections": sections}
+
+        try:
+            tmp_path = Path(f"{SECTION_CACHE_FILE}.part")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(cache, default=drop_to_json))
+            os.replace(tmp_path, SECTION_CACHE_FILE)
+        except OSError as e:
+            print(f"Warning: Could not save section cache: {e}")
+
+    # ==== PARSING ====
+
+    def parse_all(self) -> tuple[list, dict]:
+        """Parse everything and store validation reports"""
+        len_all_drops = {}
+        self.all_drops = []
+
+        if self.sections is not None:
+            self._parse_sections()
+
+            # Everything is parsed, release the mapping
+            self.sections.close()
+            self.sections = None
+
+        for report_key, count_key, _, _ in SECTION_PARSERS.values():
+            # Sections that never showed up in the document are empty
+            if report_key in self._parsed:
+                drops, report = self._parsed[report_key]
+            elif report_key in self._pending:
+                drops, report = self._pending.pop(report_key).result()
+            else:
+                drops, report = [], None
+
+            self.drops[report_key] = drops
+            self.reports[report_key] = report
+
+            self.all_drops += drops
+            len_all_drops[count_key] = row_count(drops)
+
+        self.shutdown()
+
+        # Something was parsed again -> refresh the section cache
+        if self.incremental and len(self.reused_sections) < len(self.section_hashes):
+            self._save_section_cache()
+
+        len_all_drops["total_drops"] = sum(len_all_drops.values())
+        self.drop_counts = len_all_drops
+
         return self.all_drops, len_all_drops
 
+    def iter_drops(self) -> Iterator[dict]:
+        """
+        Streaming mode: yield every drop, one section at a time
+
+        A section is parsed when it is reached and released once its drops
+        have been yielded, so all_drops is never built. Validation reports
+        and drop_counts are filled in as sections go by. The section cache
+        is read but not updated.
+        """
+        self.drop_counts = {}
+        total_drops = 0
+
+        for report_key, count_key, _, _ in SECTION_PARSERS.values():
+            if report_key in self._pending:
+                drops, report = self._pending.pop(report_key).result()
+            else:
+                # Sections that never showed up in the document are empty
+                drops, report = self.parse_section(report_key)
+                self._parsed.pop(report_key, None)
+
+            self.reports[report_key] = report
+            self.drop_counts[count_key] = row_count(drops)
+            total_drops += self.drop_counts[count_key]
+
+            yield from drops
+
+        self.drop_counts["total_drops"] = total_drops
+
+        if self.sections is not None:
+            self.sections.close()
+            self.sections = None
+
+        self.shutdown()
+
     def get_validation_report(self) -> dict:
         """
         Get comprehensive validation report for ALL data
@@ -132,77 +481,43 @@ class DropOrchestrator:
         reports = {}
 
         # Use the reports already generated during parsing
-        reports["missions"] = self.mission_report
-        reports["relics"] = self.relic_report
-        reports["sorties"] = self.sortie_report
-        reports["cetus_bounty"] = self.cetus_bounty_report
-        reports["solaris_bounty"] = self.solaris_bounty_report
-        reports["deimos_bounty"] = self.deimos_bounty_report
-        reports["zariman_bounty"] = self.zariman_bounty_report
-        reports["entrati_lab_bounty"] = self.entrati_lab_bounty_report
-        reports["hex_bounty"] = self.hex_bounty_report
-        reports["transient"] = self.transient_report
-
-        # Calculate overall stats based on ACTUAL data being used
-        total_drops = len(self.all_drops)
-
-        # Count errors across all parsers
-        all_errors = []
-        all_warnings = []
-
-        if self.mission_report:
-            all_errors.extend(self.mission_report.get("errors", []))
-            all_warnings.extend(self.mission_report.get("warnings", []))
-
-        if self.relic_report:
-            all_errors.extend(self.relic_report.get("errors", []))
-            all_warnings.extend(self.relic_report.get("warnings", []))
-
-        if self.sortie_report:
-            all_errors.extend(self.sortie_report.get("errors", []))
-            all_warnings.extend(self.sortie_report.get("warnings", []))
-
-        if self.cetus_bounty_report:
-            all_errors.extend(self.cetus_bounty_report.get("errors", []))
-            all_warnings.extend(self.cetus_bounty_report.get("warnings", []))
-
-        if self.solaris_bounty_report:
-            all_errors.extend(self.solaris_bounty_report.get("errors", []))
-            all_warnings.extend(self.solaris_bounty_report.get("warnings", []))
-
-        if self.deimos_bounty_report:
-            all_errors.extend(self.deimos_bounty_report.get("errors", []))
-            all_warnings.extend(self.deimos_bounty_report.get("warnings", []))
-
-        if self.zariman_bounty_report:
-            all_errors.extend(self.zariman_bounty_report.get("errors", []))
-            all_warnings.extend(self.zariman_bounty_report.get("warnings", []))
-
-        if self.entrati_lab_bounty_report:
-            all_errors.extend(self.entrati_lab_bounty_report.get("errors", []))
-            all_warnings.extend(self.entrati_lab_bounty_report.get("warnings", []))
-
-        if self.hex_bounty_report:
-            all_errors.extend(self.hex_bounty_report.get("errors", []))
-            all_warnings.extend(self.hex_bounty_report.get("warnings", []))
-
-        if self.transient_report:
-            all_errors.extend(self.transient_report.get("errors", []))
-            all_warnings.extend(self.transient_report.get("warnings", []))
-
-        # Group issues by type for easy fixing
-        error_types = Counter(e["reason"] for e in all_errors)
-        warning_types = Counter(w["reason"] for w in all_warnings)
+        for report_key, _, _, _ in SECTION_PARSERS.values():
+            reports[report_key] = self.reports.get(report_key)
+
+        # Calculate overall stats based on ACTUAL data being used. Counts rows
+        # of the drop tables, a relic reward is one row per refinement
+        total_drops = sum(
+            report["summary"]["total_rows"] for report in reports.values() if report
+        )
+
+        # Group issues by type for easy fixing, reports only keep a sample of
+        # the rows but count every one of them
+        error_types = Counter()
+        warning_types = Counter()
+        chance_sum_mismatches = 0
+
+        for report_key, _, _, _ in SECTION_PARSERS.values():
+            if reports[report_key]:
+                error_types.update(reports[report_key]["error_counts"])
+                warning_types.update(reports[report_key]["warning_counts"])
+                chance_sum_mismatches += reports[report_key]["counters"].get(
+                    "chance_sum_mismatch", 0
+                )
+
+        error_count = error_types.total()
+        warning_count = warning_types.total()
 
         reports["overall"] = {
             "total_drops": total_drops,
-            "error_count": len(all_errors),
-            "warning_count": len(all_warnings),
+            "error_count": error_count,
+            "warning_count": warning_count,
             "data_integrity": (
-                (total_drops - len(all_errors)) / total_drops if total_drops > 0 else 0
+                (total_drops - error_count) / total_drops if total_drops > 0 else 0
             ),
             "errors_by_type": dict(error_types),
             "warnings_by_type": dict(warning_types),
+            # Not counted as warnings, chances are rounded on the page
+            "chance_sum_mismatches": chance_sum_mismatches,
         }
 
         return reports
@@ -217,121 +532,36 @@ class DropOrchestrator:
         print("DETAILED VALIDATION REPORT")
         print("=" * 60)
 
-        # Show mission errors
-        if report["missions"] and report["missions"]["errors"]:
-            print("\nMISSION ERRORS:")
-            for error in report["missions"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["missions"]["errors"]) > max_errors:
-                print(
-                    f"  ... and {len(report['missions']['errors']) - max_errors} more"
-                )
-
-        # Show relic errors
-        if report["relics"] and report["relics"]["errors"]:
-            print("\nRELIC ERRORS:")
-            for error in report["relics"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["relics"]["errors"]) > max_errors:
-                print(f"  ... and {len(report['relics']['errors']) - max_errors} more")
-
-        # Show sortie errors
-        if report["sorties"] and report["sorties"]["errors"]:
-            print("\nSORTIE ERRORS:")
-            for error in report["sorties"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["sorties"]["errors"]) > max_errors:
-                print(f"  ... and {len(report['sorties']['errors']) - max_errors} more")
-
-        # Show cetus bounty errors
-        if report["cetus_bounty"] and report["cetus_bounty"]["errors"]:
-            print("\nCETUS BOUNTY ERRORS:")
-            for error in report["cetus_bounty"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["cetus_bounty"]["errors"]) > max_errors:
-                print(
-                    f"  ... and {len(report['cetus_bounty']['errors']) - max_errors} more"
-                )
-
-        # Show solaris bounty errors
-        if report["solaris_bounty"] and report["solaris_bounty"]["errors"]:
-            print("\nSOLARIS BOUNTY ERRORS:")
-            for error in report["solaris_bounty"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["solaris_bounty"]["errors"]) > max_errors:
-                print(
-                    f"  ... and {len(report['solaris_bounty']['errors']) - max_errors} more"
-                )
-
-        # Show deimos bounty errors
-        if report["deimos_bounty"] and report["deimos_bounty"]["errors"]:
-            print("\nDEIMOS BOUNTY ERRORS:")
-            for error in report["deimos_bounty"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["deimos_bounty"]["errors"]) > max_errors:
-                print(
-                    f"  ... and {len(report['deimos_bounty']['errors']) - max_errors} more"
-                )
-
-        # Show zariman bounty errors
-        if report["zariman_bounty"] and report["zariman_bounty"]["errors"]:
-            print("\nZARIMAN BOUNTY ERRORS:")
-            for error in report["zariman_bounty"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["zariman_bounty"]["errors"]) > max_errors:
-                print(
-                    f"  ... and {len(report['zariman_bounty']['errors']) - max_errors} more"
-                )
-
-        # Show entrati lab bounty errors
-        if report["entrati_lab_bounty"] and report["entrati_lab_bounty"]["errors"]:
-            print("\nENTRATI LAB BOUNTY ERRORS:")
-            for error in report["entrati_lab_bounty"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["entrati_lab_bounty"]["errors"]) > max_errors:
-                print(
-                    f"  ... and {len(report['entrati_lab_bounty']['errors']) - max_errors} more"
-                )
-
-        # Show hex bounty errors
-        if report["hex_bounty"] and report["hex_bounty"]["errors"]:
-            print("\nHEX BOUNTY ERRORS:")
-            for error in report["hex_bounty"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["hex_bounty"]["errors"]) > max_errors:
-                print(
-                    f"  ... and {len(report['hex_bounty']['errors']) - max_errors} more"
-                )
-
-        # Show transient errors
-        if report["transient"] and report["transient"]["errors"]:
-            print("\nTRANSIENT ERRORS:")
-            for error in report["transient"]["errors"][:max_errors]:
-                print(
-                    f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
-                )
-            if len(report["transient"]["errors"]) > max_errors:
-                print(
-                    f"  ... and {len(report['transient']['errors']) - max_errors} more"
-                )
+        # Show errors per parser
+        for report_key, _, _, label in SECTION_PARSERS.values():
+            if report[report_key] and report[report_key]["errors"]:
+                errors = report[report_key]["errors"]
+                total_errors = sum(report[report_key]["error_counts"].values())
+
+                print(f"\n{label} ERRORS:")
+                for error in errors[:max_errors]:
+                    print(
+                        f"  Row {error['index']} -> Reason: {error['reason']} - Item: {error['item']}"
+                    )
+                if total_errors > max_errors:
+                    print(f"  ... and {total_errors - max_errors} more")
+
+        # Show reward tables whose chances don't add up
+        for report_key, _, _, label in SECTION_PARSERS.values():
+            if not report[report_key]:
+                continue
+
+            tables = report[report_key]["chance_sums"]
+            total_tables = report[report_key]["counters"].get("chance_sum_mismatch", 0)
+            if tables:
+                print(f"\n{label} TABLES NOT ADDING UP TO 100%:")
+                for warning in tables[:max_errors]:
+                    table = ", ".join(str(v) for v in warning["table"].values() if v)
+                    print(
+                        f"  Row {warning['index']} -> {table} - Sum: {warning['chance_sum']:.2%} ({warning['rows']} rows)"
+                    )
+                if total_tables > max_errors:
+                    print(f"  ... and {total_tables - max_errors} more")
 
         # Show warnings summary
         total_warnings = report["overall"]["warning_count"]
@@ -342,15 +572,54 @@ class DropOrchestrator:
 
         print("=" * 60)
 
+    def validation_summary(self, max_rows: int = 3) -> str:
+        """
+        Short validation report for chat messages (Discord bot)
+
+        One line per parser and reason with its count and the first rows.
+        """
+        lines = []
+
+        for report_key, _, _, label in SECTION_PARSERS.values():
+            report = self.reports.get(report_key)
+            if not report:
+                continue
+
+            mismatches = report["counters"].get("chance_sum_mismatch", 0)
+            chance_sum_counts = {CHANCE_SUM_REASON: mismatches} if mismatches else {}
+
+            for kind, counts in (
+                ("errors", report["error_counts"]),
+                ("warnings", report["warning_counts"]),
+                ("chance_sums", chance_sum_counts),
+            ):
+                for reason, count in counts.items():
+                    rows = [
+                        str(entry["index"])
+                        for entry in report[kind]
+                        if entry["reason"] == reason
+                    ][:max_rows]
+                    lines.append(
+                        f"{label} - {reason}: {count} (rows {', '.join(rows)})"
+                    )
+
+        return "\n".join(lines)
+
     def save_parsed_data(self) -> str:
         """Save parsed data to file"""
-        data = {
+        data = {**self.parsed_data_header(), "drops": self.all_drops}
+
+        with span("save_parsed_data", rows=len(self.all_drops)) as save_span:
+            with open(PARSED_DATA_FILE, "w") as f:
+                json.dump(data, f, indent=2, default=drop_to_json)
+                save_span.set(bytes_written=f.tell())
+
+        return f'\n✓ Saved {row_count(self.all_drops)} drops to "{PARSED_DATA_FILE}"'
+
+    def parsed_data_header(self) -> dict:
+        """Metadata stored with the parsed drops"""
+        return {
             "source": "WarframeDropOrchestrator",
             "parsed_at": self.parsed_at.isoformat(),
-            "drops": self.all_drops,
+            "source_hash": self.source_hash,
         }
-
-        with open(PARSED_DATA_FILE, "w") as f:
-            json.dump(data, f, indent=2)
-
-        return f'\n✓ Saved {len(self.all_drops)} drops to "{PARSED_DATA_FILE}"'
@@ -1,544 +1,156 @@
 import re
 
 from parsers.base_parser import BaseDropParser
-
-
-class CetusBountyDropParser(BaseDropParser):
-    def __init__(self, soup):
-        super().__init__(soup)
-
-        self.cetus_bounty_drops = []
-
-        self.cetus_bounty_name = None
-        self.cetus_bounty_level = None
-        self.cetus_bounty_rotation = None
-        self.cetus_bounty_stage = None
-
-    def parse(self):
-        source_type, cetus_bounty_table = self._parse_header("cetusRewards")
-        source_type = "Bounties"
-
-        if not cetus_bounty_table:
-            return [], None
-
-        for row in cetus_bounty_table.find_all("tr"):
-            th_cells = row.find_all("th")
-            td_cells = row.find_all("td")
-
-            # -------------------------
-            # CONTEXT ROWS (headers)
-            # -------------------------
-            if th_cells:
-                text = th_cells[0].text.strip()
-                lowered = text.lower()
-
-                # ---- Bounty name and level header ----
-                if lowered.startswith("level"):
-                    match = re.match(r"(Level\s+[\d\s\-]+)\s+(.*)", text)
-
-                    if match:
-                        bounty_name = match.group(2).strip()
-                        bounty_level = match.group(1).strip()
-
-                        self.cetus_bounty_name = self.normalize_text(bounty_name)
-                        self.cetus_bounty_level = self.normalize_text(bounty_level)
-
-                    continue
-
-                # ---- Rotation header ----
-                if lowered.startswith("rotation"):
-                    self.cetus_bounty_rotation = self.normalize_text(text.split()[-1])
-                    continue
-
-                # ---- Stage header ----
-                if lowered.startswith("stage") or lowered.startswith("final"):
-                    self.cetus_bounty_stage = self.normalize_text(text)
-                    continue
-
-            # -------------------------
-            # DROP ROWS
-            # -------------------------
-            elif len(td_cells) >= 3:
-                item_name = td_cells[1].text
-                item_name = self.normalize_text(item_name)
-
-                chance_text = td_cells[2].text.strip()
-
-                rarity, chance_number = self._parse_chance_text(chance_text)
-
-                drop = {
-                    "item": item_name,
-                    "source_type": source_type,
-                    "planet_name": "Earth",
-                    "mission_name": "Cetus",
-                    "bounty_name": self.cetus_bounty_name,
-                    "bounty_level": self.cetus_bounty_level,
-                    "rarity": rarity,
-                    "chance": chance_number,
-                    "rotation": self.cetus_bounty_rotation,
-                    "stage": self.cetus_bounty_stage,
-                }
-
-                self.cetus_bounty_drops.append(drop)
-
-        report = self.verify_data(self.cetus_bounty_drops)
-
-        return self.cetus_bounty_drops, report
-
-
-class SolarisBountyDropParser(BaseDropParser):  # Orb Vallis
-    def __init__(self, soup):
-        super().__init__(soup)
-
-        self.solaris_bounty_drops = []
-
-        self.solaris_bounty_name = None
-        self.solaris_bounty_level = None
-        self.solaris_bounty_rotation = None
-        self.solaris_bounty_stage = None
-
-    def parse(self):
-        source_type, solaris_bounty_table = self._parse_header("solarisRewards")
-        source_type = "Bounties"
-
-        if not solaris_bounty_table:
-            return [], None
-
-        for row in solaris_bounty_table.find_all("tr"):
-            th_cells = row.find_all("th")
-            td_cells = row.find_all("td")
-
-            # -------------------------
-            # CONTEXT ROWS (headers)
-            # -------------------------
-            if th_cells:
-                text = th_cells[0].text.strip()
-                lowered = text.lower()
-
-                # ---- Bounty name and level header ----
-                if lowered.startswith("level"):
-                    match = re.match(r"(Level\s+[\d\s\-]+)\s+(.*)", text)
-
-                    if match:
-                        bounty_name = match.group(2).strip()
-                        bounty_level = match.group(1).strip()
-
-                        self.solaris_bounty_name = self.normalize_text(bounty_name)
-                        self.solaris_bounty_level = self.normalize_text(bounty_level)
-
-                    continue
-
-                # ---- Rotation header ----
-                if lowered.startswith("rotation"):
-                    self.solaris_bounty_rotation = self.normalize_text(text.split()[-1])
-                    continue
-
-                # ---- Stage header ----
-                if lowered.startswith("stage") or lowered.startswith("final"):
-                    self.solaris_bounty_stage = self.normalize_text(text)
-                    continue
-
-            # -------------------------
-            # DROP ROWS
-            # -------------------------
-            elif len(td_cells) >= 3:
-                item_name = td_cells[1].text
-                item_name = self.normalize_text(item_name)
-
-                chance_text = td_cells[2].text.strip()
-
-                rarity, chance_number = self._parse_chance_text(chance_text)
-
-                drop = {
-                    "item": item_name,
-                    "source_type": source_type,
-                    "planet_name": "Venus",
-                    "mission_name": "Fortuna",
-                    "bounty_name": self.solaris_bounty_name,
-                    "bounty_level": self.solaris_bounty_level,
-                    "rarity": rarity,
-                    "chance": chance_number,
-                    "rotation": self.solaris_bounty_rotation,
-                    "stage": self.solaris_bounty_stage,
-                }
-
-                self.solaris_bounty_drops.append(drop)
-
-        report = self.verify_data(self.solaris_bounty_drops)
-
-        return self.solaris_bounty_drops, report
-
-
-class DeimosBountyDropParser(BaseDropParser):  # Cambion Drift
-    def __init__(self, soup):
-        super().__init__(soup)
-
-        self.deimos_bounty_drops = []
-
-        self.deimos_bounty_name = None
-        self.deimos_bounty_level = None
-        self.deimos_bounty_rotation = None
-        self.deimos_bounty_stage = None
-
-    def parse(self):
-        source_type, deimos_bounty_table = self._parse_header("deimosRewards")
-        source_type = "Bounties"
-
-        if not deimos_bounty_table:
-            return [], None
-
-        for row in deimos_bounty_table.find_all("tr"):
-            th_cells = row.find_all("th")
-            td_cells = row.find_all("td")
-
-            # -------------------------
-            # CONTEXT ROWS (headers)
-            # -------------------------
-            if th_cells:
-                text = th_cells[0].text.strip()
-                lowered = text.lower()
-
-                # ---- Bounty name and level header ----
-                if lowered.startswith("level"):
-                    match = re.match(r"(Level\s+[\d\s\-]+)\s+(.*)", text)
-
-                    if match:
-                        bounty_name = match.group(2).strip()
-                        bounty_level = match.group(1).strip()
-
-                        self.deimos_bounty_name = self.normalize_text(bounty_name)
-                        self.deimos_bounty_level = self.normalize_text(bounty_level)
-
-                    continue
-
-                # ---- Rotation header ----
-                if lowered.startswith("rotation"):
-                    self.deimos_bounty_rotation = self.normalize_text(text.split()[-1])
-                    continue
-
-                # ---- Stage header ----
-                if lowered.startswith("stage") or lowered.startswith("final"):
-                    self.deimos_bounty_stage = self.normalize_text(text)
-                    continue
-
-            # -------------------------
-            # DROP ROWS
-            # -------------------------
-            elif len(td_cells) >= 3:
-                item_name = td_cells[1].text
-                item_name = self.normalize_text(item_name)
-
-                chance_text = td_cells[2].text.strip()
-
-                rarity, chance_number = self._parse_chance_text(chance_text)
-
-                drop = {
-                    "item": item_name,
-                    "source_type": source_type,
-                    "planet_name": "Deimos",
-                    "mission_name": "Necralisk",
-                    "bounty_name": self.deimos_bounty_name,
-                    "bounty_level": self.deimos_bounty_level,
-                    "rarity": rarity,
-                    "chance": chance_number,
-                    "rotation": self.deimos_bounty_rotation,
-                    "stage": self.deimos_bounty_stage,
-                }
-
-                self.deimos_bounty_drops.append(drop)
-
-        report = self.verify_data(self.deimos_bounty_drops)
-
-        return self.deimos_bounty_drops, report
-
-
-class ZarimanBountyDropParser(BaseDropParser):
-    def __init__(self, soup):
-        super().__init__(soup)
-
-        self.zariman_bounty_drops = []
-
-        self.zariman_bounty_name = None
-        self.zariman_bounty_level = None
-        self.zariman_bounty_rotation = None
-        self.zariman_bounty_stage = None
-
-    def parse(self):
-        source_type, zariman_bounty_table = self._parse_header("zarimanRewards")
-        source_type = "Bounties"
-
-        if not zariman_bounty_table:
-            return [], None
-
-        for row in zariman_bounty_table.find_all("tr"):
-            th_cells = row.find_all("th")
-            td_cells = row.find_all("td")
-
-            # -------------------------
-            # CONTEXT ROWS (headers)
-            # -------------------------
-            if th_cells:
-                text = th_cells[0].text.strip()
-                lowered = text.lower()
-
-                # ---- Bounty name and level header ----
-                if lowered.startswith("level"):
-                    match = re.match(r"(Level\s+[\d\s\-]+)\s+(.*)", text)
-
-                    if match:
-                        bounty_name = match.group(2).strip()
-                        bounty_level = match.group(1).strip()
-
-                        self.zariman_bounty_name = self.normalize_text(bounty_name)
-                        self.zariman_bounty_level = self.normalize_text(bounty_level)
-
-                    continue
-
-                # ---- Rotation header ----
-                if lowered.startswith("rotation"):
-                    self.zariman_bounty_rotation = self.normalize_text(text.split()[-1])
-                    continue
-
-                # ---- Stage header ----
-                if lowered.startswith("stage") or lowered.startswith("final"):
-                    self.zariman_bounty_stage = self.normalize_text(text)
-                    continue
-
-            # -------------------------
-            # DROP ROWS
-            # -------------------------
-            elif len(td_cells) >= 3:
-                item_name = td_cells[1].text
-                item_name = self.normalize_text(item_name)
-
-                chance_text = td_cells[2].text.strip()
-
-                rarity, chance_number = self._parse_chance_text(chance_text)
-
-                if self.zariman_bounty_rotation:
-                    drop = {
-                        "item": item_name,
-                        "source_type": source_type,
-                        "planet_name": "Zariman",
-                        "mission_name": "Chrysalith",
-                        "bounty_name": self.zariman_bounty_name,
-                        "bounty_level": self.zariman_bounty_level,
-                        "rarity": rarity,
-                        "chance": chance_number,
-                        "rotation": self.zariman_bounty_rotation,
-                        "stage": self.zariman_bounty_stage,
-                    }
-                else:
-                    drop = {
-                        "item": item_name,
-                        "source_type": source_type,
-                        "planet_name": "Zariman",
-                        "mission_name": "Chrysalith",
-                        "bounty_name": self.zariman_bounty_name,
-                        "bounty_level": self.zariman_bounty_level,
-                        "rarity": rarity,
-                        "chance": chance_number,
-                        "stage": self.zariman_bounty_stage,
-                    }
-
-                self.zariman_bounty_drops.append(drop)
-
-        report = self.verify_data(self.zariman_bounty_drops)
-
-        return self.zariman_bounty_drops, report
-
-
-class EntratiLabDropParser(BaseDropParser):  # Albrecht's Laboratories
-    def __init__(self, soup):
-        super().__init__(soup)
-
-        self.entrati_lab_bounty_drops = []
-
-        self.entrati_lab_bounty_name = None
-        self.entrati_lab_bounty_level = None
-        self.entrati_lab_bounty_rotation = None
-        self.entrati_lab_bounty_stage = None
-
-    def parse(self):
-        source_type, entrati_lab_bounty_table = self._parse_header("entratiLabRewards")
-        source_type = "Bounties"
-
-        if not entrati_lab_bounty_table:
-            return [], None
-
-        for row in entrati_lab_bounty_table.find_all("tr"):
-            th_cells = row.find_all("th")
-            td_cells = row.find_all("td")
-
-            # -------------------------
-            # CONTEXT ROWS (headers)
-            # -------------------------
-            if th_cells:
-                text = th_cells[0].text.strip()
-                lowered = text.lower()
-
-                # ---- Bounty name and level header ----
-                if lowered.startswith("level"):
-                    match = re.match(r"(Level\s+[\d\s\-]+)\s+(.*)", text)
-
-                    if match:
-                        bounty_name = match.group(2).strip()
-                        bounty_level = match.group(1).strip()
-
-                        self.entrati_lab_bounty_name = self.normalize_text(bounty_name)
-                        self.entrati_lab_bounty_level = self.normalize_text(
-                            bounty_level
-                        )
-
-                    continue
-
-                # ---- Rotation header ----
-                if lowered.startswith("rotation"):
-                    self.entrati_lab_bounty_rotation = self.normalize_text(
-                        text.split()[-1]
-                    )
-                    continue
-
-                # ---- Stage header ----
-                if lowered.startswith("stage") or lowered.startswith("final"):
-                    self.entrati_lab_bounty_stage = self.normalize_text(text)
-                    continue
-
-            # -------------------------
-            # DROP ROWS
-            # -------------------------
-            elif len(td_cells) >= 3:
-                item_name = td_cells[1].text
-                item_name = self.normalize_text(item_name)
-
-                chance_text = td_cells[2].text.strip()
-
-                rarity, chance_number = self._parse_chance_text(chance_text)
-
-                if self.entrati_lab_bounty_rotation:
-                    drop = {
-                        "item": item_name,
-                        "source_type": source_type,
-                        "planet_name": "Deimos",
-                        "mission_name": "Sanctum Anatomica",
-                        "bounty_name": self.entrati_lab_bounty_name,
-                        "bounty_level": self.entrati_lab_bounty_level,
-                        "rarity": rarity,
-                        "chance": chance_number,
-                        "rotation": self.entrati_lab_bounty_rotation,
-                        "stage": self.entrati_lab_bounty_stage,
-                    }
-                else:
-                    drop = {
-                        "item": item_name,
-                        "source_type": source_type,
-                        "planet_name": "Deimos",
-                        "mission_name": "Sanctum Anatomica",
-                        "bounty_name": self.entrati_lab_bounty_name,
-                        "bounty_level": self.entrati_lab_bounty_level,
-                        "rarity": rarity,
-                        "chance": chance_number,
-                        "stage": self.entrati_lab_bounty_stage,
-                    }
-
-                self.entrati_lab_bounty_drops.append(drop)
-
-        report = self.verify_data(self.entrati_lab_bounty_drops)
-
-        return self.entrati_lab_bounty_drops, report
-
-
-class HexBountyDropParser(BaseDropParser):
-    def __init__(self, soup):
-        super().__init__(soup)
-
-        self.hex_bounty_drops = []
-
-        self.hex_bounty_name = None
-        self.hex_bounty_level = None
-        self.hex_bounty_rotation = None
-        self.hex_bounty_stage = None
-
-    def parse(self):
-        source_type, hex_bounty_table = self._parse_header("hexRewards")
-        source_type = "Bounties"
-
-        if not hex_bounty_table:
-            return [], None
-
-        for row in hex_bounty_table.find_all("tr"):
-            th_cells = row.find_all("th")
-            td_cells = row.find_all("td")
-
-            # -------------------------
-            # CONTEXT ROWS (headers)
-            # -------------------------
-            if th_cells:
-                text = th_cells[0].text.strip()
-                lowered = text.lower()
-
-                # ---- Bounty name and level header ----
-                if lowered.startswith("level"):
-                    match = re.match(r"(Level\s+[\d\s\-]+)\s+(.*)", text)
-
-                    if match:
-                        bounty_name = match.group(2).strip()
-                        bounty_level = match.group(1).strip()
-
-                        self.hex_bounty_name = self.normalize_text(bounty_name)
-                        self.hex_bounty_level = self.normalize_text(bounty_level)
-
-                    continue
-
-                # ---- Rotation header ----
-                if lowered.startswith("rotation"):
-                    self.hex_bounty_rotation = self.normalize_text(text.split()[-1])
-                    continue
-
-                # ---- Stage header ----
-                if lowered.startswith("stage") or lowered.startswith("final"):
-                    self.hex_bounty_stage = self.normalize_text(text)
-                    continue
-
-            # -------------------------
-            # DROP ROWS
-            # -------------------------
-            elif len(td_cells) >= 3:
-                item_name = td_cells[1].text
-                item_name = self.normalize_text(item_name)
-
-                chance_text = td_cells[2].text.strip()
-
-                rarity, chance_number = self._parse_chance_text(chance_text)
-
-                if self.hex_bounty_rotation:
-                    drop = {
-                        "item": item_name,
-                        "source_type": source_type,
-                        "planet_name": "Höllvania",  # TODO needs checking in game
-                        "mission_name": "Höllvania Central Mall",  # TODO needs checking in game
-                        "bounty_name": self.hex_bounty_name,
-                        "bounty_level": self.hex_bounty_level,
-                        "rarity": rarity,
-                        "chance": chance_number,
-                        "rotation": self.hex_bounty_rotation,
-                        "stage": self.hex_bounty_stage,
-                    }
-                else:
-                    drop = {
-                        "item": item_name,
-                        "source_type": source_type,
-                        "planet_name": "Höllvania",  # TODO needs checking in game
-                        "mission_name": "Höllvania Central Mall",  # TODO needs checking in game
-                        "bounty_name": self.hex_bounty_name,
-                        "bounty_level": self.hex_bounty_level,
-                        "rarity": rarity,
-                        "chance": chance_number,
-                        "stage": self.hex_bounty_stage,
-                    }
-
-                self.hex_bounty_drops.append(drop)
-
-        report = self.verify_data(self.hex_bounty_drops)
-
-        return self.hex_bounty_drops, report
+from parsers.drop_records import MISSING, BountyDrop
+
+# Bounty hubs, in parse order. Adding a hub only takes a line here:
+# <h3 id> -> (section name, display name, planet name, hub (mission) name,
+#             always rotation, JSON drop-dump key)
+# Hubs without "always rotation" only give drops a rotation when their table
+# has rotation headers, the drops of the others always have the field
+BOUNTY_HUBS = {
+    "cetusRewards": (
+        "cetus",
+        "Cetus",
+        "Earth",
+        "Cetus",
+        True,
+        "cetusBountyRewards",
+    ),
+    "solarisRewards": (
+        "solaris",
+        "Orb Vallis",
+        "Venus",
+        "Fortuna",
+        True,
+        "solarisBountyRewards",
+    ),
+    "deimosRewards": (
+        "deimos",
+        "Cambion Drift",
+        "Deimos",
+        "Necralisk",
+        True,
+        "deimosRewards",
+    ),
+    "zarimanRewards": (
+        "zariman",
+        "Zariman",
+        "Zariman",
+        "Chrysalith",
+        False,
+        "zarimanRewards",
+    ),
+    "entratiLabRewards": (
+        "entrati_lab",
+        "Albrecht's Laboratories",
+        "Deimos",
+        "Sanctum Anatomica",
+        False,
+        "entratiLabRewards",
+    ),
+    "hexRewards": (
+        "hex",
+        "Hex",
+        "Höllvania",  # TODO needs checking in game
+        "Höllvania Central Mall",  # TODO needs checking in game
+        False,
+        "hexRewards",
+    ),
+}
+
+# "Level 5 - 15 Cetus Bounty" -> level, bounty name
+BOUNTY_LEVEL_PATTERN = re.compile(r"(Level\s+[\d\s\-]+)\s+(.*)")
+# Kind of a header row, the group that matched is its lastgroup
+HEADER_PATTERN = re.compile(
+    r"(?P<level>level)|(?P<rotation>rotation)|(?P<stage>stage|final)", re.I
+)
+
+
+class BountyDropParser(BaseDropParser):
+    """
+    Parser for the bounty reward tables of every hub
+
+    All hubs share one table layout, what differs (location, rotations) comes
+    from the hub's BOUNTY_HUBS entry.
+    """
+
+    def __init__(self, document, section_id):
+        super().__init__(document)
+
+        self.section_id = section_id
+        _, _, self.planet_name, self.mission_name, self.always_rotation, _ = (
+            BOUNTY_HUBS[section_id]
+        )
+
+        self.bounty_drops = []
+
+        self.bounty_name = None
+        self.bounty_level = None
+        self.bounty_rotation = None
+        self.bounty_stage = None
+
+    def start_section(self, source_type):
+        self.source_type = "Bounties"
+        return True
+
+    # -------------------------
+    # CONTEXT ROWS (headers)
+    # -------------------------
+    def parse_context_row(self, text):
+        header = HEADER_PATTERN.match(text)
+        if header is None:
+            return
+
+        kind = header.lastgroup
+
+        # ---- Bounty name and level header ----
+        if kind == "level":
+            match = BOUNTY_LEVEL_PATTERN.match(text)
+
+            if match:
+                self.bounty_name = self.normalize_text(match.group(2).strip())
+                self.bounty_level = self.normalize_text(match.group(1).strip())
+
+        # ---- Rotation header ----
+        elif kind == "rotation":
+            self.bounty_rotation = self.normalize_text(text.split()[-1])
+
+        # ---- Stage header ----
+        else:
+            self.bounty_stage = self.normalize_text(text)
+
+    # -------------------------
+    # DROP ROWS
+    # -------------------------
+    def parse_drop_row(self, cells):
+        if len(cells) < 3:
+            return
+
+        item_name = self.normalize_text(cells[1])
+
+        rarity, chance_number = self._parse_chance_text(cells[2].strip())
+
+        rotation = self.bounty_rotation
+        if not self.always_rotation and not rotation:
+            rotation = MISSING
+
+        drop = BountyDrop(
+            item=item_name,
+            source_type=self.source_type,
+            planet_name=self.planet_name,
+            mission_name=self.mission_name,
+            bounty_name=self.bounty_name,
+            bounty_level=self.bounty_level,
+            rarity=rarity,
+            chance=chance_number,
+            rotation=rotation,
+            stage=self.bounty_stage,
+        )
+
+        self.add_drop(self.bounty_drops, drop)
+
+    def finish_section(self):
+        report = self.verify_data(self.bounty_drops, self.drop_tables)
+
+        return self.bounty_drops, report
@@ -0,0 +1,417 @@
+"""
+Drop records
+
+Parsers emit one slotted record per drop instead of a dict: a third of the
+memory, and hot paths (indexing, validation, sorting) read attributes
+(drop.item) instead of hashing keys. Records still read like the dicts they
+replace - drop["item"], drop.get("rotation"), "rotation" in drop, dict(drop)
+- so display code doesn't have to know the difference. They are immutable:
+there is no __setitem__ and assigning or deleting an attribute raises.
+
+Relic sections list every reward once per refinement, they are folded into
+one RelicRewards per relic reward holding the four chances (see
+fold_relic_drops), expand_drops() turns them back into table rows.
+"""
+
+from operator import attrgetter
+
+
+class _Missing:
+    """Sentinel type, pickles as a reference so it stays a singleton"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "MISSING"
+
+    def __reduce__(self):
+        return "MISSING"
+
+
+# Stands in for fields a drop doesn't have (e.g. optional rotation)
+MISSING = _Missing()
+
+# Records can't be assigned to, constructors fill their slots with this
+_set = object.__setattr__
+
+
+class DropRecord:
+    """
+    Base of the drop records
+
+    Subclasses list their fields in __slots__, in the order they are written
+    out. Optional fields hold MISSING when a drop doesn't have them and then
+    act like an absent key.
+    """
+
+    __slots__ = ()
+
+    # Fields that may hold MISSING
+    optional_fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.__slots__)
+        # Every field value as a tuple, in __slots__ order
+        cls._values = attrgetter(*cls.__slots__)
+
+    # === Dict-compatible access ===
+    def __getitem__(self, field):
+        value = getattr(self, field) if field in self._field_set else MISSING
+        if value is MISSING:
+            raise KeyError(field)
+
+        return value
+
+    def get(self, field, default=None):
+        if field in self._field_set:
+            value = getattr(self, field)
+            if value is not MISSING:
+                return value
+
+        return default
+
+    def __contains__(self, field):
+        return field in self._field_set and getattr(self, field) is not MISSING
+
+    def keys(self) -> list[str]:
+        return [
+            field for field in self.__slots__ if getattr(self, field) is not MISSING
+        ]
+
+    def values(self) -> list:
+        return list(self.copy().values())
+
+    def items(self) -> list[tuple]:
+        return list(self.copy().items())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def copy(self) -> dict:
+        """The drop as a plain dict, like dict.copy()"""
+        return {
+            field: value
+            for field in self.__slots__
+            if (value := getattr(self, field)) is not MISSING
+        }
+
+    def __eq__(self, other):
+        if isinstance(other, DropRecord):
+            return self.copy() == other.copy()
+        if isinstance(other, dict):
+            return self.copy() == other
+
+        return NotImplemented
+
+    __hash__ = None
+
+    # === Immutability ===
+    # Records are shared by the index lists and the section cache, a change
+    # to one would show up everywhere
+    def __setattr__(self, field, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, field):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.copy()!r})"
+
+    def __reduce__(self):
+        return type(self), self._values(self)
+
+
+class MissionDrop(DropRecord):
+    """Drop of a mission node, rotation only on rotation missions"""
+
+    __slots__ = (
+        "item",
+        "source_type",
+        "mission_mode",
+        "planet_name",
+        "mission_name",
+        "mission_type",
+        "rarity",
+        "chance",
+        "rotation",
+    )
+    optional_fields = ("rotation",)
+
+    def __init__(
+        self,
+        item,
+        source_type,
+        mission_mode,
+        planet_name,
+        mission_name,
+        mission_type,
+        rarity,
+        chance,
+        rotation=MISSING,
+    ):
+        _set(self, "item", item)
+        _set(self, "source_type", source_type)
+        _set(self, "mission_mode", mission_mode)
+        _set(self, "planet_name", planet_name)
+        _set(self, "mission_name", mission_name)
+        _set(self, "mission_type", mission_type)
+        _set(self, "rarity", rarity)
+        _set(self, "chance", chance)
+        _set(self, "rotation", rotation)
+
+
+class RelicDrop(DropRecord):
+    """Drop of a relic at one refinement"""
+
+    __slots__ = (
+        "item",
+        "source_type",
+        "rarity",
+        "chance",
+        "relic_tier",
+        "relic_name",
+        "relic_refinement",
+    )
+
+    def __init__(
+        self,
+        item,
+        source_type,
+        rarity,
+        chance,
+        relic_tier,
+        relic_name,
+        relic_refinement,
+    ):
+        _set(self, "item", item)
+        _set(self, "source_type", source_type)
+        _set(self, "rarity", rarity)
+        _set(self, "chance", chance)
+        _set(self, "relic_tier", relic_tier)
+        _set(self, "relic_name", relic_name)
+        _set(self, "relic_refinement", relic_refinement)
+
+
+# Relic refinements, in the order of RelicRewards.chances
+REFINEMENTS = ("Intact", "Exceptional", "Flawless", "Radiant")
+REFINEMENT_INDEXES = {refinement: index for index, refinement in enumerate(REFINEMENTS)}
+
+
+class RelicRewards(DropRecord):
+    """
+    Reward of a relic at every refinement
+
+    The drop tables list every relic once per refinement with the same
+    rewards, only the chances differ. chances holds them in REFINEMENTS order,
+    None where the relic isn't listed at that refinement. expand() gives the
+    RelicDrop rows of the tables.
+    """
+
+    __slots__ = (
+        "item",
+        "source_type",
+        "rarity",
+        "relic_tier",
+        "relic_name",
+        "chances",
+    )
+
+    def __init__(self, item, source_type, rarity, relic_tier, relic_name, chances):
+        _set(self, "item", item)
+        _set(self, "source_type", source_type)
+        _set(self, "rarity", rarity)
+        _set(self, "relic_tier", relic_tier)
+        _set(self, "relic_name", relic_name)
+        _set(self, "chances", tuple(chances))
+
+    def chance_at(self, refinement: str) -> float | None:
+        """Chance at a refinement, None if the relic isn't listed at it"""
+        return self.chances[REFINEMENT_INDEXES[refinement]]
+
+    def expand(self) -> list[RelicDrop]:
+        """One RelicDrop per listed refinement"""
+        item, source_type, rarity = self.item, self.source_type, self.rarity
+        relic_tier, relic_name = self.relic_tier, self.relic_name
+
+        # Positional, runs for every relic of every search result
+        return [
+            RelicDrop(
+                item, source_type, rarity, chance, relic_tier, relic_name, refinement
+            )
+            for refinement, chance in zip(REFINEMENTS, self.chances)
+            if chance is not None
+        ]
+
+
+def fold_relic_drops(drops: list[RelicDrop]) -> list[DropRecord]:
+    """
+    RelicRewards of a relic section's drops, in the order rewards first show up
+
+    Drops that don't fit a chance vector are kept as they are: unknown or
+    missing refinement, missing chance, or a reward listed twice in one table.
+    A reward whose rarity changes between refinements gets one RelicRewards
+    per rarity.
+    """
+    folded = []
+    chances_of = {}  # (relic tier, relic name, item, rarity) -> chance slots
+
+    for drop in drops:
+        index = REFINEMENT_INDEXES.get(drop.relic_refinement)
+        if index is None or drop.chance is None:
+            folded.append(drop)
+            continue
+
+        key = (drop.relic_tier, drop.relic_name, drop.item, drop.rarity)
+        chances = chances_of.get(key)
+        if chances is None:
+            chances = chances_of[key] = [None] * len(REFINEMENTS)
+            folded.append((drop, chances))
+        elif chances[index] is not None:
+            folded.append(drop)
+            continue
+
+        chances[index] = drop.chance
+
+    return [
+        (
+            RelicRewards(
+                item=entry[0].item,
+                source_type=entry[0].source_type,
+                rarity=entry[0].rarity,
+                relic_tier=entry[0].relic_tier,
+                relic_name=entry[0].relic_name,
+                chances=entry[1],
+            )
+            if isinstance(entry, tuple)
+            else entry
+        )
+        for entry in folded
+    ]
+
+
+def expand_drops(drops):
+    """Drops as table rows, RelicRewards expanded to one RelicDrop per refinement"""
+    for drop in drops:
+        if isinstance(drop, RelicRewards):
+            yield from drop.expand()
+        else:
+            yield drop
+
+
+def row_count(drops) -> int:
+    """Number of table rows of drops, what expand_drops() would yield"""
+    return sum(
+        (
+            len(REFINEMENTS) - drop.chances.count(None)
+            if isinstance(drop, RelicRewards)
+            else 1
+        )
+        for drop in drops
+    )
+
+
+class LocationDrop(DropRecord):
+    """Drop of a named reward table (sorties, dynamic location rewards)"""
+
+    __slots__ = ("item", "source_type", "mission_name", "rarity", "chance", "rotation")
+    optional_fields = ("rotation",)
+
+    def __init__(
+        self, item, source_type, mission_name, rarity, chance, rotation=MISSING
+    ):
+        _set(self, "item", item)
+        _set(self, "source_type", source_type)
+        _set(self, "mission_name", mission_name)
+        _set(self, "rarity", rarity)
+        _set(self, "chance", chance)
+        _set(self, "rotation", rotation)
+
+
+class BountyDrop(DropRecord):
+    """Drop of a bounty stage, rotation only on hubs that have rotations"""
+
+    __slots__ = (
+        "item",
+        "source_type",
+        "planet_name",
+        "mission_name",
+        "bounty_name",
+        "bounty_level",
+        "rarity",
+        "chance",
+        "rotation",
+        "stage",
+    )
+    optional_fields = ("rotation",)
+
+    def __init__(
+        self,
+        item,
+        source_type,
+        planet_name,
+        mission_name,
+        bounty_name,
+        bounty_level,
+        rarity,
+        chance,
+        rotation=MISSING,
+        stage=None,
+    ):
+        _set(self, "item", item)
+        _set(self, "source_type", source_type)
+        _set(self, "planet_name", planet_name)
+        _set(self, "mission_name", mission_name)
+        _set(self, "bounty_name", bounty_name)
+        _set(self, "bounty_level", bounty_level)
+        _set(self, "rarity", rarity)
+        _set(self, "chance", chance)
+        _set(self, "rotation", rotation)
+        _set(self, "stage", stage)
+
+
+# Fields a drop always has (optional ones left out) -> record type
+RECORD_TYPES = {
+    frozenset(record_type.__slots__).difference(record_type.optional_fields): (
+        record_type
+    )
+    for record_type in (MissionDrop, RelicDrop, RelicRewards, LocationDrop, BountyDrop)
+}
+
+OPTIONAL_FIELDS = frozenset(
+    field
+    for record_type in RECORD_TYPES.values()
+    for field in record_type.optional_fields
+)
+
+
+# Field names of a loaded drop, in file order -> record type
+_record_types_by_keys = {}
+
+
+def as_drop_record(drop) -> DropRecord:
+    """Record of a drop loaded as a dict (JSON files), records are returned as is"""
+    if isinstance(drop, DropRecord):
+        return drop
+
+    keys = tuple(drop)
+    record_type = _record_types_by_keys.get(keys)
+    if record_type is None:
+        record_type = RECORD_TYPES.get(frozenset(keys).difference(OPTIONAL_FIELDS))
+        if record_type is None:
+            raise ValueError(f"Unknown drop fields: {', '.join(drop)}")
+
+        _record_types_by_keys[keys] = record_type
+
+    return record_type(**drop)
+
+
+def drop_to_json(value):
+    """json.dump(default=...) hook writing records as plain objects"""
+    if isinstance(value, DropRecord):
+        return value.copy()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,274 @@
+"""
+HTML backends for the drop-table parsers
+
+Parsers never touch the tree library: a backend parses a section's markup
+and hands back an HtmlTable - the section header text and the cell texts of
+every row. "lxml" is C-backed and several times faster, "html.parser"
+(BeautifulSoup's built-in parser) needs no extra dependency. "scanner" reads
+the rows straight from the markup without building a tree, and falls back to
+a tree backend for any section it doesn't recognise.
+"""
+
+import html
+import re
+
+from bs4 import BeautifulSoup
+
+from config import HTML_BACKEND
+from utils.tracing import current_span
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+
+class HtmlTable:
+    """A drop table: the text of its <h3> header and of every <tr>"""
+
+    def __init__(self, title: str, rows: list[tuple[list[str], list[str]]]):
+        self.title = title
+        # (<th> texts, <td> texts) of every row, in page order
+        self.rows = rows
+
+
+class SoupDocument:
+    """Backend using BeautifulSoup with Python's built-in html.parser"""
+
+    def __init__(self, markup: bytes):
+        self.soup = BeautifulSoup(
+            markup.decode("utf-8", errors="replace"), "html.parser"
+        )
+
+    def find_table(self, section_id: str) -> HtmlTable | None:
+        """Table following <h3 id=section_id>, None if there is none"""
+        header = self.soup.find("h3", id=section_id)
+        if not header:
+            return None
+
+        table = header.find_next_sibling("table")
+        if not table:
+            return None
+
+        rows = []
+        for row in table.find_all("tr"):
+            th_cells = []
+            td_cells = []
+
+            for cell in row.children:
+                if cell.name == "th":
+                    th_cells.append(cell.text)
+                elif cell.name == "td":
+                    td_cells.append(cell.text)
+
+            rows.append((th_cells, td_cells))
+
+        return HtmlTable(header.text, rows)
+
+
+class LxmlDocument:
+    """Backend using lxml's C-backed HTML parser"""
+
+    def __init__(self, markup: bytes):
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+        self.root = lxml.html.document_fromstring(markup, parser=parser)
+
+    def find_table(self, section_id: str) -> HtmlTable | None:
+        """Table following <h3 id=section_id>, None if there is none"""
+        headers = self.root.xpath("//h3[@id=$id]", id=section_id)
+        if not headers:
+            return None
+
+        header = headers[0]
+
+        table = next(header.itersiblings("table"), None)
+        if table is None:
+            return None
+
+        rows = []
+        for row in table.iter("tr"):
+            th_cells = []
+            td_cells = []
+
+            for cell in row:
+                if cell.tag == "th":
+                    th_cells.append(cell.text_content())
+                elif cell.tag == "td":
+                    td_cells.append(cell.text_content())
+
+            rows.append((th_cells, td_cells))
+
+        return HtmlTable(header.text_content(), rows)
+
+
+class IrregularMarkup(Exception):
+    """The scanner met markup it can't read without a tree"""
+
+
+# <h3 ...> start tag, the id is looked up in its attributes
+H3_PATTERN = re.compile(r"<h3\b((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>", re.I)
+ID_PATTERN = re.compile(r"""\bid\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+
+ROW_PATTERN = re.compile(r"<tr\b[^>]*>(.*?)</tr\s*>", re.I | re.S)
+CELL_PATTERN = re.compile(r"<(t[hd])\b[^>]*>(.*?)</\1\s*>", re.I | re.S)
+
+# Allowed around rows and cells: whitespace, comments and row groups
+FILLER_PATTERN = re.compile(
+    r"(?:\s+|<!--.*?-->|</?(?:tbody|thead|tfoot)\b[^>]*>)*", re.I | re.S
+)
+# Structure inside text means nesting or unclosed tags, the scanner gives up
+STRUCTURE_PATTERN = re.compile(r"<(?:/?t[dhr]|/?table|h3|script|style)\b", re.I)
+
+COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.S)
+TAG_PATTERN = re.compile(r"</?[a-zA-Z][^>]*>")
+
+
+class ScannerDocument:
+    """
+    Backend reading rows with regular expressions instead of a tree
+
+    Drop tables are a plain <h3 id> followed by a <table> of <tr> rows of
+    <th>/<td> cells. Anything else (nested tables, unclosed cells or rows,
+    elements between the header and its table...) makes the section fall back
+    to the tree backend, so the scanner returns the rows that backend does.
+    The tree backends repair broken markup their own way: lxml closes a <td>
+    at the next cell like a browser, html.parser nests it and joins the texts.
+    """
+
+    def __init__(self, markup: bytes):
+        self.markup = markup
+        self.text = markup.decode("utf-8", errors="replace")
+
+    def find_table(self, section_id: str) -> HtmlTable | None:
+        """Table following <h3 id=section_id>, None if there is none"""
+        try:
+            return self._scan_table(section_id)
+        except IrregularMarkup as e:
+            backend = tree_backend()
+            current_span().set(fallback=backend, fallback_reason=str(e))
+
+            return HTML_BACKENDS[backend](self.markup).find_table(section_id)
+
+    def _scan_table(self, section_id: str) -> HtmlTable:
+        text = self.text
+
+        for header in H3_PATTERN.finditer(text):
+            id_match = ID_PATTERN.search(header.group(1))
+            if (
+                id_match
+                and html.unescape(next(filter(None, id_match.groups()), ""))
+                == section_id
+            ):
+                break
+        else:
+            raise IrregularMarkup("header not found")
+
+        title_end = text.find("</h3>", header.end())
+        if title_end == -1:
+            raise IrregularMarkup("unclosed header")
+        title = cell_text(text[header.end() : title_end])
+
+        # The table has to be the header's next element
+        table_start = text.find("<table", title_end)
+        if table_start == -1 or not FILLER_PATTERN.fullmatch(
+            text, title_end + len("</h3>"), table_start
+        ):
+            raise IrregularMarkup("no table right after the header")
+
+        body_start = text.find(">", table_start) + 1
+        body_end = text.find("</table>", body_start)
+        if body_start == 0 or body_end == -1:
+            raise IrregularMarkup("unclosed table")
+
+        rows = []
+        position = body_start
+
+        for row in ROW_PATTERN.finditer(text, body_start, body_end):
+            if not FILLER_PATTERN.fullmatch(text, position, row.start()):
+                raise IrregularMarkup("unexpected markup between rows")
+            position = row.end()
+
+            rows.append(scan_row(row.group(1)))
+
+        if not FILLER_PATTERN.fullmatch(text, position, body_end):
+            raise IrregularMarkup("unexpected markup between rows")
+
+        return HtmlTable(title, rows)
+
+
+def scan_row(row: str) -> tuple[list[str], list[str]]:
+    """(<th> texts, <td> texts) of a row's inner markup"""
+    th_cells = []
+    td_cells = []
+    position = 0
+
+    for cell in CELL_PATTERN.finditer(row):
+        if not FILLER_PATTERN.fullmatch(row, position, cell.start()):
+            raise IrregularMarkup("unexpected markup between cells")
+        position = cell.end()
+
+        if cell.group(1).lower() == "th":
+            th_cells.append(cell_text(cell.group(2)))
+        else:
+            td_cells.append(cell_text(cell.group(2)))
+
+    if not FILLER_PATTERN.fullmatch(row, position):
+        raise IrregularMarkup("unexpected markup between cells")
+
+    return th_cells, td_cells
+
+
+def cell_text(markup: str) -> str:
+    """Text of a cell's inner markup, like .text of the tree backends"""
+    if "<" in markup:
+        if STRUCTURE_PATTERN.search(markup):
+            raise IrregularMarkup("table markup inside a cell")
+
+        markup = TAG_PATTERN.sub("", COMMENT_PATTERN.sub("", markup))
+
+    if "&" in markup:
+        markup = html.unescape(markup)
+
+    return markup
+
+
+HTML_BACKENDS = {
+    "html.parser": SoupDocument,
+    "lxml": LxmlDocument,
+    "scanner": ScannerDocument,
+}
+
+
+def tree_backend() -> str:
+    """Fastest installed backend that builds a tree"""
+    return "lxml" if lxml is not None else "html.parser"
+
+
+def resolve_backend(backend: str | None = None) -> str:
+    """
+    Name of the backend to use (defaults to HTML_BACKEND), "auto" is the
+    scanner, falling back to lxml when it's installed
+    """
+    backend = backend or HTML_BACKEND
+
+    if backend == "auto":
+        return "scanner"
+
+    if backend not in HTML_BACKENDS:
+        raise ValueError(
+            f"Unknown HTML backend: {backend}. "
+            f"Choose from: auto, {', '.join(HTML_BACKENDS)}"
+        )
+
+    if backend == "lxml" and lxml is None:
+        raise ImportError(
+            'HTML backend "lxml" is not installed (pip install lxml), '
+            'use "auto" or "html.parser" instead'
+        )
+
+    return backend
+
+
+def parse_html(markup: bytes, backend: str | None = None):
+    """Parse a drop-table page or section with the given backend"""
+    return HTML_BACKENDS[resolve_backend(backend)](markup)
@@ -0,0 +1,257 @@
+from parsers.base_parser import DropCollector
+from parsers.bounty_parser import BOUNTY_HUBS, BOUNTY_LEVEL_PATTERN
+from parsers.drop_records import (
+    MISSING,
+    BountyDrop,
+    LocationDrop,
+    MissionDrop,
+    RelicDrop,
+    fold_relic_drops,
+)
+from utils.tracing import span
+
+
+class JsonDropParser(DropCollector):
+    """
+    Ingestion adapter for structured JSON drop dumps (warframestat drops
+    format, e.g. drops.warframestat.us/data/all.json)
+
+    Produces the same drop dicts and validation reports as the HTML parsers,
+    keyed by the HTML section id they replace, without building a DOM.
+    """
+
+    def __init__(self, data: dict):
+        super().__init__()
+
+        self.data = data
+
+    # === Shared Utilities ===
+
+    def _chance(self, reward: dict) -> float | None:
+        """JSON chances are percentages, drops store fractions"""
+        chance = reward.get("chance")
+        if chance is None:
+            return None
+
+        try:
+            return float(chance) / 100
+        except (TypeError, ValueError):
+            return None
+
+    def _rotations(self, rewards) -> list[tuple[str | None, list]]:
+        """Rewards are either a flat list or a {rotation: [...]} dict"""
+        if isinstance(rewards, dict):
+            return [
+                (self.normalize_text(rotation), items)
+                for rotation, items in rewards.items()
+            ]
+
+        return [(None, rewards or [])]
+
+    # === Sections ===
+
+    def parse_missions(self) -> tuple[list, dict | None]:
+        mission_drops = []
+
+        for planet_name, nodes in self.data.get("missionRewards", {}).items():
+            for node_name, node in nodes.items():
+                game_mode = node.get("gameMode")
+                lowered = f"{node_name} {game_mode}".lower()
+
+                # Same precedence as the HTML mission headers
+                if "conclave" in lowered:
+                    mission_mode = "CONCLAVE"
+                elif "recall" in lowered:
+                    mission_mode = "RECALL"
+                elif node.get("isEvent") or "event" in lowered:
+                    mission_mode = "EVENT"
+                else:
+                    mission_mode = "PVE"
+
+                mission_name = node_name
+                mission_type = game_mode
+
+                # Same handling as HTML headers like "Planet/Node: Details (Type)"
+                if ":" in node_name:
+                    mission_name, mission_details = node_name.split(":", 1)
+                    mission_details = mission_details.strip()
+
+                    if mission_details and mission_type:
+                        mission_type = f"{mission_details} {mission_type}"
+                    elif mission_details:
+                        mission_type = mission_details
+
+                for rotation, rewards in self._rotations(node.get("rewards")):
+                    self.start_table()
+
+                    for reward in rewards:
+                        drop = MissionDrop(
+                            item=self.normalize_text(reward.get("itemName")),
+                            source_type="Missions",
+                            mission_mode=mission_mode,
+                            planet_name=self.normalize_text(planet_name),
+                            mission_name=self.normalize_text(mission_name),
+                            mission_type=self.normalize_text(mission_type),
+                            rarity=self.normalize_text(reward.get("rarity")),
+                            chance=self._chance(reward),
+                            # Rotation is optional -> include only if present
+                            rotation=MISSING if rotation is None else rotation,
+                        )
+
+                        self.add_drop(mission_drops, drop)
+
+        filtered_mission_drops = self.filter_active_content(mission_drops)
+
+        return filtered_mission_drops, self.verify_data(
+            filtered_mission_drops, self.drop_tables
+        )
+
+    def parse_relics(self) -> tuple[list, dict | None]:
+        relic_drops = []
+
+        for relic in self.data.get("relics", []):
+            self.start_table()
+
+            for reward in relic.get("rewards", []):
+                drop = RelicDrop(
+                    item=self.normalize_text(reward.get("itemName")),
+                    source_type="Relics",
+                    rarity=self.normalize_text(reward.get("rarity")),
+                    chance=self._chance(reward),
+                    relic_tier=self.normalize_text(relic.get("tier")),
+                    relic_name=self.normalize_text(relic.get("relicName")),
+                    relic_refinement=self.normalize_text(relic.get("state")),
+                )
+
+                self.add_drop(relic_drops, drop)
+
+        report = self.verify_data(relic_drops, self.drop_tables)
+
+        return fold_relic_drops(relic_drops), report
+
+    def parse_sorties(self) -> tuple[list, dict | None]:
+        sortie_drops = []
+
+        for reward in self.data.get("sortieRewards", []):
+            drop = LocationDrop(
+                item=self.normalize_text(reward.get("itemName")),
+                source_type="Sorties",
+                mission_name="Sortie",
+                rarity=self.normalize_text(reward.get("rarity")),
+                chance=self._chance(reward),
+            )
+
+            self.add_drop(sortie_drops, drop)
+
+        return sortie_drops, self.verify_data(sortie_drops, self.drop_tables)
+
+    def parse_transient(self) -> tuple[list, dict | None]:
+        transient_drops = []
+
+        for objective in self.data.get("transientRewards", []):
+            self.start_table()
+            table_rotation = None
+
+            for reward in objective.get("rewards", []):
+                rotation = self.normalize_text(reward.get("rotation"))
+
+                # Rewards of every rotation are in one list
+                if rotation != table_rotation:
+                    self.start_table()
+                    table_rotation = rotation
+
+                drop = LocationDrop(
+                    item=self.normalize_text(reward.get("itemName")),
+                    source_type="Dynamic Location Rewards",
+                    mission_name=self.normalize_text(objective.get("objectiveName")),
+                    rarity=self.normalize_text(reward.get("rarity")),
+                    chance=self._chance(reward),
+                    rotation=rotation or MISSING,
+                )
+
+                self.add_drop(transient_drops, drop)
+
+        return transient_drops, self.verify_data(transient_drops, self.drop_tables)
+
+    def parse_bounties(self, section_id: str) -> tuple[list, dict | None]:
+        _, _, planet_name, mission_name, always_rotation, json_key = BOUNTY_HUBS[
+            section_id
+        ]
+        bounty_drops = []
+
+        for bounty in self.data.get(json_key, []):
+            bounty_name = None
+            bounty_level = None
+
+            match = BOUNTY_LEVEL_PATTERN.match(bounty.get("bountyLevel") or "")
+            if match:
+                bounty_name = self.normalize_text(match.group(2).strip())
+                bounty_level = self.normalize_text(match.group(1).strip())
+
+            for rotation, rewards in self._rotations(bounty.get("rewards")):
+                if not always_rotation and not rotation:
+                    rotation = MISSING
+
+                self.start_table()
+                table_stage = None
+
+                for reward in rewards:
+                    stage = self.normalize_text(reward.get("stage"))
+
+                    # Rewards of every stage are in one list
+                    if stage != table_stage:
+                        self.start_table()
+                        table_stage = stage
+
+                    drop = BountyDrop(
+                        item=self.normalize_text(reward.get("itemName")),
+                        source_type="Bounties",
+                        planet_name=planet_name,
+                        mission_name=mission_name,
+                        bounty_name=bounty_name,
+                        bounty_level=bounty_level,
+                        rarity=self.normalize_text(reward.get("rarity")),
+                        chance=self._chance(reward),
+                        rotation=rotation,
+                        stage=stage,
+                    )
+
+                    self.add_drop(bounty_drops, drop)
+
+        return bounty_drops, self.verify_data(bounty_drops, self.drop_tables)
+
+    def parse(self) -> dict[str, tuple[list, dict | None]]:
+        """
+        Parse every supported section
+
+        Returns:
+            HTML section id -> (drops, validation report), for the sections
+            present in the dump
+        """
+        sections = {}
+
+        section_handlers = {
+            "missionRewards": ("missionRewards", self.parse_missions),
+            "relics": ("relicRewards", self.parse_relics),
+            "sortieRewards": ("sortieRewards", self.parse_sorties),
+            "transientRewards": ("transientRewards", self.parse_transient),
+        }
+
+        for json_key, (section_id, handler) in section_handlers.items():
+            if json_key in self.data:
+                sections[section_id] = self._parse_section(section_id, handler)
+
+        for section_id, (*_, json_key) in BOUNTY_HUBS.items():
+            if json_key in self.data:
+                sections[section_id] = self._parse_section(
+                    section_id, self.parse_bounties, section_id
+                )
+
+        return sections
+
+    def _parse_section(self, section_id: str, handler, *args):
+        # Every section numbers its reward tables from scratch
+        self.drop_tables = []
+
+        with span(f"parse.{section_id}"):
+            return handler(*args)
@@ -1,11 +1,14 @@
 from parsers.base_parser import BaseDropParser
+from parsers.drop_records import RelicDrop, fold_relic_drops
 
 
 class RelicDropParser(BaseDropParser):
     """Inherited parser class for Relic drops"""
 
-    def __init__(self, soup):
-        super().__init__(soup)
+    section_id = "relicRewards"
+
+    def __init__(self, document):
+        super().__init__(document)
 
         self.relic_drops = []
 
@@ -13,67 +16,57 @@ class RelicDropParser(BaseDropParser):
         self.current_relic_name = None
         self.current_relic_refinement = None
 
-    def parse(self):
-        source_type, relics_table = self._parse_header("relicRewards")
-
-        if not source_type or not relics_table:
-            return [], None
-
-        for row in relics_table.find_all("tr"):
-            th_cells = row.find_all("th")
-            td_cells = row.find_all("td")
-
-            # -------------------------
-            # CONTEXT ROWS (headers)
-            # -------------------------
-            if th_cells:
-                text = th_cells[0].text.strip()
-
-                # Parse relic header format: "Tier RelicName Refinement"
-                # Example: "Lith A1 Intact"
-                parts = text.split()
-                if len(parts) == 4:
-                    self.current_relic_tier = self.normalize_text(
-                        parts[0]
-                    )  # e.g., "Lith"
-                    self.current_relic_name = self.normalize_text(
-                        parts[1]
-                    )  # e.g., "A1"
-                    # parts[2] = 'Relic' - skipped, not needed
-                    self.current_relic_refinement = self.normalize_text(
-                        parts[3].replace("(", "").replace(")", "")
-                    )  # e.g., "Intact"
-                elif len(parts) == 3:
-                    continue
-                else:
-                    # Fallback: try to extract tier and name
-                    self.current_relic_tier = None
-                    self.current_relic_name = self.normalize_text(text)
-                    self.current_relic_refinement = None
-
-            # -------------------------
-            # DROP ROWS
-            # -------------------------
-            elif len(td_cells) >= 2:
-                item_name = td_cells[0].text
-                item_name = self.normalize_text(item_name)
-
-                chance_text = td_cells[1].text.strip()
-
-                rarity, chance_number = self._parse_chance_text(chance_text)
-
-                drop = {
-                    "item": item_name,
-                    "source_type": source_type,
-                    "rarity": rarity,
-                    "chance": chance_number,
-                    "relic_tier": self.current_relic_tier,
-                    "relic_name": self.current_relic_name,
-                    "relic_refinement": self.current_relic_refinement,
-                }
-
-                self.relic_drops.append(drop)
-
-        report = self.verify_data(self.relic_drops)
-
-        return self.relic_drops, report
+    # -------------------------
+    # CONTEXT ROWS (headers)
+    # -------------------------
+    def parse_context_row(self, text):
+
+        # Parse relic header format: "Tier RelicName Refinement"
+        # Example: "Lith A1 Intact"
+        parts = text.split()
+        if len(parts) == 4:
+            self.current_relic_tier = self.normalize_text(parts[0])  # e.g., "Lith"
+            self.current_relic_name = self.normalize_text(parts[1])  # e.g., "A1"
+            # parts[2] = 'Relic' - skipped, not needed
+            self.current_relic_refinement = self.normalize_text(
+                parts[3].replace("(", "").replace(")", "")
+            )  # e.g., "Intact"
+        elif len(parts) == 3:
+            return
+        else:
+            # Fallback: try to extract tier and name
+            self.current_relic_tier = None
+            self.current_relic_name = self.normalize_text(text)
+            self.current_relic_refinement = None
+
+    # -------------------------
+    # DROP ROWS
+    # -------------------------
+    def parse_drop_row(self, cells):
+        if len(cells) < 2:
+            return
+
+        item_name = cells[0]
+        item_name = self.normalize_text(item_name)
+
+        chance_text = cells[1].strip()
+
+        rarity, chance_number = self._parse_chance_text(chance_text)
+
+        drop = RelicDrop(
+            item=item_name,
+            source_type=self.source_type,
+            rarity=rarity,
+            chance=chance_number,
+            relic_tier=self.current_relic_tier,
+            relic_name=self.current_relic_name,
+            relic_refinement=self.current_relic_refinement,
+        )
+
+        self.add_drop(self.relic_drops, drop)
+
+    def finish_section(self):
+        # Tables are validated row by row, then every reward is stored once
+        report = self.verify_data(self.relic_drops, self.drop_tables)
+
+        return fold_relic_drops(self.relic_drops), report
@@ -1,54 +1,50 @@
 from parsers.base_parser import BaseDropParser
+from parsers.drop_records import LocationDrop
 
 
 class SortieDropParser(BaseDropParser):
     """Inherited parser class for Sortie drops"""
 
-    def __init__(self, soup):
-        super().__init__(soup)
+    section_id = "sortieRewards"
+
+    def __init__(self, document):
+        super().__init__(document)
 
         self.sortie_drops = []
 
         self.current_mission_name = None
 
-    def parse(self):
-        source_type, sorties_table = self._parse_header("sortieRewards")
-
-        if not source_type or not sorties_table:
-            return [], None
-
-        for row in sorties_table.find_all("tr"):
-            th_cells = row.find_all("th")
-            td_cells = row.find_all("td")
+    # -------------------------
+    # CONTEXT ROWS (headers)
+    # -------------------------
+    def parse_context_row(self, text):
+        self.current_mission_name = self.normalize_text(text)
 
-            # -------------------------
-            # CONTEXT ROWS (headers)
-            # -------------------------
-            if th_cells:
-                text = th_cells[0].text.strip()
-                self.current_mission_name = self.normalize_text(text)
+    # -------------------------
+    # DROP ROWS
+    # -------------------------
+    def parse_drop_row(self, cells):
+        if len(cells) < 2:
+            return
 
-            # -------------------------
-            # DROP ROWS
-            # -------------------------
-            elif len(td_cells) >= 2:
-                item_name = td_cells[0].text
-                item_name = self.normalize_text(item_name)
+        item_name = cells[0]
+        item_name = self.normalize_text(item_name)
 
-                chance_text = td_cells[1].text.strip()
+        chance_text = cells[1].strip()
 
-                rarity, chance_number = self._parse_chance_text(chance_text)
+        rarity, chance_number = self._parse_chance_text(chance_text)
 
-                drop = {
-                    "item": item_name,
-                    "source_type": source_type,
-                    "mission_name": self.current_mission_name,
-                    "rarity": rarity,
-                    "chance": chance_number,
-                }
+        drop = LocationDrop(
+            item=item_name,
+            source_type=self.source_type,
+            mission_name=self.current_mission_name,
+            rarity=rarity,
+            chance=chance_number,
+        )
 
-                self.sortie_drops.append(drop)
+        self.add_drop(self.sortie_drops, drop)
 
-        report = self.verify_data(self.sortie_drops)
+    def finish_section(self):
+        report = self.verify_data(self.sortie_drops, self.drop_tables)
 
         return self.sortie_drops, report
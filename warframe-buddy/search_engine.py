@@ -2,7 +2,46 @@ import os
 import json
 from datetime import datetime
 from collections import defaultdict
-from config import INDEXED_DATA_FILE, PARSED_DATA_FILE, COMMON_SEARCH_DATA_FILE
+from pathlib import Path
+from operator import attrgetter
+from config import (
+    INDEXED_DATA_FILE,
+    PARSED_DATA_FILE,
+    PARSED_NDJSON_FILE,
+    COMMON_SEARCH_DATA_FILE,
+)
+from parsers.drop_records import (
+    MISSING,
+    RelicRewards,
+    as_drop_record,
+    expand_drops,
+    row_count,
+)
+from utils.ndjson import open_ndjson
+from utils.symbols import SymbolTable
+
+# Indexes of drop IDs, keyed by item ID or (item ID, planet ID / relic tier)
+DROP_INDEXES = (
+    "item_sources",
+    "item_missions",
+    "item_relics",
+    "item_sorties",
+    "item_bounties",
+    "item_transient",
+    "mission_planets",
+    "relic_tiers",
+    "bountie_planets",
+)
+
+
+def latest_parsed_file() -> Path:
+    """
+    Parsed drops of the last rebuild that saved them: PARSED_NDJSON_FILE
+    after a streaming rebuild, PARSED_DATA_FILE otherwise
+    """
+    saved = [path for path in (PARSED_DATA_FILE, PARSED_NDJSON_FILE) if path.exists()]
+
+    return max(saved, key=lambda path: path.stat().st_mtime, default=PARSED_DATA_FILE)
 
 
 class WarframeSearchEngine:
@@ -11,97 +50,144 @@ class WarframeSearchEngine:
     def __init__(self):
         """Initialize empty - data loaded separately"""
         self.search_indexes = {}
+        self.symbols = SymbolTable()
         self.last_rebuild = None
+        self.source_hash = None
+        # (source hash, index file) the indexes were last saved to or loaded from
+        self._saved_as = None
 
     # ==== INDEX MANAGEMENT ====
 
-    def create_indexes_from_drops(self, all_drops) -> str:
+    def create_indexes_from_drops(self, all_drops, source_hash=None) -> str:
         """
         Create indexes from drop data (used by orchestrator after parsing)
 
         Args:
             all_drops: List of drop dictionaries from parser
+            source_hash: Content hash of the drop-table snapshot the drops
+                were parsed from. Rebuilding is skipped when the current
+                indexes were already built from the same snapshot.
         """
-        # Reset indexes
+        if self.is_current(source_hash):
+            return (
+                f"  - Indexes already up to date "
+                f"(unique items: {len(self.search_indexes['item_sources'])})"
+            )
+
+        self.begin_indexes(source_hash)
+
+        # Build all indexes in one pass
+        for drop in all_drops:
+            self.add_drop(drop)
+
+        return self.finish_indexes()
+
+    def begin_indexes(self, source_hash=None) -> None:
+        """
+        Start building indexes drop by drop (streaming rebuilds)
+
+        Feed every drop to add_drop(), then call finish_indexes().
+        """
+        # Reset indexes, drops are stored once and indexed by position
+        self.symbols = SymbolTable()
         self.search_indexes = {
-            "item_sources": defaultdict(list),
-            "item_missions": defaultdict(list),
-            "item_relics": defaultdict(list),
-            "item_sorties": defaultdict(list),
-            "item_bounties": defaultdict(list),
-            "item_transient": defaultdict(list),
-            "mission_planets": defaultdict(list),
-            "relic_tiers": defaultdict(list),
-            "bountie_planets": defaultdict(list),
+            "drops": [],
+            **{index_name: defaultdict(list) for index_name in DROP_INDEXES},
             "item_lowercase": {},
             "metadata": {
-                "total_drops": len(all_drops),
+                "total_drops": 0,
                 "created_at": datetime.now().isoformat(),
                 "source": "parsed_data",
+                "source_hash": source_hash,
             },
         }
 
-        # Build all indexes in one pass
-        for drop in all_drops:
-            item = drop["item"]
-            source_type = drop["source_type"]
+        self.source_hash = source_hash
+
+    def add_drop(self, drop: dict) -> None:
+        """Add a single drop to the indexes started by begin_indexes()"""
+        indexes = self.search_indexes
+        drop = as_drop_record(drop)
+        item = drop.item
+        source_type = drop.source_type
 
-            # Store lowercase version for case-insensitive search
-            item_lower = item.lower()
-            if item_lower not in self.search_indexes["item_lowercase"]:
-                self.search_indexes["item_lowercase"][item_lower] = item
+        drop_id = len(indexes["drops"])
+        indexes["drops"].append(drop)
+        item_id = self.symbols.intern("items", item)
 
-            # Original item indexing
-            self.search_indexes["item_sources"][item].append(drop)
+        # Store lowercase version for case-insensitive search
+        item_lower = item.lower()
+        if item_lower not in indexes["item_lowercase"]:
+            indexes["item_lowercase"][item_lower] = item_id
 
-            if source_type == "Missions":
-                self.search_indexes["item_missions"][item].append(drop)
+        # Original item indexing
+        indexes["item_sources"][item_id].append(drop_id)
 
-                planet = drop.get("planet_name")
-                if planet:
-                    key = f"{item}::{planet}"
-                    self.search_indexes["mission_planets"][key].append(drop)
+        if source_type == "Missions":
+            indexes["item_missions"][item_id].append(drop_id)
 
-            elif source_type == "Relics":
-                self.search_indexes["item_relics"][item].append(drop)
+            planet = drop.planet_name
+            if planet:
+                key = (item_id, self.symbols.intern("planets", planet))
+                indexes["mission_planets"][key].append(drop_id)
 
-                tier = drop.get("relic_tier")
-                if tier:
-                    key = f"{item}::{tier}"
-                    self.search_indexes["relic_tiers"][key].append(drop)
+        elif source_type == "Relics":
+            indexes["item_relics"][item_id].append(drop_id)
 
-            elif source_type == "Sorties":
-                self.search_indexes["item_sorties"][item].append(drop)
+            tier = drop.relic_tier
+            if tier:
+                indexes["relic_tiers"][(item_id, tier)].append(drop_id)
 
-            elif source_type == "Bounties":
-                self.search_indexes["item_bounties"][item].append(drop)
+        elif source_type == "Sorties":
+            indexes["item_sorties"][item_id].append(drop_id)
 
-            elif source_type == "Dynamic Location Rewards":
-                self.search_indexes["item_transient"][item].append(drop)
+        elif source_type == "Bounties":
+            indexes["item_bounties"][item_id].append(drop_id)
 
+        elif source_type == "Dynamic Location Rewards":
+            indexes["item_transient"][item_id].append(drop_id)
+
+    def finish_indexes(self) -> str:
+        """Complete the indexes started by begin_indexes()"""
         self.last_rebuild = datetime.now()
+        # Table rows, like the parse and validation summaries
+        self.search_indexes["metadata"]["total_drops"] = row_count(
+            self.search_indexes["drops"]
+        )
 
         return f"  - Unique items: {len(self.search_indexes['item_sources'])}"
 
-    def rebuild_from_parsed_file(self):
+    def rebuild_from_parsed_file(self, file_path=None):
         """
-        Rebuild indexes from saved JSON file
+        Rebuild indexes from saved JSON file (or NDJSON file of a streaming
+        rebuild, read drop by drop), defaults to latest_parsed_file()
         Used by service for daily updates
         """
         print("Rebuilding indexes from parsed data file...")
 
+        if file_path is None:
+            file_path = latest_parsed_file()
+
         try:
-            with open(PARSED_DATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if str(file_path).endswith(".ndjson"):
+                with open_ndjson(file_path) as (header, drops):
+                    self.begin_indexes(header.get("source_hash"))
+                    for drop in drops:
+                        self.add_drop(drop)
+                    self.finish_indexes()
+            else:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+
+                drops = data["drops"]
+                self.create_indexes_from_drops(drops, data.get("source_hash"))
 
-            drops = data["drops"]
-            self.create_indexes_from_drops(drops)
             self.save_indexes()
             print("✓ Indexes rebuilt successfully")
             return True
 
         except FileNotFoundError:
-            print(f"✗ Parsed data file not found: {PARSED_DATA_FILE}")
+            print(f"✗ Parsed data file not found: {file_path}")
             return False
 
         except json.JSONDecodeError as e:
@@ -112,56 +198,96 @@ class WarframeSearchEngine:
             print("✗ Invalid parsed data format")
             return False
 
-    def save_indexes(self) -> str:
-        """Save current indexes to file"""
-        if not self.search_indexes:
-            return "✗ No indexes to save"
+    def export_indexes(self) -> dict:
+        """
+        Current indexes as a JSON-serializable dict (the index file format)
 
-        serializable_indexes = {}
+        Drops are stored once with their names replaced by symbol IDs, the
+        indexes are [key..., [drop IDs]] rows.
+        """
+        serializable_indexes = {"symbols": self.symbols.export()}
         for index_name, index_data in self.search_indexes.items():
-            if isinstance(index_data, defaultdict):
-                serializable_indexes[index_name] = dict(index_data)
+            if index_name == "drops":
+                serializable_indexes[index_name] = [
+                    self.symbols.encode_drop(drop) for drop in index_data
+                ]
+            elif index_name in DROP_INDEXES:
+                serializable_indexes[index_name] = [
+                    [*(key if isinstance(key, tuple) else (key,)), drop_ids]
+                    for key, drop_ids in index_data.items()
+                ]
             else:
                 serializable_indexes[index_name] = index_data
 
-        data = {
+        return {
             "created_at": datetime.now().isoformat(),
             "last_rebuild": (
                 self.last_rebuild.isoformat() if self.last_rebuild else None
             ),
+            "source_hash": self.source_hash,
             "indexes": serializable_indexes,
         }
 
+    def import_indexes(self, data: dict) -> None:
+        """Restore indexes from a dict made by export_indexes()"""
+        indexes = dict(data["indexes"])
+        self.symbols = SymbolTable(indexes.pop("symbols"))
+
+        for index_name, index_data in indexes.items():
+            if index_name == "drops":
+                self.search_indexes[index_name] = [
+                    as_drop_record(self.symbols.decode_drop(drop))
+                    for drop in index_data
+                ]
+            elif index_name in DROP_INDEXES:
+                self.search_indexes[index_name] = defaultdict(
+                    list,
+                    {
+                        (tuple(row[:-1]) if len(row) > 2 else row[0]): row[-1]
+                        for row in index_data
+                    },
+                )
+            else:
+                self.search_indexes[index_name] = index_data
+
+        if "last_rebuild" in data and data["last_rebuild"]:
+            self.last_rebuild = datetime.fromisoformat(data["last_rebuild"])
+
+        self.source_hash = data.get("source_hash")
+
+    def save_indexes(self, file_path=INDEXED_DATA_FILE) -> str:
+        """Save current indexes to file"""
+        if not self.search_indexes:
+            return "✗ No indexes to save"
+
+        saved_as = (self.source_hash, Path(file_path).resolve())
+        if self.source_hash and saved_as == self._saved_as and saved_as[1].exists():
+            return f'✓ Indexes in "{file_path}" already up to date'
+
+        data = self.export_indexes()
+
         try:
-            with open(INDEXED_DATA_FILE, "w") as f:
+            with open(file_path, "w") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
-            return f'✓ Saved indexes to "{INDEXED_DATA_FILE}"'
+            self._saved_as = saved_as
+            return f'✓ Saved indexes to "{file_path}"'
         except IOError as e:
             return f"✗ Failed to save indexes: {e}"
 
-    def load_indexes(self) -> tuple[bool, str]:
+    def load_indexes(self, file_path=INDEXED_DATA_FILE) -> tuple[bool, str]:
         """Load indexes from file"""
         try:
-            with open(INDEXED_DATA_FILE, "r") as f:
+            with open(file_path, "r") as f:
                 data = json.load(f)
 
-            # Convert back to defaultdict for lists, keep dict for others
-            for index_name, index_data in data["indexes"].items():
-                if index_name in [
-                    "item_sources",
-                    "item_missions",
-                    "item_relics",
-                    "item_sorties",
-                    "mission_planets",
-                    "relic_tiers",
-                ]:
-                    self.search_indexes[index_name] = defaultdict(list, index_data)
-                else:
-                    self.search_indexes[index_name] = index_data
+            if "symbols" not in data.get("indexes", {}):
+                response = "✗ Index file is from an older version!"
+                response += "\nPlease run Mode 1 again to rebuild it."
+                return False, response
 
-            if "last_rebuild" in data and data["last_rebuild"]:
-                self.last_rebuild = datetime.fromisoformat(data["last_rebuild"])
+            self.import_indexes(data)
+            self._saved_as = (self.source_hash, Path(file_path).resolve())
 
             response = f"✓ Loaded indexes (created {data['created_at']})"
             response += (
@@ -178,6 +304,12 @@ class WarframeSearchEngine:
             response = f"✗ Invalid JSON in index file: {e}"
             return False, response
 
+    def is_current(self, source_hash: str | None) -> bool:
+        """Check if loaded indexes were built from the given snapshot"""
+        return bool(
+            source_hash and self.search_indexes and self.source_hash == source_hash
+        )
+
     def get_index_status(self) -> dict:
         """Get current index status"""
         if not self.search_indexes:
@@ -185,6 +317,7 @@ class WarframeSearchEngine:
                 "loaded": False,
                 "total_items": 0,
                 "last_rebuild": None,
+                "source_hash": None,
                 "index_types": [],
             }
 
@@ -194,11 +327,28 @@ class WarframeSearchEngine:
             "last_rebuild": (
                 self.last_rebuild.isoformat() if self.last_rebuild else None
             ),
+            "source_hash": self.source_hash,
             "index_types": list(self.search_indexes.keys()),
         }
 
     # ==== SEARCH METHODS ====
 
+    def item_names(self) -> list[str]:
+        """Every indexed item name"""
+        return list(self.symbols.names["items"])
+
+    def _item_drops(self, item_name: str, index_name: str = "item_sources") -> list:
+        """Drops of an item in one of the item-keyed indexes"""
+        item_id = self.symbols.get_id("items", item_name)
+        if item_id is None:
+            return []
+
+        drops = self.search_indexes["drops"]
+        return [
+            drops[drop_id]
+            for drop_id in self.search_indexes[index_name].get(item_id, ())
+        ]
+
     def search_item(self, item_name: str, **filters: dict) -> list:
         """Search for exact item name"""
         if not self.search_indexes:
@@ -206,41 +356,62 @@ class WarframeSearchEngine:
 
         self._most_common_search(item_name)
 
-        results = self.search_indexes["item_sources"].get(item_name, [])
+        results = list(expand_drops(self._item_drops(item_name)))
 
         # Apply chance filters
         min_chance = filters.get("min_chance")
         if min_chance is not None:
             results = [
-                d
-                for d in results
-                if d.get("chance") is not None and d["chance"] >= min_chance
+                d for d in results if d.chance is not None and d.chance >= min_chance
             ]
 
         max_chance = filters.get("max_chance")
         if max_chance is not None:
             results = [
-                d
-                for d in results
-                if d.get("chance") is not None and d["chance"] <= max_chance
+                d for d in results if d.chance is not None and d.chance <= max_chance
             ]
 
         # Sort by best chance
-        results.sort(key=lambda x: x.get("chance", 0), reverse=True)
+        results.sort(key=attrgetter("chance"), reverse=True)
 
         return results
 
+    def relic_rewards(self, item_name: str, tier: str | None = None) -> list:
+        """
+        Relics of an item with the chances of every refinement side by side
+        (RelicRewards, see parsers.drop_records), optionally of one tier.
+        Best chance first.
+        """
+        if not self.search_indexes:
+            raise ValueError("No indexes loaded.")
+
+        if tier is None:
+            drops = self._item_drops(item_name, "item_relics")
+        else:
+            item_id = self.symbols.get_id("items", item_name)
+            drop_ids = self.search_indexes["relic_tiers"].get((item_id, tier), ())
+            drops = [self.search_indexes["drops"][drop_id] for drop_id in drop_ids]
+
+        rewards = [drop for drop in drops if isinstance(drop, RelicRewards)]
+        rewards.sort(
+            key=lambda relic: max(filter(None, relic.chances), default=0),
+            reverse=True,
+        )
+
+        return rewards
+
     def find_matching_items(self, search_term: str) -> list:
         """Find items matching search term (case-insensitive, partial match)"""
         search_lower = search_term.lower()
         matching = []
 
         # Check lowercase index first
-        for item_lower, item_actual in self.search_indexes.get(
+        item_names = self.symbols.names["items"]
+        for item_lower, item_id in self.search_indexes.get(
             "item_lowercase", {}
         ).items():
             if search_lower in item_lower:
-                matching.append(item_actual)
+                matching.append(item_names[item_id])
 
         return matching
 
@@ -259,78 +430,78 @@ class WarframeSearchEngine:
 
         self._most_common_search(item_name)
 
-        all_sources = self.search_indexes["item_sources"].get(item_name, [])
+        all_sources = list(expand_drops(self._item_drops(item_name)))
         if not all_sources:
             return summary
 
         summary["total_sources"] = len(all_sources)
 
         for drop in all_sources:
-            if drop["source_type"] == "Missions":
-                if "rotation" in drop:
+            if drop.source_type == "Missions":
+                if drop.rotation is not MISSING:
                     summary["missions"].append(
                         {
-                            "planet": drop.get("planet_name"),
-                            "mission": drop.get("mission_name"),
-                            "type": drop.get("mission_type"),
-                            "chance": drop.get("chance"),
-                            "rarity": drop.get("rarity"),
-                            "rotation": drop.get("rotation"),
+                            "planet": drop.planet_name,
+                            "mission": drop.mission_name,
+                            "type": drop.mission_type,
+                            "chance": drop.chance,
+                            "rarity": drop.rarity,
+                            "rotation": drop.rotation,
                         }
                     )
                 else:
                     summary["missions"].append(
                         {
-                            "planet": drop.get("planet_name"),
-                            "mission": drop.get("mission_name"),
-                            "type": drop.get("mission_type"),
-                            "chance": drop.get("chance"),
-                            "rarity": drop.get("rarity"),
+                            "planet": drop.planet_name,
+                            "mission": drop.mission_name,
+                            "type": drop.mission_type,
+                            "chance": drop.chance,
+                            "rarity": drop.rarity,
                         }
                     )
-            elif drop["source_type"] == "Relics":
+            elif drop.source_type == "Relics":
                 summary["relics"].append(
                     {
-                        "tier": drop.get("relic_tier"),
-                        "name": drop.get("relic_name"),
-                        "refinement": drop.get("relic_refinement"),
-                        "chance": drop.get("chance"),
-                        "rarity": drop.get("rarity"),
+                        "tier": drop.relic_tier,
+                        "name": drop.relic_name,
+                        "refinement": drop.relic_refinement,
+                        "chance": drop.chance,
+                        "rarity": drop.rarity,
                     }
                 )
-            elif drop["source_type"] == "Sorties":
+            elif drop.source_type == "Sorties":
                 summary["sorties"].append(
-                    {"chance": drop.get("chance"), "rarity": drop.get("rarity")}
+                    {"chance": drop.chance, "rarity": drop.rarity}
                 )
-            elif drop["source_type"] == "Bounties":
-                if "rotation" in drop:
+            elif drop.source_type == "Bounties":
+                if drop.rotation is not MISSING:
                     summary["bounties"].append(
                         {
-                            "planet": drop.get("planet_name"),
-                            "mission": drop.get("mission_name"),
-                            "name": drop.get("bounty_name"),
-                            "level": drop.get("bounty_level"),
-                            "chance": drop.get("chance"),
-                            "rarity": drop.get("rarity"),
-                            "rotation": drop.get("rotation"),
-                            "stage": drop.get("stage"),
+                            "planet": drop.planet_name,
+                            "mission": drop.mission_name,
+                            "name": drop.bounty_name,
+                            "level": drop.bounty_level,
+                            "chance": drop.chance,
+                            "rarity": drop.rarity,
+                            "rotation": drop.rotation,
+                            "stage": drop.stage,
                         }
                     )
                 else:
                     summary["bounties"].append(
                         {
-                            "planet": drop.get("planet_name"),
-                            "mission": drop.get("mission_name"),
-                            "name": drop.get("bounty_name"),
-                            "level": drop.get("bounty_level"),
-                            "chance": drop.get("chance"),
-                            "rarity": drop.get("rarity"),
-                            "stage": drop.get("stage"),
+                            "planet": drop.planet_name,
+                            "mission": drop.mission_name,
+                            "name": drop.bounty_name,
+                            "level": drop.bounty_level,
+                            "chance": drop.chance,
+                            "rarity": drop.rarity,
+                            "stage": drop.stage,
                         }
                     )
 
-            if drop.get("chance", 0) > summary["best_chance"]:
-                summary["best_chance"] = drop.get("chance", 0)
+            if drop.chance > summary["best_chance"]:
+                summary["best_chance"] = drop.chance
                 summary["best_source"] = drop
 
         summary_sorted = summary.copy()
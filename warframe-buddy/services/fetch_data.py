@@ -1,24 +1,301 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-from config import FETCH_URL, HTML_FILE
+from datetime import datetime
+from typing import Awaitable, Callable
+from urllib3.util.request import ACCEPT_ENCODING
+from config import FETCH_URL, FETCH_TIMEOUT, HTML_FILE, FETCH_META_FILE
 from pathlib import Path
+from services.snapshot_archive import SnapshotArchive
 
+CHUNK_SIZE = 64 * 1024
 
-def fetch_data() -> tuple[bool, str | None]:
-    """Fetch latest Warframe drop data"""
+
+def load_fetch_metadata() -> dict:
+    """Load validators and content hash of the last good snapshot"""
+    try:
+        with open(FETCH_META_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_fetch_metadata(metadata: dict) -> None:
+    Path(FETCH_META_FILE).parent.mkdir(parents=True, exist_ok=True)
+
+    with open(FETCH_META_FILE, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+
+
+def _conditional_headers(metadata: dict) -> dict:
+    """Build If-None-Match / If-Modified-Since headers from stored metadata"""
+    headers = {}
+
+    # Validators are only trustworthy while the snapshot they describe exists
+    if not Path(HTML_FILE).is_file():
+        return headers
+
+    if metadata.get("etag"):
+        headers["If-None-Match"] = metadata["etag"]
+    if metadata.get("last_modified"):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+
+    return headers
+
+
+def get_snapshot_hash() -> str | None:
+    """Content hash of the drop-table snapshot currently on disk"""
+    return load_fetch_metadata().get("sha256")
+
+
+def record_restored_snapshot(content_hash: str, size: int) -> None:
+    """
+    Describe a snapshot restored from the archive as the one on disk
+
+    The validators belong to the last download, not to this page, so they
+    are dropped and the next fetch downloads the page again.
+    """
+    metadata = load_fetch_metadata()
+    metadata.update(
+        etag=None,
+        last_modified=None,
+        sha256=content_hash,
+        size=size,
+        restored_at=datetime.now().isoformat(),
+    )
+    _save_fetch_metadata(metadata)
+
+
+def _mark_not_modified(metadata: dict) -> None:
+    metadata["checked_at"] = datetime.now().isoformat()
+    _save_fetch_metadata(metadata)
+
+
+def _commit_snapshot(
+    part_file: Path,
+    metadata: dict,
+    response_headers,
+    content_hash: str,
+    size: int,
+    force: bool,
+) -> bool:
+    """
+    Replace the snapshot with a finished download
+
+    Returns False (and discards the download) when the content is identical
+    to the last good snapshot
+    """
+    if size == 0:
+        raise IOError("Empty response from drop tables page")
+
+    new_metadata = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+        "sha256": content_hash,
+        "size": size,
+        "fetched_at": metadata.get("fetched_at"),
+        "checked_at": datetime.now().isoformat(),
+    }
+
+    # Server ignored the validators but the content is the same
+    if (
+        not force
+        and content_hash == metadata.get("sha256")
+        and Path(HTML_FILE).is_file()
+    ):
+        part_file.unlink()
+        _save_fetch_metadata(new_metadata)
+        return False
+
+    os.replace(part_file, HTML_FILE)
+
+    # Keep every distinct snapshot so older ones can be restored and reparsed
     try:
-        response = requests.get(FETCH_URL)
-        response.raise_for_status()
+        SnapshotArchive().store(Path(HTML_FILE).read_bytes())
+    except OSError as e:
+        print(f"Warning: Could not archive drop-table snapshot: {e}")
+
+    new_metadata["fetched_at"] = new_metadata["checked_at"]
+    _save_fetch_metadata(new_metadata)
+
+    return True
+
+
+def fetch_data(
+    force: bool = False, on_chunk: Callable[[bytes], None] | None = None
+) -> tuple[bool, str | None, bool]:
+    """
+    Fetch latest Warframe drop data
+
+    Sends If-None-Match/If-Modified-Since from the previous fetch and compares
+    the content hash against the last good snapshot, so unchanged drop tables
+    are neither rewritten nor reparsed.
+
+    The page is streamed compressed and written to disk as raw bytes in
+    chunks, hashing and counting as it goes. The previous snapshot is only
+    replaced once the download is complete.
+
+    Args:
+        force: Ignore stored validators and always replace the snapshot
+        on_chunk: Optional callback receiving every downloaded chunk, e.g.
+            DropOrchestrator.feed to parse while downloading
+
+    Returns:
+        (success, error, modified) - modified is False when the drop tables
+        have not changed since the last successful fetch
+    """
+    part_file = Path(f"{HTML_FILE}.part")
+
+    try:
+        metadata = load_fetch_metadata()
+        headers = {"Accept-Encoding": ACCEPT_ENCODING}
+        if not force:
+            headers.update(_conditional_headers(metadata))
+
+        with requests.get(
+            FETCH_URL, headers=headers, stream=True, timeout=FETCH_TIMEOUT
+        ) as response:
+            if response.status_code == 304:
+                _mark_not_modified(metadata)
+                return True, None, False
+
+            response.raise_for_status()
+
+            Path(HTML_FILE).parent.mkdir(parents=True, exist_ok=True)
+
+            sha256 = hashlib.sha256()
+            size = 0
+
+            with open(part_file, "wb") as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    sha256.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+
+                    if on_chunk is not None:
+                        on_chunk(chunk)
+
+            # Content-Length counts the (possibly compressed) bytes on the wire
+            expected_length = response.headers.get("Content-Length")
+            if expected_length is not None and response.raw.tell() != int(
+                expected_length
+            ):
+                raise IOError(
+                    f"Incomplete download: received {response.raw.tell()} "
+                    f"of {expected_length} bytes"
+                )
+
+        modified = _commit_snapshot(
+            part_file,
+            metadata,
+            response.headers,
+            sha256.hexdigest(),
+            size,
+            force,
+        )
+
+        return True, None, modified
+
+    except Exception as e:
+        part_file.unlink(missing_ok=True)
+        return False, str(e), False
+
+
+async def fetch_data_async(
+    force: bool = False,
+    timeout: float = FETCH_TIMEOUT,
+    progress: Callable[[int, int | None], Awaitable[None] | None] | None = None,
+    on_chunk: Callable[[bytes], None] | None = None,
+) -> tuple[bool, str | None, bool]:
+    """
+    Fetch latest Warframe drop data without blocking the event loop
+
+    Same conditional, streaming behaviour and return value as fetch_data().
+
+    Args:
+        force: Ignore stored validators and always replace the snapshot
+        timeout: Total time allowed for the request, in seconds
+        progress: Optional callback (or coroutine function) called after
+            each chunk with (bytes_received, total_bytes). total_bytes is
+            None when the server does not announce an uncompressed length.
+        on_chunk: Optional callback receiving every downloaded chunk
+
+    Cancelling the task removes the partial download and keeps the previous
+    snapshot in place.
+    """
+    part_file = Path(f"{HTML_FILE}.part")
+
+    try:
+        metadata = load_fetch_metadata()
+        headers = {} if force else _conditional_headers(metadata)
+
+        async with asyncio.timeout(timeout), aiohttp.ClientSession() as session:
+            async with session.get(FETCH_URL, headers=headers) as response:
+                if response.status == 304:
+                    _mark_not_modified(metadata)
+                    return True, None, False
+
+                response.raise_for_status()
+
+                Path(HTML_FILE).parent.mkdir(parents=True, exist_ok=True)
+
+                # aiohttp hands out decompressed bytes, so Content-Length is
+                # only comparable when the body was sent uncompressed
+                total = None
+                if "Content-Encoding" not in response.headers:
+                    total = response.content_length
+
+                sha256 = hashlib.sha256()
+                size = 0
+
+                with open(part_file, "wb") as f:
+                    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                        sha256.update(chunk)
+                        size += len(chunk)
+                        f.write(chunk)
+
+                        if on_chunk is not None:
+                            on_chunk(chunk)
+
+                        if progress is not None:
+                            result = progress(size, total)
+                            if inspect.isawaitable(result):
+                                await result
+
+                if total is not None and size != total:
+                    raise IOError(
+                        f"Incomplete download: received {size} of {total} bytes"
+                    )
+
+                response_headers = response.headers
 
-        response.encoding = "utf-8"
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Renaming, archiving (compresses every new section) and writing the
+        # metadata block, keep them off the event loop
+        modified = await asyncio.to_thread(
+            _commit_snapshot,
+            part_file,
+            metadata,
+            response_headers,
+            sha256.hexdigest(),
+            size,
+            force,
+        )
 
-        Path(HTML_FILE).parent.mkdir(parents=True, exist_ok=True)
+        return True, None, modified
 
-        with open(HTML_FILE, "w", encoding="utf-8") as f:
-            f.write(soup.prettify())
+    except asyncio.CancelledError:
+        part_file.unlink(missing_ok=True)
+        raise
 
-        return True, None
+    except asyncio.TimeoutError:
+        part_file.unlink(missing_ok=True)
+        return False, f"Timed out after {timeout} seconds", False
 
     except Exception as e:
-        return False, str(e)
+        part_file.unlink(missing_ok=True)
+        return False, str(e), False
@@ -0,0 +1,676 @@
+"""
+Stage-cached rebuild pipeline: fetch -> parse -> validate -> index -> save
+
+Streaming mode runs parse, validate and index as one pass (fetch -> stream
+-> save), drops go straight from the parsers to the index builder and an
+NDJSON file.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from config import (
+    HTML_FILE,
+    JSON_DROPS_FILE,
+    PARSED_DATA_FILE,
+    PARSED_NDJSON_FILE,
+    INDEXED_DATA_FILE,
+    PIPELINE_DIR,
+    PIPELINE_STATE_FILE,
+    STREAMING_REBUILD,
+)
+from orchestrator import DropOrchestrator
+from parsers.bounty_parser import BOUNTY_HUBS
+from parsers.drop_records import drop_to_json
+from search_engine import WarframeSearchEngine
+from utils import tracing
+from utils.ndjson import NdjsonWriter
+from utils.tracing import current_span, span
+
+# Bump when a stage's output changes, so every stage runs again
+PIPELINE_VERSION = 6
+
+# Stage -> (input artifacts, output artifacts), in run order.
+# A stage runs again only when the hash of its inputs changed, or when it
+# failed last time. Stages without inputs always run.
+STAGES = {
+    "fetch": ((), ("source",)),
+    "parse": (("source",), ("drops",)),
+    "validate": (("drops",), ("report",)),
+    "index": (("drops", "report"), ("indexes",)),
+    "save": (("drops", "indexes"), ("saved",)),
+}
+
+# Streaming mode: "drops" is an NDJSON file written while parsing, "indexes"
+# is still the whole index export like in STAGES
+STREAMING_STAGES = {
+    "fetch": ((), ("source",)),
+    "stream": (("source",), ("drops", "report", "indexes")),
+    "save": (("drops", "indexes"), ("saved",)),
+}
+
+STAGE_TITLES = {
+    "parse": "Parsing data...",
+    "stream": "Parsing, validating and indexing data...",
+    "index": "Creating search indexes...",
+    "save": "Saving data...",
+}
+
+
+class PipelineError(Exception):
+    """A stage failed, the message is shown to the user as is"""
+
+
+class RebuildPipeline:
+    """
+    Rebuild pipeline shared by the CLI and the Discord bot
+
+    Every stage stores its artifacts in PIPELINE_DIR and records the hash of
+    its inputs in PIPELINE_STATE_FILE. A re-run skips stages whose inputs
+    haven't changed and resumes at the first stage that failed, e.g. a failed
+    save doesn't fetch and parse again.
+    """
+
+    def __init__(
+        self,
+        fetch: bool = True,
+        use_json: bool = False,
+        only: list[str] | None = None,
+        save_parsed: bool | Callable[[], bool] = True,
+        streaming: bool = STREAMING_REBUILD,
+        on_message: Callable[[str], None | Awaitable[None]] | None = None,
+        progress: Callable[[int, int | None], None | Awaitable[None]] | None = None,
+    ):
+        """
+        Args:
+            fetch: Download the drop tables (False uses the cached HTML file)
+            use_json: Ingest JSON_DROPS_FILE instead of the HTML page
+            only: Sections to parse again, see DropOrchestrator
+            save_parsed: Also write the parsed drops to PARSED_DATA_FILE
+                (PARSED_NDJSON_FILE in streaming mode). A function is asked
+                right before the save stage, once the drops are validated
+            streaming: Never hold all drops in one list, see STREAMING_STAGES
+            on_message: Receives progress messages (sync, or async with
+                run_async), defaults to print
+            progress: Download progress callback, see fetch_data_async
+        """
+        self.fetch = fetch and not use_json
+        self.use_json = use_json
+        self.only = only
+        self.save_parsed = save_parsed
+        self.streaming = streaming
+        self.stages = STREAMING_STAGES if streaming else STAGES
+        self.on_message = on_message or print
+        self.progress = progress
+
+        self.orchestrator = None
+        self.search_engine = None
+
+        self.failed_stage = None
+        self.error = None
+        self.validation_failed = False
+
+        self._state = self._load_state()
+        self._values = {}
+        self._messages = []
+        self._fetch_result = None
+
+    # ==== RUNNING ====
+
+    def run(self) -> bool:
+        """Run every stage that isn't up to date, returns False on failure"""
+        try:
+            with span("rebuild") as rebuild_span:
+                success = self._run_stages()
+                rebuild_span.set(success=success)
+        finally:
+            self._shutdown_orchestrator()
+
+        self._export_trace()
+        self._flush()
+        return success
+
+    async def run_async(self) -> bool:
+        """
+        Same as run(), for the event loop
+
+        The download runs on the loop, every other stage on a worker thread.
+        """
+        try:
+            with span("rebuild") as rebuild_span:
+                success = await self._run_stages_async()
+                rebuild_span.set(success=success)
+        finally:
+            self._shutdown_orchestrator()
+
+        self._export_trace()
+        await self._flush_async()
+        return success
+
+    def _run_stages(self) -> bool:
+        for name in self.stages:
+            if name == "save" and callable(self.save_parsed):
+                self._flush()
+                self._ask_save_parsed()
+
+            if self._is_fresh(name):
+                self._say(f"✓ {name.capitalize()}: up to date, skipped")
+                continue
+
+            if name in STAGE_TITLES:
+                self._say(STAGE_TITLES[name])
+            self._flush()
+
+            success = self._run_stage(name)
+            self._flush()
+
+            if not success:
+                return False
+
+        return True
+
+    async def _run_stages_async(self) -> bool:
+        if self.fetch:
+            from services.fetch_data import fetch_data_async
+
+            self._say("Fetching latest data...")
+            await self._flush_async()
+
+            # Sections are parsed on a worker thread while the page downloads
+            self.orchestrator = DropOrchestrator(
+                pipelined=True, incremental=True, only=self.only
+            )
+            with span("download"):
+                self._fetch_result = await fetch_data_async(
+                    progress=self.progress, on_chunk=self.orchestrator.feed
+                )
+
+        for name in self.stages:
+            if name == "save" and callable(self.save_parsed):
+                await self._flush_async()
+                await asyncio.to_thread(self._ask_save_parsed)
+
+            if await asyncio.to_thread(self._is_fresh, name):
+                self._say(f"✓ {name.capitalize()}: up to date, skipped")
+                continue
+
+            if name in STAGE_TITLES:
+                self._say(STAGE_TITLES[name])
+            await self._flush_async()
+
+            success = await asyncio.to_thread(self._run_stage, name)
+            await self._flush_async()
+
+            if not success:
+                return False
+
+        return True
+
+    def _ask_save_parsed(self) -> None:
+        """Call a save_parsed function, once the previous stages' output is out"""
+        self.save_parsed = bool(self.save_parsed())
+
+    def _shutdown_orchestrator(self) -> None:
+        """
+        Stop the parser thread of a download, also when the parse stage was
+        skipped or never reached
+        """
+        if self.orchestrator is not None:
+            self.orchestrator.shutdown()
+
+    def load_search_engine(self) -> WarframeSearchEngine | None:
+        """Search engine for the rebuilt indexes (loaded if index was skipped)"""
+        if self.search_engine is None:
+            search_engine = WarframeSearchEngine()
+            load_index_success, load_index_response = search_engine.load_indexes()
+
+            if not load_index_success:
+                self.error = load_index_response
+                return None
+
+            self.search_engine = search_engine
+
+        return self.search_engine
+
+    def _run_stage(self, name: str) -> bool:
+        _, outputs = self.stages[name]
+        input_hash = self._input_hash(name)
+
+        try:
+            with span(f"stage.{name}"):
+                values = getattr(self, f"_stage_{name}")()
+
+                for output in outputs:
+                    self._store(output, values[output])
+
+        except Exception as e:
+            self.failed_stage = name
+            self.error = str(e)
+
+            self._state["stages"][name] = {
+                "input_hash": input_hash,
+                "status": "failed",
+                "error": self.error,
+                "finished_at": datetime.now().isoformat(),
+            }
+            self._save_state()
+
+            self._say(f"✗ {e}")
+            return False
+
+        self._state["stages"][name] = {
+            "input_hash": input_hash,
+            "status": "done",
+            "finished_at": datetime.now().isoformat(),
+        }
+        self._save_state()
+
+        return True
+
+    # ==== STAGES ====
+
+    def _stage_fetch(self) -> dict:
+        if self.use_json:
+            self._say("JSON DROP DATA IS ACTIVE! Skipping fetching new data.")
+            return {
+                "source": {"kind": "json", "hash": self._file_hash(JSON_DROPS_FILE)}
+            }
+
+        if not self.fetch:
+            self._say("DEVELOPMENT MODE IS ACTIVE! Skipping fetching new data.")
+            return {"source": {"kind": "html", "hash": self._file_hash(HTML_FILE)}}
+
+        from services.fetch_data import fetch_data, get_snapshot_hash
+
+        if self._fetch_result is None:
+            self._say("Fetching latest data...")
+            self._flush()
+
+            # Sections are parsed in the background while the page downloads
+            self.orchestrator = DropOrchestrator(
+                pipelined=True, incremental=True, only=self.only
+            )
+            with span("download"):
+                self._fetch_result = fetch_data(on_chunk=self.orchestrator.feed)
+
+        fetch_success, fetch_error, fetch_modified = self._fetch_result
+        current_span().set(bytes_read=self.orchestrator.bytes_fed)
+
+        if not fetch_success:
+            message = "Error fetching latest data."
+            if fetch_error:
+                message += f"\n  ↳ {fetch_error}"
+            raise PipelineError(message)
+
+        if fetch_modified:
+            self._say("✓ Data fetched successfully")
+        else:
+            self._say("✓ Drop tables not modified since last fetch")
+
+        return {"source": {"kind": "html", "hash": get_snapshot_hash()}}
+
+    def _stage_parse(self) -> dict:
+        source = self._artifact("source")
+        self._open_source(source)
+
+        self.orchestrator.parse_all()
+        self._say_parse_summary()
+
+        sections = {
+            report_key: [self.orchestrator.drops[report_key], report]
+            for report_key, report in self.orchestrator.reports.items()
+        }
+
+        return {
+            "drops": {"source_hash": source["hash"], "sections": sections},
+        }
+
+    def _stage_stream(self) -> dict:
+        source = self._artifact("source")
+        self._open_source(source)
+
+        search_engine = WarframeSearchEngine()
+        search_engine.begin_indexes(source["hash"])
+
+        # Every drop goes to the index builder and the NDJSON artifact as soon
+        # as its section is parsed, all_drops is never built
+        with span("stream_drops") as stream_span:
+            with NdjsonWriter(
+                self._stream_path(),
+                self.orchestrator.parsed_data_header(),
+                default=drop_to_json,
+            ) as writer:
+                for drop in self.orchestrator.iter_drops():
+                    writer.write(drop)
+                    search_engine.add_drop(drop)
+
+            stream_span.set(rows=writer.count, bytes_written=writer.bytes_written)
+
+        create_indexes_reponse = search_engine.finish_indexes()
+
+        self._say_parse_summary()
+        report = self._validate()
+
+        self._say(
+            f"✓ Indexed {self.orchestrator.drop_counts['total_drops']} drops\n"
+            f"{create_indexes_reponse}"
+        )
+        self._say_index_status(search_engine)
+
+        self.search_engine = search_engine
+
+        return {
+            "drops": {
+                "source_hash": source["hash"],
+                "file": self._stream_path().name,
+                "sha256": writer.sha256,
+                "count": writer.count,
+                "rows": self.orchestrator.drop_counts["total_drops"],
+            },
+            "report": report,
+            "indexes": search_engine.export_indexes(),
+        }
+
+    def _open_source(self, source: dict) -> None:
+        """Set up the orchestrator for the fetched source"""
+        if self.orchestrator is not None and self.orchestrator.bytes_fed:
+            # Most sections were already parsed during the download
+            self.orchestrator.close()
+            self.orchestrator.source_hash = source["hash"]
+        elif source["kind"] == "json":
+            self.orchestrator = DropOrchestrator.from_json()
+        else:
+            self.orchestrator = DropOrchestrator(
+                source["hash"], incremental=True, only=self.only
+            )
+
+    def _say_parse_summary(self) -> None:
+        len_all_drops = self.orchestrator.drop_counts
+
+        self._say(
+            "Parsing completed:\n"
+            f"   Missions: {len_all_drops['mission_drops']} drops\n"
+            f"   Relics: {len_all_drops['relic_drops']} drops (all refinements)\n"
+            f"   Sorties: {len_all_drops['sortie_drops']} drops\n"
+            + "".join(
+                f"   {display_name} bounties: "
+                f"{len_all_drops[f'{name}_bounty_drops']} drops\n"
+                for name, display_name, *_ in BOUNTY_HUBS.values()
+            )
+            + f"   Dynamic Location Rewards: {len_all_drops['transient_drops']} drops\n"
+            f"   Total drops: {len_all_drops['total_drops']} drops"
+        )
+
+        if self.orchestrator.reused_sections:
+            self._say(
+                "   Sections reused from cache: "
+                f"{', '.join(self.orchestrator.reused_sections)}"
+            )
+
+    def _stage_validate(self) -> dict:
+        self._get_orchestrator()
+
+        return {"report": self._validate()}
+
+    def _validate(self) -> dict:
+        """Validation report of the parsed drops, raises if there are issues"""
+        # Generate a validation report
+        report = self.orchestrator.get_validation_report()
+
+        # Show validation summary
+        overall = report["overall"]
+
+        self._say(
+            "VALIDATION SUMMARY:\n"
+            f"   Total drops: {overall['total_drops']}\n"
+            f"   Data integrity: {overall['data_integrity']:.1%}\n"
+            f"   Errors: {overall['error_count']}\n"
+            f"   Warnings: {overall['warning_count']}\n"
+            f"   Tables not adding up to 100%: {overall['chance_sum_mismatches']} "
+            "(not blocking)"
+        )
+
+        # Check if validation report contains any errors
+        if overall["error_count"] > 0 or overall["warning_count"] > 0:
+            self._say("   CRITICAL: Errors found in data!")
+            self.validation_failed = True
+            raise PipelineError("⚠  Data contains errors and is not safe to use! ⚠")
+
+        return report
+
+    def _stage_index(self) -> dict:
+        orchestrator = self._get_orchestrator()
+
+        # Create search engine with fresh data
+        search_engine = WarframeSearchEngine()
+        with span("create_indexes", rows=len(orchestrator.all_drops)):
+            create_indexes_reponse = search_engine.create_indexes_from_drops(
+                orchestrator.all_drops, orchestrator.source_hash
+            )
+
+        self._say(
+            f"✓ Indexed {orchestrator.drop_counts['total_drops']} drops\n"
+            f"{create_indexes_reponse}"
+        )
+        self._say_index_status(search_engine)
+
+        self.search_engine = search_engine
+
+        return {"indexes": search_engine.export_indexes()}
+
+    def _say_index_status(self, search_engine: WarframeSearchEngine) -> None:
+        # Show index status
+        status = search_engine.get_index_status()
+        self._say(
+            "Index Status:\n"
+            f"  - Items indexed: {status['total_items']}\n"
+            f"  - Rebuilt at: {status['last_rebuild'] or 'Just now'}"
+        )
+
+    def _stage_save(self) -> dict:
+        if self.search_engine is None:
+            self.search_engine = WarframeSearchEngine()
+            self.search_engine.import_indexes(self._artifact("indexes"))
+
+        with span("save_indexes") as save_span:
+            save_indexes_response = self.search_engine.save_indexes()
+            if INDEXED_DATA_FILE.exists():
+                save_span.set(bytes_written=INDEXED_DATA_FILE.stat().st_size)
+        if save_indexes_response.startswith("✗"):
+            raise PipelineError(save_indexes_response.removeprefix("✗ "))
+        self._say(save_indexes_response)
+
+        if self.save_parsed and self.streaming:
+            self._say(self._save_parsed_stream())
+        elif self.save_parsed:
+            self._say(self._get_orchestrator().save_parsed_data())
+
+        return {
+            "saved": {
+                "indexes": str(INDEXED_DATA_FILE),
+                "parsed": str(self._parsed_file()) if self.save_parsed else None,
+            }
+        }
+
+    def _save_parsed_stream(self) -> str:
+        """Publish the NDJSON drops artifact, copied in chunks"""
+        drops = self._artifact("drops")
+
+        sha256 = hashlib.sha256()
+        tmp_path = Path(f"{PARSED_NDJSON_FILE}.part")
+
+        with span("save_parsed_data", rows=drops["count"]) as save_span:
+            PARSED_NDJSON_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(self._stream_path(), "rb") as src, open(tmp_path, "wb") as dst:
+                while chunk := src.read(1024 * 1024):
+                    sha256.update(chunk)
+                    dst.write(chunk)
+
+                save_span.set(bytes_written=dst.tell())
+
+            if sha256.hexdigest() != drops["sha256"]:
+                tmp_path.unlink(missing_ok=True)
+                raise PipelineError('Pipeline artifact "drops" is corrupted')
+
+            os.replace(tmp_path, PARSED_NDJSON_FILE)
+
+        return f'\n✓ Saved {drops["rows"]} drops to "{PARSED_NDJSON_FILE}"'
+
+    def _parsed_file(self) -> Path:
+        return PARSED_NDJSON_FILE if self.streaming else PARSED_DATA_FILE
+
+    def _stream_path(self) -> Path:
+        return PIPELINE_DIR / "drops.ndjson"
+
+    def _get_orchestrator(self) -> DropOrchestrator:
+        """Orchestrator holding the parsed drops (rebuilt from the artifact)"""
+        if self.orchestrator is None or not self.orchestrator.reports:
+            drops = self._artifact("drops")
+            self.orchestrator = DropOrchestrator.from_sections(
+                drops["sections"], drops["source_hash"]
+            )
+            self.orchestrator.parse_all()
+
+        return self.orchestrator
+
+    # ==== STAGE CACHE ====
+
+    def _params(self, name: str) -> dict:
+        """Settings that change a stage's output, hashed with its inputs"""
+        if name in ("parse", "stream"):
+            return {"only": sorted(self.only) if self.only else None}
+        if name == "save":
+            return {"save_parsed": self.save_parsed}
+        return {}
+
+    def _input_hash(self, name: str) -> str:
+        inputs, _ = self.stages[name]
+        key = {
+            "stage": name,
+            "version": PIPELINE_VERSION,
+            "streaming": self.streaming,
+            "params": self._params(name),
+            "inputs": {
+                artifact: self._state["artifacts"].get(artifact) for artifact in inputs
+            },
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+    def _is_fresh(self, name: str) -> bool:
+        """True if the stage already ran successfully on the same inputs"""
+        inputs, outputs = self.stages[name]
+        record = self._state["stages"].get(name)
+
+        if not inputs or not record or record["status"] != "done":
+            return False
+        if record["input_hash"] != self._input_hash(name):
+            return False
+        if not all(self._artifact_path(output).exists() for output in outputs):
+            return False
+
+        # The published files may have been removed since
+        if name == "save":
+            if not INDEXED_DATA_FILE.exists():
+                return False
+            if self.save_parsed and not self._parsed_file().exists():
+                return False
+
+        if name == "stream" and not self._stream_path().exists():
+            return False
+
+        return True
+
+    def _artifact_path(self, name: str) -> Path:
+        return PIPELINE_DIR / f"{name}.json"
+
+    def _store(self, name: str, value) -> None:
+        data = json.dumps(value, ensure_ascii=False, default=drop_to_json)
+        data = data.encode("utf-8")
+
+        PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
+
+        path = self._artifact_path(name)
+        tmp_path = Path(f"{path}.part")
+        with span(f"store.{name}", bytes_written=len(data)):
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        self._values[name] = value
+        self._state["artifacts"][name] = hashlib.sha256(data).hexdigest()
+
+    def _artifact(self, name: str):
+        if name not in self._values:
+            with span(f"load.{name}") as load_span:
+                with open(self._artifact_path(name), "rb") as f:
+                    data = f.read()
+                load_span.set(bytes_read=len(data))
+
+                expected_hash = self._state["artifacts"].get(name)
+                if hashlib.sha256(data).hexdigest() != expected_hash:
+                    raise PipelineError(f'Pipeline artifact "{name}" is corrupted')
+
+                self._values[name] = json.loads(data)
+
+        return self._values[name]
+
+    def _file_hash(self, file_path: Path) -> str:
+        try:
+            with open(file_path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except FileNotFoundError as e:
+            raise PipelineError(
+                f'File "{file_path}" not found. '
+                "Please fetch data first (run in Mode 1)."
+            ) from e
+
+    def _load_state(self) -> dict:
+        try:
+            with open(PIPELINE_STATE_FILE, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+
+        if state.get("version") != PIPELINE_VERSION:
+            state = {"version": PIPELINE_VERSION, "stages": {}, "artifacts": {}}
+
+        return state
+
+    def _save_state(self) -> None:
+        PIPELINE_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = Path(f"{PIPELINE_STATE_FILE}.part")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2)
+        os.replace(tmp_path, PIPELINE_STATE_FILE)
+
+    def _export_trace(self) -> None:
+        if tracing.is_enabled():
+            self._say(tracing.export())
+
+    # ==== MESSAGES ====
+
+    def _say(self, message: str) -> None:
+        self._messages.append(message)
+
+    def _flush(self) -> None:
+        if self._messages:
+            message = "\n".join(self._messages)
+            self._messages = []
+            self.on_message(message)
+
+    async def _flush_async(self) -> None:
+        if self._messages:
+            message = "\n".join(self._messages)
+            self._messages = []
+
+            result = self.on_message(message)
+            if inspect.isawaitable(result):
+                await result
@@ -0,0 +1,243 @@
+"""
+Content-addressed archive of drop-table snapshots
+Run as: python -m services.snapshot_archive [list|restore <snapshot_id>]
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from config import ARCHIVE_DIR, ARCHIVE_GZIP_LEVEL, ARCHIVE_ZSTD_LEVEL, HTML_FILE
+from utils.html_sections import split_sections
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional, gzip is always available
+    zstandard = None
+
+
+class SnapshotArchive:
+    """
+    Archive of drop-table HTML snapshots
+
+    Every snapshot is split into its <h3 id=...> sections. Each section is
+    stored once, compressed, under the hash of its content, so a day where
+    only one table changed only costs the bytes of that table. A snapshot is
+    a small manifest listing its sections in order, named after the hash of
+    the full document (the same hash services.fetch_data keeps).
+    """
+
+    def __init__(self, root: str | Path = ARCHIVE_DIR):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+
+    # ==== OBJECTS ====
+
+    def _object_paths(self, object_hash: str) -> tuple[Path, Path]:
+        base = self.objects_dir / object_hash[:2] / object_hash
+        return base.with_suffix(".zst"), base.with_suffix(".gz")
+
+    def _write_object(self, data: bytes) -> tuple[str, int]:
+        """Store one section, returns (hash, compressed bytes written)"""
+        object_hash = hashlib.sha256(data).hexdigest()
+        zst_path, gz_path = self._object_paths(object_hash)
+
+        if zst_path.exists() or gz_path.exists():
+            return object_hash, 0
+
+        if zstandard is not None:
+            path = zst_path
+            compressor = zstandard.ZstdCompressor(level=ARCHIVE_ZSTD_LEVEL)
+            compressed = compressor.compress(data)
+        else:
+            path = gz_path
+            compressed = gzip.compress(data, compresslevel=ARCHIVE_GZIP_LEVEL)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+
+        return object_hash, len(compressed)
+
+    def _read_object(self, object_hash: str) -> bytes:
+        zst_path, gz_path = self._object_paths(object_hash)
+
+        if zst_path.exists():
+            if zstandard is None:
+                raise RuntimeError(
+                    f'Section "{object_hash}" is zstd compressed, '
+                    "install zstandard to read it"
+                )
+            with open(zst_path, "rb") as f:
+                return zstandard.ZstdDecompressor().decompress(f.read())
+
+        if gz_path.exists():
+            with open(gz_path, "rb") as f:
+                return gzip.decompress(f.read())
+
+        raise FileNotFoundError(f'Archived section "{object_hash}" is missing')
+
+    # ==== SNAPSHOTS ====
+
+    def store(self, html: bytes) -> tuple[str, int]:
+        """
+        Archive a snapshot
+
+        Args:
+            html: Raw drop-table page as downloaded
+
+        Returns:
+            (snapshot_id, bytes_written) - bytes_written only counts newly
+            stored compressed sections
+        """
+        snapshot_id = hashlib.sha256(html).hexdigest()
+        manifest_path = self.snapshots_dir / f"{snapshot_id}.json"
+
+        if manifest_path.exists():
+            return snapshot_id, 0
+
+        sections = []
+        bytes_written = 0
+
+        for section_id, data in split_sections(html):
+            object_hash, written = self._write_object(data)
+            bytes_written += written
+            sections.append({"id": section_id, "hash": object_hash, "size": len(data)})
+
+        manifest = {
+            "id": snapshot_id,
+            "archived_at": datetime.now().isoformat(),
+            "size": len(html),
+            "sections": sections,
+        }
+
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        return snapshot_id, bytes_written
+
+    def list_snapshots(self) -> list[dict]:
+        """List archived snapshots, oldest first"""
+        snapshots = []
+
+        for manifest_path in self.snapshots_dir.glob("*.json"):
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+
+            snapshots.append(
+                {
+                    "id": manifest["id"],
+                    "archived_at": manifest["archived_at"],
+                    "size": manifest["size"],
+                    "sections": [section["id"] for section in manifest["sections"]],
+                }
+            )
+
+        snapshots.sort(key=lambda x: x["archived_at"])
+
+        return snapshots
+
+    def resolve(self, snapshot_id: str) -> str:
+        """Expand a (possibly abbreviated) snapshot id"""
+        matches = [
+            path.stem for path in self.snapshots_dir.glob(f"{snapshot_id}*.json")
+        ]
+
+        if not matches:
+            raise FileNotFoundError(f'No archived snapshot matches "{snapshot_id}"')
+        if len(matches) > 1:
+            raise ValueError(f'Snapshot id "{snapshot_id}" is ambiguous')
+
+        return matches[0]
+
+    def load(self, snapshot_id: str) -> bytes:
+        """Reassemble an archived snapshot and verify its content hash"""
+        snapshot_id = self.resolve(snapshot_id)
+
+        with open(self.snapshots_dir / f"{snapshot_id}.json", "r") as f:
+            manifest = json.load(f)
+
+        html = b"".join(
+            self._read_object(section["hash"]) for section in manifest["sections"]
+        )
+
+        if hashlib.sha256(html).hexdigest() != snapshot_id:
+            raise ValueError(f'Archived snapshot "{snapshot_id}" is corrupted')
+
+        return html
+
+    def restore(self, snapshot_id: str, dest: str | Path = HTML_FILE) -> Path:
+        """
+        Write an archived snapshot back to disk (defaults to HTML_FILE)
+
+        Restoring HTML_FILE also rewrites the fetch metadata, so rebuilds
+        and their caches are keyed on the restored snapshot's hash.
+        """
+        from services.fetch_data import record_restored_snapshot
+
+        snapshot_id = self.resolve(snapshot_id)
+        html = self.load(snapshot_id)
+
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = Path(f"{dest}.part")
+        with open(tmp_path, "wb") as f:
+            f.write(html)
+        os.replace(tmp_path, dest)
+
+        if dest.resolve() == Path(HTML_FILE).resolve():
+            record_restored_snapshot(snapshot_id, len(html))
+
+        return dest
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Warframe Buddy snapshot archive")
+    parser.add_argument("action", choices=["list", "restore"], help="Action to perform")
+    parser.add_argument("snapshot_id", nargs="?", help="Snapshot to restore")
+    parser.add_argument(
+        "--dest", default=HTML_FILE, help="Restore target (default: HTML_FILE)"
+    )
+
+    args = parser.parse_args()
+
+    archive = SnapshotArchive()
+
+    if args.action == "list":
+        snapshots = archive.list_snapshots()
+        if not snapshots:
+            print("No archived snapshots")
+        for snapshot in snapshots:
+            print(
+                f"{snapshot['id'][:12]}  {snapshot['archived_at']}  "
+                f"{snapshot['size']} bytes  {len(snapshot['sections'])} sections"
+            )
+
+    elif args.action == "restore":
+        if not args.snapshot_id:
+            parser.error("restore requires a snapshot id")
+
+        try:
+            dest = archive.restore(args.snapshot_id, args.dest)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"✗ {e}")
+            sys.exit(1)
+
+        print(f'✓ Restored snapshot to "{dest}"')
+
+
+if __name__ == "__main__":
+    main()
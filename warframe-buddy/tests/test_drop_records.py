@@ -0,0 +1,49 @@
+import pickle
+import unittest
+
+from parsers.drop_records import MISSING, LocationDrop, RelicRewards
+
+
+def sortie_drop():
+    return LocationDrop(
+        item="Riven Mod",
+        source_type="Sorties",
+        mission_name="Sortie",
+        rarity="Uncommon",
+        chance=0.3,
+    )
+
+
+class ImmutabilityTest(unittest.TestCase):
+    def test_fields_cant_be_assigned(self):
+        drop = sortie_drop()
+
+        with self.assertRaises(AttributeError):
+            drop.chance = 1.0
+        with self.assertRaises(AttributeError):
+            drop.rotation = "A"
+
+        self.assertEqual(drop.chance, 0.3)
+        self.assertIs(drop.rotation, MISSING)
+
+    def test_fields_cant_be_deleted(self):
+        drop = sortie_drop()
+
+        with self.assertRaises(AttributeError):
+            del drop.item
+
+        self.assertEqual(drop["item"], "Riven Mod")
+
+    def test_relic_chances_cant_be_replaced(self):
+        rewards = RelicRewards(
+            "Forma Blueprint", "Relics", "Uncommon", "Lith", "B1", [0.5] * 4
+        )
+
+        with self.assertRaises(AttributeError):
+            rewards.chances = (1.0,) * 4
+
+    def test_records_survive_pickling(self):
+        # Worker processes send their drops back pickled
+        drop = sortie_drop()
+
+        self.assertEqual(pickle.loads(pickle.dumps(drop)), drop)
@@ -0,0 +1,118 @@
+import asyncio
+import hashlib
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from services import fetch_data, snapshot_archive
+from services.snapshot_archive import SnapshotArchive
+
+PAGE = b'<h3 id="relicRewards">Relics:</h3><table></table>' * 100
+
+
+async def droptables(request):
+    return web.Response(body=PAGE)
+
+
+class FetchDataAsyncTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+        app = web.Application()
+        app.router.add_get("/droptables", droptables)
+        # Listens on a free port of 127.0.0.1
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        for name, value in (
+            ("FETCH_URL", str(self.server.make_url("/droptables"))),
+            ("HTML_FILE", self.tmp / "warframe_drops.html"),
+            ("FETCH_META_FILE", self.tmp / "fetch_meta.json"),
+            ("SnapshotArchive", lambda: SnapshotArchive(self.tmp / "archive")),
+        ):
+            patcher = mock.patch.object(fetch_data, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_snapshot_is_committed_off_the_event_loop(self):
+        commit = fetch_data._commit_snapshot
+        loop_thread = threading.current_thread()
+        threads = []
+        ticks = 0
+
+        def slow_commit(*args):
+            threads.append(threading.current_thread())
+            threading.Event().wait(0.2)
+            return commit(*args)
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        with mock.patch.object(fetch_data, "_commit_snapshot", slow_commit):
+            result = await fetch_data.fetch_data_async()
+        ticking.cancel()
+
+        self.assertEqual(result, (True, None, True))
+        self.assertIsNot(threads[0], loop_thread)
+        # The loop kept running while the snapshot was committed
+        self.assertGreater(ticks, 5)
+        self.assertEqual((self.tmp / "warframe_drops.html").read_bytes(), PAGE)
+
+
+class RestoreSnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.html_file = self.tmp / "warframe_drops.html"
+        self.archive = SnapshotArchive(self.tmp / "archive")
+
+        for module, name, value in (
+            (fetch_data, "HTML_FILE", self.html_file),
+            (fetch_data, "FETCH_META_FILE", self.tmp / "fetch_meta.json"),
+            (snapshot_archive, "HTML_FILE", self.html_file),
+        ):
+            patcher = mock.patch.object(module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # An older snapshot in the archive, a newer download on disk
+        self.old_id, _ = self.archive.store(PAGE)
+        self.html_file.write_bytes(PAGE * 2)
+        fetch_data._save_fetch_metadata(
+            {
+                "etag": '"newer"',
+                "last_modified": "Tue, 01 Sep 2026 00:00:00 GMT",
+                "sha256": hashlib.sha256(PAGE * 2).hexdigest(),
+            }
+        )
+
+    def test_restore_describes_the_restored_page(self):
+        self.archive.restore(self.old_id[:12], self.html_file)
+
+        metadata = fetch_data.load_fetch_metadata()
+        self.assertEqual(self.html_file.read_bytes(), PAGE)
+        self.assertEqual(fetch_data.get_snapshot_hash(), self.old_id)
+        # The next fetch downloads the page instead of getting a 304
+        self.assertEqual(fetch_data._conditional_headers(metadata), {})
+
+    def test_restore_elsewhere_keeps_the_metadata(self):
+        metadata = fetch_data.load_fetch_metadata()
+
+        self.archive.restore(self.old_id, self.tmp / "old.html")
+
+        self.assertEqual(fetch_data.load_fetch_metadata(), metadata)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Golden-output tests on a synthetic drop-table page
+
+Every way of parsing the page has to give exactly the drops and validation
+summary recorded in fixtures/golden_droptables.json. After a change that is
+meant to alter the output, regenerate it with:
+
+    python -m tests.test_golden --update
+"""
+
+import hashlib
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from benchmarks.droptable_generator import write_droptables
+from orchestrator import DropOrchestrator
+from parsers import html_backend
+from parsers.drop_records import expand_drops
+
+GOLDEN_FILE = Path(__file__).parent / "fixtures" / "golden_droptables.json"
+
+# About 270 KB, every section of the page
+SCALE = 0.05
+SEED = 0
+
+
+def summarize(orchestrator: DropOrchestrator) -> dict:
+    """Drop counts, a digest of every section's rows and the overall report"""
+    sections = {}
+    for report_key, drops in orchestrator.drops.items():
+        rows = sorted(
+            json.dumps(drop.copy(), sort_keys=True) for drop in expand_drops(drops)
+        )
+        sections[report_key] = hashlib.sha256("\n".join(rows).encode()).hexdigest()
+
+    return {
+        "drop_counts": orchestrator.drop_counts,
+        "sections": sections,
+        "overall": orchestrator.get_validation_report()["overall"],
+    }
+
+
+class GoldenOutputTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.page = Path(cls.tmp_dir.name) / "droptables.html"
+        write_droptables(cls.page, SCALE, SEED)
+
+        with open(GOLDEN_FILE, encoding="utf-8") as f:
+            cls.golden = json.load(f)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def parse(self, **kwargs) -> dict:
+        orchestrator = DropOrchestrator(html_file=self.page, **kwargs)
+        orchestrator.parse_all()
+
+        return summarize(orchestrator)
+
+    def assertGolden(self, summary: dict):
+        self.assertEqual(summary["drop_counts"], self.golden["drop_counts"])
+        self.assertEqual(summary["sections"], self.golden["sections"])
+        self.assertEqual(summary["overall"], self.golden["overall"])
+
+    def test_serial_parse(self):
+        summary = self.parse(workers=1)
+
+        self.assertGolden(summary)
+        # Both count table rows, relic rewards once per refinement
+        self.assertEqual(
+            summary["drop_counts"]["total_drops"], summary["overall"]["total_drops"]
+        )
+
+    def test_worker_pool(self):
+        self.assertGolden(self.parse(workers=4))
+
+    def test_html_backends(self):
+        for backend in ("html.parser", "lxml"):
+            if backend == "lxml" and html_backend.lxml is None:
+                continue
+            with self.subTest(backend=backend), mock.patch.object(
+                html_backend, "HTML_BACKEND", backend
+            ):
+                self.assertGolden(self.parse(workers=1))
+
+    def test_scanner(self):
+        with mock.patch.object(
+            html_backend, "HTML_BACKEND", "scanner"
+        ), mock.patch.object(html_backend, "tree_backend") as tree_backend:
+            summary = self.parse(workers=1)
+
+        self.assertGolden(summary)
+        # Every section of the generated page is read without a tree
+        tree_backend.assert_not_called()
+
+    def test_pipelined_parse(self):
+        markup = self.page.read_bytes()
+
+        # Chunk sizes that split sections, rows and tags at different places
+        for chunk_size in (1000, 65536):
+            with self.subTest(chunk_size=chunk_size):
+                orchestrator = DropOrchestrator(pipelined=True)
+                for start in range(0, len(markup), chunk_size):
+                    orchestrator.feed(markup[start : start + chunk_size])
+                orchestrator.close()
+                orchestrator.parse_all()
+
+                self.assertGolden(summarize(orchestrator))
+
+
+def update_golden():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        page = Path(tmp_dir) / "droptables.html"
+        write_droptables(page, SCALE, SEED)
+
+        # Recorded with the backend every install has
+        with mock.patch.object(html_backend, "HTML_BACKEND", "html.parser"):
+            orchestrator = DropOrchestrator(html_file=page, workers=1)
+            orchestrator.parse_all()
+
+    with open(GOLDEN_FILE, "w", encoding="utf-8") as f:
+        json.dump(summarize(orchestrator), f, indent=2)
+        f.write("\n")
+
+    print(f"Wrote {GOLDEN_FILE}")
+
+
+if __name__ == "__main__":
+    if "--update" in sys.argv:
+        update_golden()
+    else:
+        unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from orchestrator import DropOrchestrator
+from utils.helpers import repair_encoding
+
+
+class RepairEncodingTest(unittest.TestCase):
+    def test_mojibake_is_repaired(self):
+        data = "Höllvania".encode().decode("latin1").encode()
+
+        self.assertEqual(repair_encoding(data), "Höllvania".encode())
+
+    def test_invalid_bytes_next_to_mojibake_are_kept(self):
+        data = "HÃ¶llvania ".encode() + b"\xff"
+
+        self.assertEqual(repair_encoding(data), "Höllvania ".encode() + b"\xff")
+
+    def test_section_with_mojibake_and_invalid_bytes_parses(self):
+        markup = (
+            (
+                '<h3 id="sortieRewards">Sorties:</h3><table>'
+                '<tr><th colspan="2">Sortie</th></tr>'
+                "<tr><td>HÃ¶llvania \xff</td><td>Common (100.00%)</td></tr>"
+                "</table>"
+            )
+            .encode()
+            .replace("\xff".encode(), b"\xff")
+        )
+
+        orchestrator = DropOrchestrator(markup=markup, workers=1)
+        drops, _ = orchestrator.parse_all()
+
+        self.assertEqual([drop.item for drop in drops], ["Höllvania \ufffd"])
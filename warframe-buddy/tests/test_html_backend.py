@@ -0,0 +1,60 @@
+import unittest
+from unittest import mock
+
+from parsers import html_backend
+from parsers.html_backend import HTML_BACKENDS, lxml, tree_backend
+
+
+def page(rows):
+    return f'<h3 id="relicRewards">Relics:</h3><table>{rows}</table>'.encode()
+
+
+def table_rows(backend, markup):
+    return HTML_BACKENDS[backend](markup).find_table("relicRewards").rows
+
+
+class DecodingTest(unittest.TestCase):
+    def test_invalid_utf8_is_replaced(self):
+        markup = page("<tr><td>For{}ma</td></tr>").replace(b"{}", b"\xff")
+
+        for backend in HTML_BACKENDS:
+            if backend == "lxml" and lxml is None:
+                continue
+            with self.subTest(backend=backend):
+                rows = table_rows(backend, markup)
+
+                self.assertEqual(rows, [([], ["For\ufffdma"])])
+
+
+class UnclosedMarkupTest(unittest.TestCase):
+    """The scanner gives up on broken markup and returns the tree's rows"""
+
+    CASES = {
+        "unclosed cell": "<tr><td>Forma<td>Common (50.00%)</tr>",
+        "unclosed cell before a closed one": "<tr><td>Forma<td>Ash</td></tr>",
+        "unclosed row": "<tr><td>Forma</td><tr><td>Ash</td></tr>",
+        "unclosed last row": "<tr><td>Forma</td></tr><tr><td>Ash</td>",
+    }
+
+    def test_scanner_falls_back_to_the_tree_backend(self):
+        for case, rows in self.CASES.items():
+            with self.subTest(case=case):
+                with mock.patch.object(html_backend, "current_span") as span:
+                    scanned = table_rows("scanner", page(rows))
+
+                self.assertEqual(scanned, table_rows(tree_backend(), page(rows)))
+                span.return_value.set.assert_called_once_with(
+                    fallback=tree_backend(), fallback_reason=mock.ANY
+                )
+
+    @unittest.skipUnless(lxml, "lxml is not installed")
+    def test_lxml_splits_unclosed_cells(self):
+        rows = table_rows("lxml", page(self.CASES["unclosed cell"]))
+
+        self.assertEqual(rows, [([], ["Forma", "Common (50.00%)"])])
+
+    def test_html_parser_joins_unclosed_cells(self):
+        # html.parser nests the second <td> in the first, the texts run together
+        rows = table_rows("html.parser", page(self.CASES["unclosed cell"]))
+
+        self.assertEqual(rows, [([], ["FormaCommon (50.00%)"])])
@@ -0,0 +1,44 @@
+import json
+import unittest
+from pathlib import Path
+
+from orchestrator import DropOrchestrator
+from parsers.drop_records import expand_drops
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def table_rows(drops):
+    """Drops as comparable rows, relics expanded, order ignored"""
+    return sorted(
+        json.dumps(drop.copy(), sort_keys=True) for drop in expand_drops(drops)
+    )
+
+
+class JsonIngestionTest(unittest.TestCase):
+    """drops.json is droptables.html in the warframestat JSON format"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.html = DropOrchestrator(html_file=FIXTURES / "droptables.html", workers=1)
+        cls.html.parse_all()
+
+        cls.json = DropOrchestrator.from_json(FIXTURES / "drops.json")
+        cls.json.parse_all()
+
+    def test_drops_match_the_html_page(self):
+        for report_key, drops in self.html.drops.items():
+            with self.subTest(section=report_key):
+                self.assertEqual(
+                    table_rows(self.json.drops[report_key]), table_rows(drops)
+                )
+
+        self.assertEqual(self.json.drop_counts, self.html.drop_counts)
+
+    def test_validation_matches_the_html_page(self):
+        json_overall = self.json.get_validation_report()["overall"]
+        html_overall = self.html.get_validation_report()["overall"]
+
+        self.assertEqual(json_overall, html_overall)
+        self.assertEqual(json_overall["error_count"], 0)
+        self.assertEqual(json_overall["chance_sum_mismatches"], 0)
@@ -0,0 +1,162 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import config
+import orchestrator
+import search_engine
+from orchestrator import DropOrchestrator
+from search_engine import WarframeSearchEngine
+from services import fetch_data, rebuild_pipeline
+from services.rebuild_pipeline import RebuildPipeline
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+PATH_SETTINGS = (
+    "HTML_FILE",
+    "PARSED_DATA_FILE",
+    "PARSED_NDJSON_FILE",
+    "SECTION_CACHE_FILE",
+    "PIPELINE_DIR",
+    "PIPELINE_STATE_FILE",
+    "INDEXED_DATA_FILE",
+)
+
+
+@contextlib.contextmanager
+def data_dir(tmp_dir: Path):
+    """Point every file a rebuild reads or writes into tmp_dir"""
+    paths = {
+        getattr(config, name): tmp_dir
+        / getattr(config, name).relative_to(config.DATA_DIR)
+        for name in PATH_SETTINGS
+    }
+
+    with contextlib.ExitStack() as stack:
+        for module in (orchestrator, search_engine, rebuild_pipeline):
+            for name in PATH_SETTINGS:
+                if hasattr(module, name):
+                    new_path = paths[getattr(config, name)]
+                    stack.enter_context(mock.patch.object(module, name, new_path))
+
+        # Default arguments were bound to the real paths at import
+        for function in (
+            DropOrchestrator.__init__,
+            WarframeSearchEngine.save_indexes,
+            WarframeSearchEngine.load_indexes,
+        ):
+            defaults = tuple(
+                paths.get(value, value) if isinstance(value, Path) else value
+                for value in function.__defaults__
+            )
+            stack.enter_context(mock.patch.object(function, "__defaults__", defaults))
+
+        yield paths
+
+
+def exported(search_engine: WarframeSearchEngine) -> dict:
+    indexes = search_engine.export_indexes()["indexes"]
+    indexes["metadata"].pop("created_at")
+
+    return indexes
+
+
+class StreamingRebuildTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+        self.paths = self.enterContext(data_dir(self.tmp))
+        shutil.copy(FIXTURES / "droptables.html", self.paths[config.HTML_FILE])
+
+    def rebuild(self) -> RebuildPipeline:
+        messages = []
+        pipeline = RebuildPipeline(
+            fetch=False, streaming=True, on_message=messages.append
+        )
+
+        self.assertTrue(pipeline.run(), messages)
+        return pipeline
+
+    def reload(self) -> WarframeSearchEngine:
+        search_engine = WarframeSearchEngine()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(search_engine.rebuild_from_parsed_file())
+
+        return search_engine
+
+    def test_reload_reads_the_streamed_drops(self):
+        pipeline = self.rebuild()
+
+        self.assertFalse(self.paths[config.PARSED_DATA_FILE].exists())
+        self.assertEqual(
+            exported(self.reload()), exported(pipeline.load_search_engine())
+        )
+
+    def test_reload_ignores_an_older_json_file(self):
+        stale = self.paths[config.PARSED_DATA_FILE]
+        stale.write_text(json.dumps({"drops": []}), encoding="utf-8")
+        os.utime(stale, (0, 0))
+
+        pipeline = self.rebuild()
+
+        self.assertEqual(
+            exported(self.reload()), exported(pipeline.load_search_engine())
+        )
+
+
+class RebuildPipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+        self.paths = self.enterContext(data_dir(self.tmp))
+        self.page = (FIXTURES / "droptables.html").read_bytes()
+
+    def fake_fetch(self, on_chunk=None, **kwargs):
+        on_chunk(self.page)
+        return True, None, False
+
+    def test_save_parsed_is_asked_after_validation(self):
+        self.paths[config.HTML_FILE].write_bytes(self.page)
+        events = []
+
+        pipeline = RebuildPipeline(
+            fetch=False,
+            streaming=False,
+            save_parsed=lambda: events.append("asked") or True,
+            on_message=events.append,
+        )
+
+        self.assertTrue(pipeline.run())
+        asked = events.index("asked")
+        self.assertTrue(any("VALIDATION SUMMARY" in e for e in events[:asked]))
+        self.assertTrue(self.paths[config.PARSED_DATA_FILE].exists())
+
+    def test_parser_thread_stops_when_parse_is_up_to_date(self):
+        with mock.patch.object(
+            fetch_data, "fetch_data", self.fake_fetch
+        ), mock.patch.object(fetch_data, "get_snapshot_hash", return_value="page"):
+            for _ in range(2):
+                # Sections aren't reused, the download parses them again
+                self.paths[config.SECTION_CACHE_FILE].unlink(missing_ok=True)
+                messages = []
+                pipeline = RebuildPipeline(streaming=False, on_message=messages.append)
+
+                self.assertTrue(pipeline.run(), messages)
+
+        self.assertTrue(any("✓ Parse: up to date" in m for m in messages))
+        self.assertFalse(
+            [t for t in threading.enumerate() if t.name.startswith("drop-parser")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
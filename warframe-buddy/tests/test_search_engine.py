@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from orchestrator import DropOrchestrator
+from search_engine import WarframeSearchEngine
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def fixture_engine() -> WarframeSearchEngine:
+    orchestrator = DropOrchestrator(html_file=FIXTURES / "droptables.html", workers=1)
+    drops, _ = orchestrator.parse_all()
+
+    search_engine = WarframeSearchEngine()
+    search_engine.create_indexes_from_drops(drops, "fixture")
+
+    return search_engine
+
+
+class SaveIndexesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.search_engine = fixture_engine()
+
+    def test_same_indexes_are_saved_to_every_path(self):
+        first = self.tmp / "indexes.json"
+        backup = self.tmp / "backup.json"
+
+        self.search_engine.save_indexes(first)
+        response = self.search_engine.save_indexes(backup)
+
+        self.assertEqual(response, f'✓ Saved indexes to "{backup}"')
+        self.assertTrue(backup.exists())
+
+    def test_saving_again_to_the_same_path_is_skipped(self):
+        file_path = self.tmp / "indexes.json"
+        self.search_engine.save_indexes(file_path)
+
+        response = self.search_engine.save_indexes(file_path)
+
+        self.assertIn("already up to date", response)
+
+    def test_removed_index_file_is_written_again(self):
+        file_path = self.tmp / "indexes.json"
+        self.search_engine.save_indexes(file_path)
+        file_path.unlink()
+
+        self.search_engine.save_indexes(file_path)
+
+        self.assertTrue(file_path.exists())
+
+
+class RelicRewardsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.search_engine = fixture_engine()
+
+    def test_refinements_are_side_by_side(self):
+        (relic,) = self.search_engine.relic_rewards("Forma Blueprint")
+
+        self.assertEqual((relic.relic_tier, relic.relic_name), ("Lith", "B1"))
+        self.assertEqual(relic.chances, (0.5, None, None, 0.4))
+        self.assertEqual(
+            [(drop.relic_refinement, drop.chance) for drop in relic.expand()],
+            [("Intact", 0.5), ("Radiant", 0.4)],
+        )
+
+    def test_tier_filter(self):
+        self.assertEqual(
+            len(self.search_engine.relic_rewards("Forma Blueprint", "Lith")), 1
+        )
+        self.assertEqual(self.search_engine.relic_rewards("Forma Blueprint", "Axi"), [])
+
+    def test_unknown_item(self):
+        self.assertEqual(self.search_engine.relic_rewards("Not An Item"), [])
@@ -0,0 +1,99 @@
+import contextlib
+import io
+import unittest
+
+from orchestrator import DropOrchestrator
+from parsers.html_backend import parse_html
+from parsers.json_parser import JsonDropParser
+from parsers.relic_parser import RelicDropParser
+
+
+def relic_table(title, rows):
+    """<tr>s of one relic refinement table"""
+    cells = "".join(
+        f"<tr><td>{item}</td><td>{chance}</td></tr>" for item, chance in rows
+    )
+    return f"<tr><th colspan=2>{title}</th></tr>{cells}"
+
+
+def relic_page(*tables):
+    return (
+        '<h3 id="relicRewards">Relics:</h3><table>' + "".join(tables) + "</table>"
+    ).encode()
+
+
+HALF = "Common (50.00%)"
+
+
+class ChanceSumTest(unittest.TestCase):
+    def parse_relics(self, markup):
+        return RelicDropParser(parse_html(markup)).parse()
+
+    def test_adjacent_tables_with_the_same_key_are_summed_apart(self):
+        # The same relic listed twice in a row: two tables of 100% each, not
+        # one table of 200%
+        markup = relic_page(
+            relic_table("Lith A1 Relic (Intact)", [("Forma", HALF), ("Ash", HALF)]),
+            relic_table("Lith A1 Relic (Intact)", [("Forma", HALF), ("Ash", HALF)]),
+        )
+
+        _, report = self.parse_relics(markup)
+
+        self.assertNotIn("chance_sum_mismatch", report["counters"])
+        self.assertEqual(report["chance_sums"], [])
+
+    def test_json_relics_listed_twice_are_summed_apart(self):
+        rewards = [
+            {"itemName": "Forma", "rarity": "Common", "chance": 50},
+            {"itemName": "Ash", "rarity": "Common", "chance": 50},
+        ]
+        relic = {"tier": "Lith", "relicName": "A1", "state": "Intact"}
+        data = {"relics": [{**relic, "rewards": rewards}] * 2}
+
+        _, report = JsonDropParser(data).parse()["relicRewards"]
+
+        self.assertNotIn("chance_sum_mismatch", report["counters"])
+
+    def test_mismatch_is_reported_apart_from_warnings(self):
+        markup = relic_page(
+            relic_table("Lith A1 Relic (Intact)", [("Forma", HALF)]),
+            relic_table("Lith A2 Relic (Intact)", [("Forma", HALF), ("Ash", HALF)]),
+        )
+
+        _, report = self.parse_relics(markup)
+
+        self.assertEqual(report["counters"]["chance_sum_mismatch"], 1)
+        self.assertEqual(report["chance_sums"][0]["rows"], 1)
+        self.assertEqual(report["warnings"], [])
+        self.assertTrue(report["is_valid"])
+
+    def test_mismatches_dont_count_as_warnings(self):
+        markup = relic_page(relic_table("Lith A1 Relic (Intact)", [("Forma", HALF)]))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator = DropOrchestrator(markup=markup, workers=1)
+            orchestrator.parse_all()
+
+        overall = orchestrator.get_validation_report()["overall"]
+
+        self.assertEqual(overall["warning_count"], 0)
+        self.assertEqual(overall["chance_sum_mismatches"], 1)
+
+
+class SampleSizeTest(unittest.TestCase):
+    def test_every_row_is_counted_but_only_a_sample_is_kept(self):
+        rows = [(f"Item {i}", "Common") for i in range(5)]
+        markup = relic_page(relic_table("Lith A1 Relic (Intact)", rows))
+        parser = RelicDropParser(parse_html(markup))
+        drops, _ = parser.parse()
+
+        report = parser._verify_drops(drops, parser.drop_tables, sample_size=2)
+
+        self.assertEqual(report["error_counts"], {"Missing chance number": 5})
+        self.assertEqual(report["counters"]["chance_missing"], 5)
+        self.assertEqual([entry["index"] for entry in report["errors"]], [0, 1])
+        self.assertFalse(report["is_valid"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,40 @@
 import os
+import re
+
+# UTF-8 text that was decoded as latin1 somewhere upstream ("HÃ¶llvania" for
+# "Höllvania"), as UTF-8 bytes: a latin1 character that starts a UTF-8
+# sequence (U+00C2-U+00F4) followed by one that continues it (U+0080-U+00BF)
+MOJIBAKE_BYTES = re.compile(rb"\xc3[\x82-\xb4]\xc2[\x80-\xbf]")
+
+# Runs of latin1 characters that spell a complete UTF-8 sequence
+MOJIBAKE_PATTERN = re.compile(
+    "[\xc2-\xdf][\x80-\xbf]"
+    "|\xe0[\xa0-\xbf][\x80-\xbf]"
+    "|[\xe1-\xec\xee\xef][\x80-\xbf]{2}"
+    "|\xed[\x80-\x9f][\x80-\xbf]"
+    "|\xf0[\x90-\xbf][\x80-\xbf]{2}"
+    "|[\xf1-\xf3][\x80-\xbf]{3}"
+    "|\xf4[\x80-\x8f][\x80-\xbf]{2}"
+)
 
 
 def clear_screen():
     os.system("cls" if os.name == "nt" else "clear")
+
+
+def repair_encoding(data: bytes) -> bytes:
+    """
+    Undo latin1 mojibake in a whole UTF-8 document in one pass
+
+    Documents without any (the usual case) are returned as they are, without
+    being decoded. Bytes that aren't valid UTF-8 are kept unchanged.
+    """
+    if not MOJIBAKE_BYTES.search(data):
+        return data
+
+    text = MOJIBAKE_PATTERN.sub(
+        lambda match: match.group().encode("latin1").decode("utf-8"),
+        data.decode("utf-8", errors="surrogateescape"),
+    )
+
+    return text.encode("utf-8", errors="surrogateescape")
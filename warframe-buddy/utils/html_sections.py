@@ -0,0 +1,155 @@
+import mmap
+import os
+import re
+from pathlib import Path
+
+# Every drop table on the page starts with <h3 id="...">Title:</h3>
+SECTION_HEADER_PATTERN = re.compile(
+    rb"<h3\b[^>]*?\bid=[\"']?([^\"'\s>]+)(?=[\"'\s>])", re.I
+)
+
+# Longest header prefix that can still be incomplete at the end of a chunk
+MAX_HEADER_LENGTH = 256
+
+
+def find_sections(data) -> list[tuple[str | None, int, int]]:
+    """
+    Locate the sections of a drop-table document
+
+    Args:
+        data: Raw HTML as bytes (or any buffer, e.g. an mmap)
+
+    Returns:
+        List of (section_id, start, end) byte ranges covering the whole
+        document in order. The part before the first header has id None.
+    """
+    sections = []
+    section_id = None
+    start = 0
+
+    for match in SECTION_HEADER_PATTERN.finditer(data):
+        if match.start() > start or section_id is not None:
+            sections.append((section_id, start, match.start()))
+        section_id = match.group(1).decode("ascii", "replace")
+        start = match.start()
+
+    if len(data) > start or section_id is not None:
+        sections.append((section_id, start, len(data)))
+
+    return sections
+
+
+def split_sections(data: bytes) -> list[tuple[str | None, bytes]]:
+    """
+    Split drop-table HTML into (section_id, raw bytes) parts
+
+    Joining the parts back together gives the original document.
+    """
+    return [
+        (section_id, data[start:end]) for section_id, start, end in find_sections(data)
+    ]
+
+
+class SectionIndex:
+    """
+    Byte-offset index of the sections of a drop-table page
+
+    Maps every section id to its byte range, only the first section with an
+    id counts (like soup.find()). Pages opened from a file are memory-mapped,
+    so a section is only read when it is sliced.
+    """
+
+    def __init__(self, data):
+        """
+        Args:
+            data: Raw HTML as bytes (or any buffer, e.g. an mmap)
+        """
+        self.data = data
+        self.offsets: dict[str, tuple[int, int]] = {}
+
+        for section_id, start, end in find_sections(data):
+            if section_id is not None:
+                self.offsets.setdefault(section_id, (start, end))
+
+    @classmethod
+    def open(cls, file_path: str | Path) -> "SectionIndex":
+        """Index a page file without reading it into memory"""
+        with open(file_path, "rb") as f:
+            # Empty files can't be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls(b"")
+
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __contains__(self, section_id: str) -> bool:
+        return section_id in self.offsets
+
+    def __iter__(self):
+        """Section ids in document order"""
+        return iter(self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    def section(self, section_id: str) -> bytes:
+        """Raw bytes of one section (its <h3> header and table)"""
+        start, end = self.offsets[section_id]
+        return self.data[start:end]
+
+    def close(self) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+
+class SectionStream:
+    """
+    Incremental splitter for drop-table HTML arriving in chunks
+
+    feed() returns the sections completed by each chunk: a section is
+    complete as soon as the next <h3 id=...> header shows up. close()
+    returns the last one. The part before the first header is dropped.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.section_id = None
+        self.scanned = 0
+
+    def feed(self, chunk: bytes) -> list[tuple[str, bytes]]:
+        self.buffer += chunk
+        completed = []
+
+        while True:
+            # Rescan the tail, a header may have been split across chunks.
+            # The buffer starts with the open section's own header, skip it.
+            start = max(
+                self.scanned - MAX_HEADER_LENGTH, 0 if self.section_id is None else 1
+            )
+            match = SECTION_HEADER_PATTERN.search(self.buffer, start)
+
+            if not match:
+                self.scanned = len(self.buffer)
+                return completed
+
+            if self.section_id is not None:
+                completed.append((self.section_id, bytes(self.buffer[: match.start()])))
+
+            self.section_id = match.group(1).decode("ascii", "replace")
+            del self.buffer[: match.start()]
+            self.scanned = match.end() - match.start()
+
+    def close(self) -> list[tuple[str, bytes]]:
+        completed = []
+
+        if self.section_id is not None:
+            completed.append((self.section_id, bytes(self.buffer)))
+
+        self.buffer = bytearray()
+        self.section_id = None
+        self.scanned = 0
+
+        return completed
@@ -0,0 +1,88 @@
+"""
+Newline-delimited JSON: one record per line, written and read as a stream
+
+The first line holds a header (metadata such as the source hash), every
+following line is one record.
+"""
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+class NdjsonWriter:
+    """
+    Write records one at a time, the file only replaces the previous one
+    once the writer is closed without an error
+    """
+
+    def __init__(self, file_path: str | Path, header: dict | None = None, default=None):
+        """
+        Args:
+            default: json.dumps(default=...) hook for records that aren't
+                plain JSON types
+        """
+        self.file_path = Path(file_path)
+        self.header = header or {}
+        self.default = default
+
+        self.count = 0
+        self.bytes_written = 0
+        self._sha256 = hashlib.sha256()
+        self._tmp_path = Path(f"{self.file_path}.part")
+        self._file = None
+
+    def __enter__(self) -> "NdjsonWriter":
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp_path, "wb")
+        self._write_line(self.header)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._file.close()
+
+        if exc_type is None:
+            os.replace(self._tmp_path, self.file_path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+    @property
+    def sha256(self) -> str:
+        """Hash of everything written so far"""
+        return self._sha256.hexdigest()
+
+    def write(self, record: dict) -> None:
+        self._write_line(record)
+        self.count += 1
+
+    def _write_line(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=self.default)
+        line = line.encode("utf-8") + b"\n"
+
+        self._file.write(line)
+        self._sha256.update(line)
+        self.bytes_written += len(line)
+
+
+@contextmanager
+def open_ndjson(file_path: str | Path):
+    """
+    Read an NDJSON file lazily
+
+    Yields:
+        (header, records) - records is an iterator that reads one line at
+        a time while the file is open
+    """
+    with open(file_path, "rb") as f:
+        first_line = f.readline()
+        header = json.loads(first_line) if first_line.strip() else {}
+
+        def records() -> Iterator[dict]:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+        yield header, records()
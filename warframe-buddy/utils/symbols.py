@@ -0,0 +1,79 @@
+"""
+Dense integer IDs for the names repeated across drops
+
+Every item, planet, node, relic and bounty name is stored once per kind, the
+search indexes and the index file refer to it by its position.
+"""
+
+import sys
+
+# Drop field -> kind of symbol its value is
+FIELD_KINDS = {
+    "item": "items",
+    "planet_name": "planets",
+    "mission_name": "nodes",
+    "relic_name": "relics",
+    "bounty_name": "bounties",
+}
+
+SYMBOL_KINDS = tuple(FIELD_KINDS.values())
+
+
+class SymbolTable:
+    """Names of every kind, in the order they were first seen"""
+
+    def __init__(self, names: dict[str, list[str]] | None = None):
+        """
+        Args:
+            names: Kind -> names, as made by export() (None starts empty)
+        """
+        self.names = {kind: [] for kind in SYMBOL_KINDS}
+        self.ids = {kind: {} for kind in SYMBOL_KINDS}
+
+        for kind, kind_names in (names or {}).items():
+            for name in kind_names:
+                self.intern(kind, name)
+
+    def intern(self, kind: str, name: str) -> int:
+        """ID of a name, new names get the next ID"""
+        ids = self.ids[kind]
+
+        symbol_id = ids.get(name)
+        if symbol_id is None:
+            name = sys.intern(name)
+            symbol_id = ids[name] = len(ids)
+            self.names[kind].append(name)
+
+        return symbol_id
+
+    def get_id(self, kind: str, name: str) -> int | None:
+        """ID of a name, None if it was never seen"""
+        return self.ids[kind].get(name)
+
+    def encode_drop(self, drop: dict) -> dict:
+        """Copy of a drop with its names replaced by their IDs"""
+        encoded = drop.copy()
+
+        for field, kind in FIELD_KINDS.items():
+            value = encoded.get(field)
+            if isinstance(value, str):
+                encoded[field] = self.intern(kind, value)
+
+        return encoded
+
+    def decode_drop(self, drop: dict) -> dict:
+        """
+        Inverse of encode_drop, in place. Names and the other strings are
+        shared with every drop holding the same value.
+        """
+        for field, value in drop.items():
+            if isinstance(value, int) and field in FIELD_KINDS:
+                drop[field] = self.names[FIELD_KINDS[field]][value]
+            elif isinstance(value, str):
+                drop[field] = sys.intern(value)
+
+        return drop
+
+    def export(self) -> dict[str, list[str]]:
+        """Kind -> names, JSON-serializable"""
+        return self.names
@@ -0,0 +1,190 @@
+"""
+Lightweight tracing for the rebuild pipeline
+
+Nested spans are collected in memory and exported as a Chrome trace file
+(open it in chrome://tracing or https://ui.perfetto.dev). Disabled by
+default, every span is then a no-op.
+
+Every span records the change of this process's resident memory over it
+(rss_delta_kb, Linux only) and the process's high-water mark when it ended
+(process_peak_rss_kb, which never goes down). Only spans of this process
+are collected: sections parsed in worker processes (PARSE_WORKERS > 1)
+show up as the single parse_parallel span that waits for them.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from config import TRACE_FILE, TRACING
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_enabled = TRACING
+_events = []
+_lock = threading.Lock()
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):  # Windows
+    _PAGE_SIZE = 4096
+
+
+class Span:
+    """A timed operation, attributes end up in the trace event's args"""
+
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+        self.parent = _current_span.get()
+        self.start_rss_kb = _current_rss_kb()
+        self.start_ns = time.perf_counter_ns()
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+    def add(self, key: str, amount: int = 1) -> None:
+        """Increment a counter attribute, e.g. rows processed"""
+        self.attrs[key] = self.attrs.get(key, 0) + amount
+
+    def end(self) -> None:
+        end_ns = time.perf_counter_ns()
+
+        end_rss_kb = _current_rss_kb()
+        if end_rss_kb is not None and self.start_rss_kb is not None:
+            self.attrs["rss_kb"] = end_rss_kb
+            self.attrs["rss_delta_kb"] = end_rss_kb - self.start_rss_kb
+
+        peak_rss_kb = _peak_rss_kb()
+        if peak_rss_kb is not None:
+            self.attrs["process_peak_rss_kb"] = peak_rss_kb
+
+        event = {
+            "name": self.name,
+            "cat": self.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": self.start_ns / 1000,
+            "dur": (end_ns - self.start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": {
+                "parent": self.parent.name if self.parent else None,
+                **self.attrs,
+            },
+        }
+
+        with _lock:
+            _events.append(event)
+
+
+class _NoopSpan:
+    """Stand-in while tracing is disabled"""
+
+    def set(self, **attrs) -> None:
+        pass
+
+    def add(self, key: str, amount: int = 1) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def start_span(name: str, **attrs) -> Span | _NoopSpan:
+    """
+    Start a span that is ended manually with span.end()
+
+    Unlike span(), it doesn't become the parent of spans opened meanwhile.
+    """
+    if not _enabled:
+        return NOOP_SPAN
+
+    return Span(name, attrs)
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Time the enclosed block, spans opened inside it are its children"""
+    if not _enabled:
+        yield NOOP_SPAN
+        return
+
+    current = Span(name, attrs)
+    token = _current_span.set(current)
+
+    try:
+        yield current
+    except BaseException as e:
+        current.set(error=repr(e))
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end()
+
+
+def current_span() -> Span | _NoopSpan:
+    return _current_span.get() or NOOP_SPAN
+
+
+def export(file_path: str | Path = TRACE_FILE) -> str:
+    """Write the spans collected so far to a Chrome trace file and clear them"""
+    global _events
+
+    with _lock:
+        events, _events = _events, []
+
+    trace = {
+        "traceEvents": sorted(events, key=lambda event: event["ts"]),
+        "displayTimeUnit": "ms",
+    }
+
+    try:
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(trace))
+    except OSError as e:
+        return f"✗ Failed to save trace: {e}"
+
+    return f'✓ Saved {len(events)} trace spans to "{file_path}"'
+
+
+def _current_rss_kb() -> int | None:
+    """Resident memory of this process right now, None without /proc"""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+
+    return resident_pages * _PAGE_SIZE // 1024
+
+
+def _peak_rss_kb() -> int | None:
+    """Peak resident memory of this process so far, not of the span"""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, in kilobytes elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak